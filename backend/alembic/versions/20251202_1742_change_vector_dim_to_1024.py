@@ -21,6 +21,51 @@ down_revision: Union[str, None] = "826ddedd5b20"
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# LightRAG tables (workspace: BODA) - created by LightRAG with __vector__ columns
+LIGHTRAG_VECTOR_TABLES = ("BODA_chunks", "BODA_entities", "BODA_relationships")
+
+
+def _change_vector_dim_sql(dim: int) -> str:
+    """
+    모든 벡터 컬럼의 차원을 바꾸는 단일 DO 블록.
+
+    pg_tables는 한 번만 조회하고, 존재하는 LightRAG 테이블만 변경합니다.
+    재생성한 컬럼에는 코사인 kNN 검색용 HNSW 인덱스를 함께 생성합니다
+    (컬럼 삭제 시 기존 인덱스도 함께 삭제됨).
+    """
+    table_names = ", ".join(f"'{name.lower()}'" for name in LIGHTRAG_VECTOR_TABLES)
+    return f"""
+        DO $$
+        DECLARE
+            tbl text;
+        BEGIN
+            -- HNSW 인덱스 빌드 속도 (이 트랜잭션에만 적용)
+            SET LOCAL maintenance_work_mem = '1GB';
+
+            -- 1. Our application's entities table
+            ALTER TABLE entities DROP COLUMN IF EXISTS embedding;
+            ALTER TABLE entities ADD COLUMN IF NOT EXISTS embedding vector({dim});
+            CREATE INDEX IF NOT EXISTS entities_embedding_hnsw ON entities
+                USING hnsw (embedding vector_cosine_ops) WITH (m = 16, ef_construction = 64);
+
+            -- 2. LightRAG tables (drop and recreate vector column with new dimension)
+            FOR tbl IN
+                SELECT tablename FROM pg_tables
+                WHERE schemaname = current_schema()
+                  AND lower(tablename) IN ({table_names})
+            LOOP
+                EXECUTE format('ALTER TABLE %I DROP COLUMN IF EXISTS "__vector__"', tbl);
+                EXECUTE format('ALTER TABLE %I ADD COLUMN IF NOT EXISTS "__vector__" vector({dim})', tbl);
+                EXECUTE format(
+                    'CREATE INDEX IF NOT EXISTS %I ON %I '
+                    'USING hnsw ("__vector__" vector_cosine_ops) WITH (m = 16, ef_construction = 64)',
+                    lower(tbl) || '_vector_hnsw', tbl
+                );
+            END LOOP;
+        END
+        $$;
+    """
+
 
 def upgrade() -> None:
     """
@@ -32,54 +77,9 @@ def upgrade() -> None:
     - BODA_entities.__vector__ (LightRAG)
     - BODA_relationships.__vector__ (LightRAG)
     """
-    # 1. Our application's entities table
-    op.execute("ALTER TABLE entities DROP COLUMN IF EXISTS embedding")
-    op.execute("ALTER TABLE entities ADD COLUMN embedding vector(1024)")
-
-    # 2. LightRAG tables (workspace: BODA)
-    # These tables are created by LightRAG with __vector__ columns
-    lightrag_tables = [
-        '"BODA_chunks"',
-        '"BODA_entities"',
-        '"BODA_relationships"',
-    ]
-
-    for table in lightrag_tables:
-        # Check if table exists before altering
-        op.execute(f"""
-            DO $$
-            BEGIN
-                IF EXISTS (SELECT FROM pg_tables WHERE tablename = {table.replace('"', "'")} OR tablename = LOWER({table.replace('"', "'")})) THEN
-                    -- Drop and recreate vector column with new dimension
-                    EXECUTE 'ALTER TABLE ' || {table} || ' DROP COLUMN IF EXISTS "__vector__"';
-                    EXECUTE 'ALTER TABLE ' || {table} || ' ADD COLUMN "__vector__" vector(1024)';
-                END IF;
-            END
-            $$;
-        """)
+    op.execute(_change_vector_dim_sql(1024))
 
 
 def downgrade() -> None:
     """Revert all vector columns to 1536 dimensions (Titan Embed v1)."""
-    # 1. Our application's entities table
-    op.execute("ALTER TABLE entities DROP COLUMN IF EXISTS embedding")
-    op.execute("ALTER TABLE entities ADD COLUMN embedding vector(1536)")
-
-    # 2. LightRAG tables
-    lightrag_tables = [
-        '"BODA_chunks"',
-        '"BODA_entities"',
-        '"BODA_relationships"',
-    ]
-
-    for table in lightrag_tables:
-        op.execute(f"""
-            DO $$
-            BEGIN
-                IF EXISTS (SELECT FROM pg_tables WHERE tablename = {table.replace('"', "'")} OR tablename = LOWER({table.replace('"', "'")})) THEN
-                    EXECUTE 'ALTER TABLE ' || {table} || ' DROP COLUMN IF EXISTS "__vector__"';
-                    EXECUTE 'ALTER TABLE ' || {table} || ' ADD COLUMN "__vector__" vector(1536)';
-                END IF;
-            END
-            $$;
-        """)
+    op.execute(_change_vector_dim_sql(1536))
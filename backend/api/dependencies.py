@@ -4,7 +4,8 @@ Dependency helpers for retrieving services stored on the FastAPI application sta
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 from fastapi import Request
 
@@ -17,32 +18,46 @@ if TYPE_CHECKING:
     from services.user_service import UserService
 
 
-def _get_service(request: Request, attr: str) -> Any:
-    service = getattr(request.app.state, attr, None)
-    if service is None:
-        raise RuntimeError(f"{attr} is not initialised on application state.")
-    return service
+@dataclass(frozen=True, slots=True)
+class Services:
+    """
+    애플리케이션 서비스 묶음.
 
+    lifespan 시작 시 한 번 생성해 app.state.services에 저장하므로,
+    요청마다 getattr/None 검사 없이 속성 접근만으로 서비스를 가져옵니다.
+    """
 
-def get_rag_service(request: Request) -> RAGService:
-    return _get_service(request, "rag_service")
+    ai_service: AIService
+    data_service: DataService
+    lightrag_service: LightRAGService
+    rag_service: RAGService
+    user_service: UserService
+    citydata_service: SeoulCityDataService | None = None
 
 
-def get_ai_service(request: Request) -> AIService:
-    return _get_service(request, "ai_service")
+# 아래 getter는 await 없이 속성만 읽지만 async def로 둡니다.
+# FastAPI는 sync 의존성을 스레드풀에서 실행하므로, async여야 이벤트 루프에서 바로 호출됩니다.
 
 
-def get_user_service(request: Request) -> UserService:
-    return _get_service(request, "user_service")
+async def get_rag_service(request: Request) -> RAGService:
+    return request.app.state.services.rag_service
 
 
-def get_lightrag_service(request: Request) -> LightRAGService:
-    return _get_service(request, "lightrag_service")
+async def get_ai_service(request: Request) -> AIService:
+    return request.app.state.services.ai_service
 
 
-def get_data_service(request: Request) -> DataService:
-    return _get_service(request, "data_service")
+async def get_user_service(request: Request) -> UserService:
+    return request.app.state.services.user_service
 
 
-def get_citydata_service(request: Request) -> SeoulCityDataService | None:
-    return getattr(request.app.state, "citydata_service", None)
+async def get_lightrag_service(request: Request) -> LightRAGService:
+    return request.app.state.services.lightrag_service
+
+
+async def get_data_service(request: Request) -> DataService:
+    return request.app.state.services.data_service
+
+
+async def get_citydata_service(request: Request) -> SeoulCityDataService | None:
+    return request.app.state.services.citydata_service
@@ -5,45 +5,105 @@ Simplified for local development: no fallback paths or defensive validation.
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import logging
 from contextlib import asynccontextmanager
-from typing import Any
+from typing import TYPE_CHECKING
 
-import uvicorn
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+import httpx
+import orjson
+from fastapi import FastAPI, Request
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
+from redis.exceptions import RedisError
 
-from api.routers import admin, chat, citydata, health, policies, properties, users
+from api.dependencies import Services
+from api.middleware.caching import CacheMiddleware
+from api.middleware.cors import CORSMiddleware
+from api.routers import chat, citydata, health, policies, properties, users
 from core.cache import cleanup_cache, initialize_cache
 from core.config import get_environment_config, settings
-from services.ai_service import AIService
-from services.data_service import DataService
-from services.lightrag_service import LightRAGService
-from services.rag_service import RAGService
-from services.seoul_city_data_service import SeoulCityDataService
-from services.user_service import UserService
-
-logging.basicConfig(
-    level=getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+from core.logging_config import setup_logging
+from database.session import close_db, get_engine
+
+if TYPE_CHECKING:
+    from services.lightrag_service import LightRAGService
+
+setup_logging(settings.LOG_LEVEL, json=settings.LOG_JSON)
 logger = logging.getLogger(__name__)
 
 
+async def _load_sample_data(lightrag_service: LightRAGService) -> None:
+    from scripts.load_data import load_sample_data
+
+    await load_sample_data(lightrag_service)
+
+
+def _on_sample_load_done(app: FastAPI, task: asyncio.Task[None]) -> None:
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        logger.error("샘플 데이터 로딩 실패: %s", exc)
+        return
+    app.state.sample_data_ready = True
+    logger.info("샘플 데이터 로딩 완료")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    await initialize_cache()
+    # 서비스 모듈(boto3, anthropic, LightRAG 등)은 무거우므로 import 시점이 아닌 시작 시 로드
+    from services.ai_service import AIService  # noqa: PLC0415
+    from services.data_service import DataService  # noqa: PLC0415
+    from services.lightrag_service import LightRAGService  # noqa: PLC0415
+    from services.rag_service import RAGService  # noqa: PLC0415
+    from services.seoul_city_data_service import SeoulCityDataService  # noqa: PLC0415
+    from services.user_service import UserService  # noqa: PLC0415
 
-    # Initialize AI service
-    ai_service = AIService()
-    await ai_service.initialize()
+    # 외부 HTTP 호출용 공용 클라이언트 (프로세스당 커넥션 풀 하나로 TLS/DNS 재사용)
+    # Anthropic SDK는 요청마다 자체 timeout을 지정하므로 여기 timeout은 서울시 API 등에만 적용됨
+    http_client = httpx.AsyncClient(
+        timeout=httpx.Timeout(10.0, connect=5.0),
+        limits=httpx.Limits(
+            max_connections=settings.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=75,
+        ),
+    )
+    app.state.http_client = http_client
 
-    # Initialize LightRAG service (unified RAG with NanoVectorDB)
+    ai_service = AIService(http_client=http_client)
     lightrag_service = LightRAGService(ai_service=ai_service)
-    await lightrag_service.initialize()
+
+    # 애플리케이션 PostgreSQL 엔진 (워커당 풀 하나, 크기는 워커 수 기준으로 산정)
+    app.state.db_engine = get_engine() if settings.DATABASE_URL else None
+    city_data_service = SeoulCityDataService(http_client=http_client)
+
+    async def _initialize_rag_stack() -> None:
+        # LightRAG는 AIService(LLM/임베딩 함수)에 의존하므로 순서대로 초기화
+        await ai_service.initialize()
+        await lightrag_service.initialize()
+
+    # 서로 독립적인 외부 리소스(Redis, Bedrock/LightRAG, 서울시 API)는 동시에 초기화
+    cache_result, rag_result, city_result = await asyncio.gather(
+        initialize_cache(),
+        _initialize_rag_stack(),
+        city_data_service.initialize(),
+        return_exceptions=True,
+    )
+    # RAG 스택은 필수이므로 실패 시 기동 중단, 나머지는 기능 저하 상태로 계속 진행
+    if isinstance(rag_result, BaseException):
+        raise rag_result
+    if isinstance(cache_result, Exception):
+        logger.error("Cache initialization failed; will retry lazily: %s", cache_result)
+    if isinstance(city_result, Exception):
+        logger.error("City data service initialization failed; endpoints disabled: %s", city_result)
+        city_data_service = None
 
     # Check if LightRAG is empty and optionally load sample data
+    app.state.sample_data_ready = True
+    sample_load_task: asyncio.Task[None] | None = None
     if lightrag_service.is_empty():
         logger.warning("LightRAG 스토리지가 비어 있습니다")
         logger.warning("샘플 데이터를 로드하려면: uv run python -m scripts.load_data --mode sample")
@@ -54,22 +114,30 @@ async def lifespan(app: FastAPI):
             settings, "AUTO_LOAD_SAMPLE_DATA", False
         )
         if auto_load:
-            logger.info("개발 환경: 샘플 데이터 자동 로딩 중...")
-            try:
-                from scripts.load_data import load_sample_data
+            # 임베딩/저장이 끝날 때까지 포트가 열리지 않도록 막지 않고 백그라운드에서 로딩
+            logger.info("개발 환경: 샘플 데이터 백그라운드 로딩 시작...")
+            app.state.sample_data_ready = False
+            sample_load_task = asyncio.create_task(_load_sample_data(lightrag_service))
+            sample_load_task.add_done_callback(lambda task: _on_sample_load_done(app, task))
+    app.state.sample_load_task = sample_load_task
+
+    # 관리자 작업 상태 API용 Celery 결과 캐시 (keyspace 알림 구독, 실패 시 백엔드 직접 조회로 동작)
+    job_status_watcher = None
+    if settings.ADMIN_API_ENABLED:
+        from jobs.status import JobStatusWatcher  # noqa: PLC0415
 
-                await load_sample_data(lightrag_service)
-                logger.info("샘플 데이터 로딩 완료")
-            except Exception as e:
-                logger.error(f"샘플 데이터 로딩 실패: {e}")
+        job_status_watcher = JobStatusWatcher(settings.REDIS_URL, password=settings.REDIS_PASSWORD)
+        try:
+            await job_status_watcher.start()
+        except (RedisError, OSError) as exc:
+            logger.warning("Job status watcher disabled: %s", exc)
+            job_status_watcher = None
+    app.state.job_status_watcher = job_status_watcher
 
     # Initialize other services
     data_service = DataService()
     user_service = UserService()
 
-    city_data_service = SeoulCityDataService()
-    await city_data_service.initialize()
-
     # Initialize RAG service with LightRAG only
     rag_service = RAGService(
         ai_service=ai_service,
@@ -78,70 +146,139 @@ async def lifespan(app: FastAPI):
     )
 
     # Store services in app state
-    app.state.ai_service = ai_service
-    app.state.data_service = data_service
-    app.state.lightrag_service = lightrag_service
-    app.state.rag_service = rag_service
-    app.state.user_service = user_service
-    app.state.citydata_service = city_data_service
+    app.state.services = Services(
+        ai_service=ai_service,
+        data_service=data_service,
+        lightrag_service=lightrag_service,
+        rag_service=rag_service,
+        user_service=user_service,
+        citydata_service=city_data_service,
+    )
 
     logger.info("Application services initialized (using LightRAG with NanoVectorDB)")
 
+    # 라우트는 import 시 모두 등록되므로 첫 /openapi.json 요청 대신 기동 시 스키마를 생성/직렬화
+    if _DEBUG:
+        app.state.openapi_bytes = orjson.dumps(app.openapi())
+
+    async def _close_rag_stack() -> None:
+        # 초기화의 역순: 대화 저장 마무리, LightRAG 종료 후 AIService 종료
+        await rag_service.drain_writes()
+        await lightrag_service.finalize()
+        await ai_service.close()
+
     try:
         yield
     finally:
-        await ai_service.close()
-        await lightrag_service.finalize()
-        await city_data_service.close()
+        if sample_load_task is not None and not sample_load_task.done():
+            sample_load_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await sample_load_task
+
+        closers = [_close_rag_stack()]
+        if city_data_service is not None:
+            closers.append(city_data_service.close())
+        if job_status_watcher is not None:
+            closers.append(job_status_watcher.stop())
+        results = await asyncio.gather(*closers, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("Service shutdown failed", exc_info=result)
+        await http_client.aclose()
+        if app.state.db_engine is not None:
+            await close_db()
         await cleanup_cache()
 
 
+# 설정값은 프로세스 동안 바뀌지 않으므로 모듈 상수로 한 번만 읽음
+_V1 = settings.API_V1_STR
+_DEBUG = settings.DEBUG
+_APP_NAME = settings.APP_NAME
+_APP_VERSION = settings.APP_VERSION
+
 app = FastAPI(
-    title=settings.APP_NAME,
+    title=_APP_NAME,
     description="Korean Real Estate RAG AI Chatbot",
-    version=settings.APP_VERSION,
-    docs_url="/docs" if settings.DEBUG else None,
-    redoc_url="/redoc" if settings.DEBUG else None,
-    openapi_url="/openapi.json" if settings.DEBUG else None,
+    version=_APP_VERSION,
+    # 문서 라우트는 아래에서 직접 등록 (OpenAPI 스키마를 직렬화된 bytes로 캐시)
+    docs_url=None,
+    redoc_url=None,
+    openapi_url=None,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
+if settings.RESPONSE_CACHE_ENABLED:
+    # 라우터 바로 앞(가장 안쪽)에서 캐시 적중 시 즉시 응답.
+    # GZip보다 안쪽이어야 압축 전 JSON 본문을, CORS보다 안쪽이어야 origin별 헤더 없이 저장됨
+    # 새 라우트가 실수로 캐시되지 않도록 읽기 전용 목록(정책/매물·시군구 지역)만 명시적으로 캐시
+    # (도시 데이터는 서비스에서 45초만 재사용하므로 제외)
+    app.add_middleware(
+        CacheMiddleware,
+        ttl=settings.RESPONSE_CACHE_TTL,
+        generation_check_interval=settings.KNOWLEDGE_GENERATION_CHECK_INTERVAL,
+        cache_paths=(
+            f"{_V1}/policies",
+            f"{_V1}/properties",
+        ),
+    )
+
+# 매물/정책/도시 데이터 목록 등 큰 JSON 응답 압축 (작은 응답은 압축 비용이 더 큼)
+# add_middleware는 나중에 추가한 것이 바깥을 감싸므로 CORS/TrustedHost보다 안쪽에서 동작
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.BACKEND_CORS_ORIGINS or ["*"],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=settings.CORS_ALLOW_METHODS,
+    allow_headers=settings.CORS_ALLOW_HEADERS,
+    max_age=settings.CORS_MAX_AGE,
 )
 
-app.include_router(chat.router, prefix=f"{settings.API_V1_STR}/chat", tags=["Chat"])
-app.include_router(health.router, prefix=f"{settings.API_V1_STR}/health", tags=["Health"])
-app.include_router(citydata.router, prefix=f"{settings.API_V1_STR}/citydata", tags=["City Data"])
-app.include_router(policies.router, prefix=f"{settings.API_V1_STR}/policies", tags=["Policies"])
-app.include_router(
-    properties.router, prefix=f"{settings.API_V1_STR}/properties", tags=["Properties"]
+# 미들웨어는 요청마다 ASGI 계층을 하나 더 거치므로 설정된 경우에만 추가
+if settings.ALLOWED_HOSTS:
+    from starlette.middleware.trustedhost import TrustedHostMiddleware
+
+    app.add_middleware(TrustedHostMiddleware, allowed_hosts=settings.ALLOWED_HOSTS)
+
+# (router, prefix, tag, include_in_schema) - 모든 API 라우터 등록을 한 곳에서
+# 헬스체크/관리자 API는 문서화 대상이 아니므로 OpenAPI 스키마에서 제외
+_ROUTERS = (
+    (chat.router, "/chat", "Chat", True),
+    (health.router, "/health", "Health", False),
+    (citydata.router, "/citydata", "City Data", True),
+    (policies.router, "/policies", "Policies", True),
+    (properties.router, "/properties", "Properties", True),
+    (users.router, "/users", "Users", True),
 )
-app.include_router(users.router, prefix=f"{settings.API_V1_STR}/users", tags=["Users"])
-app.include_router(admin.router, prefix=f"{settings.API_V1_STR}/admin", tags=["Admin"])
+for _router, _prefix, _tag, _in_schema in _ROUTERS:
+    app.include_router(_router, prefix=f"{_V1}{_prefix}", tags=[_tag], include_in_schema=_in_schema)
+
+if settings.ADMIN_API_ENABLED:
+    from api.routers import admin
 
+    app.include_router(admin.router, prefix=f"{_V1}/admin", tags=["Admin"], include_in_schema=False)
 
-@app.get("/", response_model=dict[str, Any])
-async def root() -> dict[str, Any]:
-    return {
+
+# settings에서만 파생되는 고정 응답이므로 임포트 시 한 번만 직렬화
+_STATIC_CACHE_HEADERS = {"Cache-Control": "public, max-age=300"}
+
+_ROOT_BODY = orjson.dumps(
+    {
         "message": "Welcome to the Korean Real Estate RAG AI Chatbot API",
-        "name": settings.APP_NAME,
-        "version": settings.APP_VERSION,
-        "docs": "/docs" if settings.DEBUG else None,
-        "health": f"{settings.API_V1_STR}/health",
+        "name": _APP_NAME,
+        "version": _APP_VERSION,
+        "docs": "/docs" if _DEBUG else None,
+        "health": f"{_V1}/health",
         "environment": settings.ENVIRONMENT,
     }
+)
 
-
-@app.get(f"{settings.API_V1_STR}/info", response_model=dict[str, Any])
-async def api_info() -> dict[str, Any]:
-    return {
-        "name": settings.APP_NAME,
-        "version": settings.APP_VERSION,
+_INFO_BODY = orjson.dumps(
+    {
+        "name": _APP_NAME,
+        "version": _APP_VERSION,
         "features": [
             "AI real estate chat",
             "Property recommendations",
@@ -149,24 +286,100 @@ async def api_info() -> dict[str, Any]:
             "Vector similarity search",
         ],
     }
+)
+
+
+@app.get("/")
+async def root() -> Response:
+    return Response(_ROOT_BODY, media_type="application/json", headers=_STATIC_CACHE_HEADERS)
+
+
+@app.get(f"{_V1}/info", include_in_schema=settings.ENVIRONMENT != "production")
+async def api_info() -> Response:
+    return Response(_INFO_BODY, media_type="application/json", headers=_STATIC_CACHE_HEADERS)
+
+
+if _DEBUG:
+    from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html
+
+    _OPENAPI_URL = "/openapi.json"
+    _OPENAPI_CACHE_HEADERS = {"Cache-Control": "public, max-age=3600"}
+
+    @app.get(_OPENAPI_URL, include_in_schema=False)
+    async def openapi_json(request: Request) -> Response:
+        # lifespan에서 미리 직렬화해 둔 스키마
+        return Response(
+            request.app.state.openapi_bytes,
+            media_type="application/json",
+            headers=_OPENAPI_CACHE_HEADERS,
+        )
+
+    @app.get("/docs", include_in_schema=False)
+    async def swagger_ui() -> Response:
+        return get_swagger_ui_html(openapi_url=_OPENAPI_URL, title=f"{_APP_NAME} - Swagger UI")
+
+    @app.get("/redoc", include_in_schema=False)
+    async def redoc() -> Response:
+        return get_redoc_html(openapi_url=_OPENAPI_URL, title=f"{_APP_NAME} - ReDoc")
+
+
+# 오류 응답 본문은 고정값이므로 미리 직렬화 (오류가 몰릴 때 요청마다 인코딩하지 않도록)
+_GATEWAY_TIMEOUT_BODY = orjson.dumps({"error": "Gateway Timeout"})
+_INTERNAL_ERROR_BODY = orjson.dumps({"error": "Internal Server Error"})
+
+
+@app.exception_handler(TimeoutError)
+async def timeout_exception_handler(request: Request, exc: TimeoutError) -> Response:
+    # 업스트림(Bedrock, LightRAG 등) 타임아웃은 예상 가능한 오류이므로 traceback 없이 기록
+    logger.warning("Upstream timeout on %s %s: %s", request.method, request.url.path, exc)
+    return Response(_GATEWAY_TIMEOUT_BODY, status_code=504, media_type="application/json")
 
 
 @app.exception_handler(Exception)
-async def unhandled_exception_handler(_request, exc):  # pragma: no cover - simple dev handler
-    logger.exception("Unhandled exception", exc_info=exc)
-    return JSONResponse(
-        status_code=500,
-        content={"error": "Internal Server Error", "detail": str(exc)},
+async def unhandled_exception_handler(request: Request, exc: Exception) -> Response:
+    # 오류가 몰릴 때 traceback이 로그를 채우지 않도록 전체 traceback은 DEBUG에서만 기록
+    # (traceback 포맷팅은 로깅 리스너 스레드에서 수행됨, core.logging_config)
+    logger.error(
+        "Unhandled %s on %s %s: %s",
+        type(exc).__name__,
+        request.method,
+        request.url.path,
+        exc,
+        exc_info=exc if _DEBUG else None,
     )
+    return Response(_INTERNAL_ERROR_BODY, status_code=500, media_type="application/json")
 
 
 if __name__ == "__main__":
     config = get_environment_config()
-    uvicorn.run(
-        "backend.api.main:app",
-        host=config["host"],
-        port=config["port"],
-        reload=config["reload"],
-        log_level=config["log_level"],
-        workers=config["workers"],
-    )
+
+    if settings.ASGI_SERVER == "granian":
+        from granian import Granian
+        from granian.constants import Interfaces, Loops
+
+        Granian(
+            "api.main:app",
+            address=config["host"],
+            port=config["port"],
+            interface=Interfaces.ASGI,
+            workers=config["workers"],
+            loop=Loops.uvloop,
+            backlog=4096,
+            reload=config["reload"],
+        ).serve()
+    else:
+        import uvicorn
+
+        uvicorn.run(
+            "api.main:app",
+            host=config["host"],
+            port=config["port"],
+            reload=config["reload"],
+            log_level=config["log_level"],
+            workers=config["workers"],
+            loop="uvloop",
+            http="httptools",
+            access_log=settings.ACCESS_LOG,
+            proxy_headers=True,
+            forwarded_allow_ips=settings.FORWARDED_ALLOW_IPS,
+        )
@@ -0,0 +1,201 @@
+"""
+Redis 기반 GET 응답 캐시 미들웨어.
+
+매물/정책/도시 데이터처럼 읽기 위주인 GET 응답을 (status, headers, body) 그대로 Redis에 저장해,
+캐시 적중 시 라우터/서비스/DB 호출 없이 바로 응답합니다.
+
+BaseHTTPMiddleware는 요청마다 태스크 그룹과 본문 중계 스트림을 만들기 때문에,
+ASGI send를 감싸 캐시 대상이 아닌 응답(SSE 등)은 그대로 흘려보내는 순수 ASGI로 구현합니다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import time
+from collections.abc import Sequence
+
+import orjson
+from redis.exceptions import RedisError
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.cache import get_knowledge_generation, get_redis_client
+
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = "resp:v2:"  # 저장 형식: [status, headers, body, etag], 키: resp:v2:{세대}:{해시}
+_HIT_HEADER = (b"x-cache", b"HIT")
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match 약한 비교 (쉼표로 구분된 여러 값, W/ 접두사, * 허용)."""
+    if not if_none_match:
+        return False
+    for raw in if_none_match.split(","):
+        candidate = raw.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+class CacheMiddleware:
+    """
+    GET 응답 캐시.
+
+    cache_paths 접두사로 시작하는 경로만 캐시합니다 (그 외 경로는 그대로 통과).
+    캐시 키는 method|path|query|Authorization(없으면 anon)|Accept-Language의 해시이며,
+    지식 베이스 세대(kb:generation)를 접두사에 넣어 데이터 적재/초기화 후에는 이전 응답을 쓰지 않습니다
+    (세대는 generation_check_interval초마다 한 번만 조회). 200 JSON 응답만 저장합니다. 응답에 `Cache-Control: no-store`가 있으면 저장하지 않습니다.
+    캐시 대상 응답에는 본문 해시로 만든 ETag를 붙이고,
+    If-None-Match가 일치하면 본문 없이 304를 보냅니다.
+    Redis 오류는 캐시 미스로 취급해 요청 처리에 영향을 주지 않습니다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        ttl: int = 300,
+        cache_paths: Sequence[str] = (),
+        generation_check_interval: float = 5.0,
+    ) -> None:
+        self.app = app
+        self.ttl = ttl
+        # str.startswith(tuple)로 여러 접두사를 한 번의 C 호출로 검사
+        self.cache_paths = tuple(cache_paths)
+        self.generation_check_interval = generation_check_interval
+        self._generation = 0
+        self._generation_checked_at = float("-inf")
+
+    async def _current_generation(self) -> int:
+        """요청마다 Redis를 읽지 않도록 세대 번호를 확인 주기 동안 재사용."""
+        now = time.monotonic()
+        if now - self._generation_checked_at >= self.generation_check_interval:
+            self._generation_checked_at = now
+            self._generation = await get_knowledge_generation()
+        return self._generation
+
+    @staticmethod
+    def _cache_key(scope: Scope, headers: Headers, generation: int) -> str:
+        raw = b"|".join(
+            (
+                scope["method"].encode("latin-1"),
+                scope["path"].encode("utf-8"),
+                scope["query_string"],
+                headers.get("authorization", "anon").encode("latin-1"),
+                headers.get("accept-language", "").encode("latin-1"),
+            )
+        )
+        digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+        return f"{_KEY_PREFIX}{generation}:{digest}"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or not scope["path"].startswith(self.cache_paths)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        if "no-cache" in request_headers.get("cache-control", ""):
+            await self.app(scope, receive, send)
+            return
+
+        key = self._cache_key(scope, request_headers, await self._current_generation())
+        redis = await get_redis_client()
+
+        try:
+            cached = await redis.get(key)
+        except RedisError as exc:
+            logger.warning("Response cache lookup failed: %s", exc)
+            cached = None
+
+        if_none_match = request_headers.get("if-none-match")
+
+        if cached is not None:
+            status, headers, body, etag = orjson.loads(cached)
+            if _etag_matches(if_none_match, etag):
+                await self._send_not_modified(send, etag, hit=True)
+                return
+            raw_headers = [(k.encode("latin-1"), v.encode("latin-1")) for k, v in headers]
+            raw_headers.append(_HIT_HEADER)
+            await send({"type": "http.response.start", "status": status, "headers": raw_headers})
+            await send({"type": "http.response.body", "body": body.encode("utf-8")})
+            return
+
+        start_message: Message | None = None
+        chunks: list[bytes] = []
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                response_headers = Headers(raw=message.get("headers", []))
+                cacheable = (
+                    message["status"] == 200
+                    and response_headers.get("content-type", "").startswith("application/json")
+                    and "no-store" not in response_headers.get("cache-control", "")
+                )
+                if cacheable:
+                    # ETag을 헤더에 넣어야 하므로 본문이 끝날 때까지 시작 메시지를 보류
+                    start_message = message
+                else:
+                    await send(message)
+                return
+
+            if start_message is None or message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            body = b"".join(chunks)
+            etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+            raw_headers = [*start_message.get("headers", []), (b"etag", etag.encode("latin-1"))]
+
+            if _etag_matches(if_none_match, etag):
+                await self._send_not_modified(send, etag)
+            else:
+                await send({**start_message, "headers": raw_headers})
+                await send({"type": "http.response.body", "body": body})
+            # 클라이언트에 응답을 보낸 뒤 저장하므로 응답 지연에 포함되지 않음
+            await self._store(
+                redis,
+                key,
+                status=start_message["status"],
+                raw_headers=raw_headers,
+                body=body,
+                etag=etag,
+            )
+
+        await self.app(scope, receive, send_wrapper)
+
+    @staticmethod
+    async def _send_not_modified(send: Send, etag: str, *, hit: bool = False) -> None:
+        headers = [(b"etag", etag.encode("latin-1"))]
+        if hit:
+            headers.append(_HIT_HEADER)
+        await send({"type": "http.response.start", "status": 304, "headers": headers})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def _store(
+        self,
+        redis,
+        key: str,
+        *,
+        status: int,
+        raw_headers: list[tuple[bytes, bytes]],
+        body: bytes,
+        etag: str,
+    ) -> None:
+        try:
+            # Redis 클라이언트가 decode_responses=True이므로 본문은 UTF-8 문자열로 저장
+            headers = [(k.decode("latin-1"), v.decode("latin-1")) for k, v in raw_headers]
+            payload = orjson.dumps([status, headers, body.decode("utf-8"), etag])
+            await redis.setex(key, self.ttl, payload.decode("utf-8"))
+        except (RedisError, UnicodeDecodeError) as exc:
+            logger.warning("Response cache store failed: %s", exc)
@@ -0,0 +1,167 @@
+"""
+순수 ASGI CORS 미들웨어.
+
+요청/응답 본문을 건드리지 않고 http.response.start 메시지의 헤더만 추가하므로
+BaseHTTPMiddleware 계열처럼 본문을 채널로 중계하는 비용이 없습니다.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+SAFELISTED_HEADERS = {"accept", "accept-language", "content-language", "content-type"}
+
+# preflight 요청 헤더 검사 결과 캐시 크기 (임의 값으로 메모리가 늘지 않도록 제한)
+_REQUESTED_HEADERS_CACHE_SIZE = 256
+
+_PREFLIGHT_OK_HEADERS = (
+    (b"content-type", b"text/plain; charset=utf-8"),
+    (b"content-length", b"2"),
+)
+
+
+class CORSMiddleware:
+    """Starlette CORSMiddleware와 같은 설정을 받는 순수 ASGI 구현."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        allow_origins: Sequence[str] = (),
+        allow_methods: Sequence[str] = ("GET",),
+        allow_headers: Sequence[str] = (),
+        allow_credentials: bool = False,
+        max_age: int = 600,
+    ) -> None:
+        self.app = app
+        self.allow_all_origins = "*" in allow_origins
+        self.allow_origins = set(allow_origins)
+        self.allow_all_methods = "*" in allow_methods
+        self.allow_methods = (
+            ["DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT"]
+            if self.allow_all_methods
+            else list(allow_methods)
+        )
+        self.allow_all_headers = "*" in allow_headers
+        self.allow_headers = sorted(SAFELISTED_HEADERS | {h.lower() for h in allow_headers})
+        self.allow_credentials = allow_credentials
+        self.max_age = max_age
+
+        # 응답마다 join/encode 하지 않도록 헤더 값을 미리 바이트로 만들어 둠
+        self._allow_headers_set = frozenset(self.allow_headers)
+        self._requested_headers_cache: dict[bytes, bool] = {}
+        self._allow_headers_bytes = ", ".join(self.allow_headers).encode("latin-1")
+        self._allow_origins_bytes = frozenset(o.encode("latin-1") for o in self.allow_origins)
+        self._allow_methods_bytes = frozenset(m.encode("latin-1") for m in self.allow_methods)
+        self._preflight_headers: tuple[tuple[bytes, bytes], ...] = (
+            (b"access-control-allow-methods", ", ".join(self.allow_methods).encode("latin-1")),
+            (b"access-control-max-age", str(max_age).encode("latin-1")),
+        )
+
+        # origin과 무관한 공통 헤더 (origin 값 자체는 요청에 따라 달라질 수 있음)
+        self._echo_origin = not (self.allow_all_origins and not allow_credentials)
+        extra: list[tuple[bytes, bytes]] = []
+        if allow_credentials:
+            extra.append((b"access-control-allow-credentials", b"true"))
+        if not self.allow_all_origins or allow_credentials:
+            extra.append((b"vary", b"Origin"))
+        self._extra_origin_headers = tuple(extra)
+        self._static_origin_headers: tuple[tuple[bytes, bytes], ...] = (
+            (b"access-control-allow-origin", b"*"),
+            *extra,
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin: bytes | None = None
+        request_method: bytes | None = None
+        request_headers: bytes | None = None
+        for key, value in scope["headers"]:
+            if key == b"origin":
+                origin = value
+            elif key == b"access-control-request-method":
+                request_method = value
+            elif key == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            await self._preflight(origin, request_method, request_headers, send)
+            return
+
+        await self.app(scope, receive, self._wrap_send(send, origin))
+
+    def _requested_headers_allowed(self, request_headers: bytes) -> bool:
+        # 브라우저는 같은 Access-Control-Request-Headers 값을 반복해서 보내므로 파싱 결과를 기억
+        allowed = self._requested_headers_cache.get(request_headers)
+        if allowed is None:
+            requested = {h.strip().lower() for h in request_headers.decode("latin-1").split(",")}
+            allowed = requested <= self._allow_headers_set
+            if len(self._requested_headers_cache) < _REQUESTED_HEADERS_CACHE_SIZE:
+                self._requested_headers_cache[request_headers] = allowed
+        return allowed
+
+    def _is_allowed_origin(self, origin: bytes) -> bool:
+        return self.allow_all_origins or origin in self._allow_origins_bytes
+
+    def _origin_headers(self, origin: bytes) -> tuple[tuple[bytes, bytes], ...]:
+        # 자격 증명 포함 요청에는 "*"를 쓸 수 없으므로 요청 origin을 그대로 돌려줌
+        if self._echo_origin:
+            return ((b"access-control-allow-origin", origin), *self._extra_origin_headers)
+        return self._static_origin_headers
+
+    async def _preflight(
+        self,
+        origin: bytes,
+        request_method: bytes,
+        request_headers: bytes | None,
+        send: Send,
+    ) -> None:
+        failures: list[str] = []
+        if not self._is_allowed_origin(origin):
+            failures.append("origin")
+        if request_method not in self._allow_methods_bytes:
+            failures.append("method")
+
+        if self.allow_all_headers:
+            allow_headers = request_headers or self._allow_headers_bytes
+        else:
+            allow_headers = self._allow_headers_bytes
+            if request_headers and not self._requested_headers_allowed(request_headers):
+                failures.append("headers")
+
+        headers = [*self._preflight_headers, (b"access-control-allow-headers", allow_headers)]
+        if failures:
+            body = f"Disallowed CORS {', '.join(failures)}".encode()
+            status = 400
+            headers.append((b"content-type", b"text/plain; charset=utf-8"))
+            headers.append((b"content-length", str(len(body)).encode("latin-1")))
+        else:
+            headers.extend(self._origin_headers(origin))
+            headers.extend(_PREFLIGHT_OK_HEADERS)
+            body = b"OK"
+            status = 200
+
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+    def _wrap_send(self, send: Send, origin: bytes) -> Send:
+        if not self._is_allowed_origin(origin):
+            return send
+
+        cors_headers = self._origin_headers(origin)
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", []), *cors_headers]
+            await send(message)
+
+        return send_with_cors
@@ -4,23 +4,58 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
+import os
+import socket
+import time
 from datetime import datetime
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
+from uuid import uuid4
 
+import orjson
+from celery import states
 from celery.result import AsyncResult
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import Response
+from kombu.exceptions import OperationalError
 from pydantic import BaseModel, Field
 
-from api.dependencies import get_lightrag_service
+from api.dependencies import get_lightrag_service, get_rag_service
+from core.cache import (
+    bump_knowledge_generation,
+    delete_if_equal,
+    get_redis_client,
+    replace_if_equal,
+)
+from core.config import settings
 from data.collectors.sigungu_service import SigunguServiceSingleton
 from jobs.celery_app import celery_app
-from jobs.tasks import load_data_task, test_task
+from jobs.status import TASK_META_PREFIX
+from jobs.tasks import (
+    DELETED_DIR_MARKER,
+    LOAD_LOCK_KEY,
+    cleanup_deleted_dir,
+    load_data_task,
+    remove_deleted_dir,
+    test_task,
+)
 
 if TYPE_CHECKING:
     from services.lightrag_service import LightRAGService
+    from services.rag_service import RAGService
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# LightRAG 종료/재초기화가 멈춰 워커를 붙잡지 않도록 제한 (초)
+_LIGHTRAG_RESET_TIMEOUT = 30
+
+# create_task 결과는 약한 참조만 유지되므로 완료될 때까지 참조를 보관
+_background_tasks: set[asyncio.Task[Any]] = set()
+
 
 class DataLoadRequest(BaseModel):
     """데이터 로딩 요청."""
@@ -38,6 +73,7 @@ class DataLoadResponse(BaseModel):
     status: str
     message: str
     started_at: str
+    job_id: str | None = None
     stats: dict[str, Any] | None = None
 
 
@@ -50,120 +86,191 @@ class DataStatsResponse(BaseModel):
     available_districts: list[str]
 
 
-# In-memory task tracking (간단한 구현)
-_data_load_status: dict[str, Any] = {
-    "is_loading": False,
-    "last_load_time": None,
-    "last_stats": None,
-}
+# 데이터 로딩은 Celery load_data_task로 실행하고, 진행 중인 작업 ID만 Redis에 기록
+# (여러 API 워커 프로세스가 같은 상태를 보고, API 재시작에도 상태가 유지되도록)
+# 잠금은 작업이 끝나면 worker가 해제하고, TTL은 worker가 죽어 해제하지 못한 경우에만 쓰임
+_LOAD_STATUS_KEY = "admin:loadstatus"
+_LOAD_LOCK_TTL = 86400 + 3600  # load_data_task의 hard time limit과 동일
+_WORKER_ID = f"{socket.gethostname()}:{os.getpid()}"
+
+
+async def _task_metas(redis, job_ids: list[str]) -> list[dict[str, Any] | None]:
+    """Celery 결과 메타를 MGET 한 번으로 읽음 (결과가 아직 없으면 None)."""
+    raws = await redis.mget([f"{TASK_META_PREFIX}{job_id}" for job_id in job_ids])
+    return [orjson.loads(raw) if raw is not None else None for raw in raws]
+
+
+async def _invalidate_knowledge_caches(rag_service: RAGService) -> None:
+    """세대 번호를 올려 모든 워커의 지식 기반 캐시(검색/응답/Redis chatresp:*)를 무효화."""
+    await bump_knowledge_generation()
+    rag_service.clear_caches()
 
 
 @router.post("/load-data", response_model=DataLoadResponse)
 async def load_data(
     request: DataLoadRequest,
-    background_tasks: BackgroundTasks,
-    lightrag_service: LightRAGService = Depends(get_lightrag_service),
+    rag_service: RAGService = Depends(get_rag_service),
 ) -> DataLoadResponse:
     """
     국토교통부 및 서울시 공공 데이터를 LightRAG에 로딩합니다.
 
-    배경 작업으로 실행되므로 즉시 응답을 반환합니다.
-    /admin/status 엔드포인트로 진행 상황을 확인할 수 있습니다.
+    Celery 작업으로 실행되므로 즉시 응답을 반환합니다.
+    /admin/status 또는 /admin/jobs/{job_id} 엔드포인트로 진행 상황을 확인할 수 있습니다.
     """
-    if _data_load_status["is_loading"]:
-        raise HTTPException(
-            status_code=409,
-            detail="데이터 로딩이 이미 진행 중입니다. 완료될 때까지 기다려주세요.",
-        )
-
-    async def _load_in_background():
-        """백그라운드 데이터 로딩 태스크."""
-        from scripts.load_data import load_full_data, load_sample_data
-
-        _data_load_status["is_loading"] = True
-        _data_load_status["last_load_time"] = datetime.now().isoformat()
-
-        try:
-            if request.mode == "sample":
-                stats = await load_sample_data(lightrag_service)
-            else:
-                stats = await load_full_data(
-                    lightrag_service,
-                    districts=request.districts,
-                    year_month=request.year_month,
+    redis = await get_redis_client()
+    job_id = str(uuid4())
+
+    # 작업 ID로 잠금을 먼저 잡아, 동시에 들어온 요청이 작업을 중복 실행하지 않도록 함
+    if not await redis.set(LOAD_LOCK_KEY, job_id, nx=True, ex=_LOAD_LOCK_TTL):
+        running_id = await redis.get(LOAD_LOCK_KEY)
+        acquired = False
+        if running_id is None:
+            # 조회 사이에 잠금이 만료됨
+            acquired = bool(await redis.set(LOAD_LOCK_KEY, job_id, nx=True, ex=_LOAD_LOCK_TTL))
+        else:
+            (meta,) = await _task_metas(redis, [running_id])
+            if meta is not None and meta.get("status") in states.READY_STATES:
+                # 이전 작업이 끝났으면 잠금을 넘겨받되, 그 사이 다른 요청이 먼저 넘겨받았으면 실패
+                acquired = await replace_if_equal(
+                    redis, LOAD_LOCK_KEY, running_id, job_id, ex=_LOAD_LOCK_TTL
                 )
+        if not acquired:
+            raise HTTPException(
+                status_code=409,
+                detail="데이터 로딩이 이미 진행 중입니다. 완료될 때까지 기다려주세요.",
+            )
 
-            _data_load_status["last_stats"] = stats
-        except Exception:
-            _data_load_status["last_stats"] = {"error": "데이터 로딩 실패"}
-        finally:
-            _data_load_status["is_loading"] = False
+    try:
+        load_data_task.apply_async(
+            kwargs={
+                "mode": request.mode,
+                "districts": request.districts,
+                "year_month": request.year_month,
+                "property_types": request.property_types,
+                "max_records": request.max_records,
+            },
+            task_id=job_id,
+        )
+    except Exception as e:
+        # 작업이 큐에 들어가지 못했으므로 잠금을 풀어 다음 요청이 바로 시작할 수 있게 함
+        await delete_if_equal(redis, LOAD_LOCK_KEY, job_id)
+        logger.error("Failed to dispatch load_data_task: %s", e)
+        raise HTTPException(
+            status_code=503,
+            detail="데이터 로딩 작업을 시작하지 못했습니다. 잠시 후 다시 시도해주세요.",
+        ) from e
 
-    background_tasks.add_task(_load_in_background)
+    started_at = datetime.now().isoformat()
+    await redis.hset(
+        _LOAD_STATUS_KEY,
+        mapping={"last_job_id": job_id, "last_load_time": started_at},
+    )
+    # 적재 중 새 문서가 반영되도록 기존 캐시를 버림 (완료 시 worker가 한 번 더 무효화)
+    await _invalidate_knowledge_caches(rag_service)
 
     return DataLoadResponse(
         status="started",
         message=f"데이터 로딩 시작됨 (모드: {request.mode})",
-        started_at=datetime.now().isoformat(),
+        started_at=started_at,
+        job_id=job_id,
     )
 
 
-@router.get("/status", response_model=dict[str, Any])
+@router.get("/status", response_model=None)
 async def get_load_status() -> dict[str, Any]:
     """
     데이터 로딩 진행 상황을 확인합니다.
     """
+    redis = await get_redis_client()
+    status = await redis.hgetall(_LOAD_STATUS_KEY)
+    job_id = status.get("last_job_id")
+    if job_id is None:
+        return {"is_loading": False, "job_id": None, "last_load_time": None, "last_stats": None}
+
+    # 잠금 소유자와 결과 메타를 MGET 한 번으로 읽음
+    lock_holder, raw_meta = await redis.mget([LOAD_LOCK_KEY, f"{TASK_META_PREFIX}{job_id}"])
+    meta = orjson.loads(raw_meta) if raw_meta is not None else None
+    state = meta.get("status") if meta is not None else None
+    if state == "SUCCESS":
+        last_stats = meta.get("result")
+    elif state in states.READY_STATES:
+        last_stats = {"error": "데이터 로딩 실패"}
+    else:
+        last_stats = None
+
     return {
-        "is_loading": _data_load_status["is_loading"],
-        "last_load_time": _data_load_status["last_load_time"],
-        "last_stats": _data_load_status["last_stats"],
+        # 결과 메타는 대기/실행 중에도 없고 완료 후 result_expires가 지나도 사라지므로,
+        # 작업이 아직 잠금을 쥐고 있는지로 진행 여부를 판단
+        "is_loading": lock_holder == job_id and state not in states.READY_STATES,
+        "job_id": job_id,
+        "last_load_time": status.get("last_load_time"),
+        "last_stats": last_stats,
     }
 
 
-@router.get("/stats", response_model=DataStatsResponse)
-async def get_data_stats(
-    lightrag_service: LightRAGService = Depends(get_lightrag_service),
-) -> DataStatsResponse:
-    """
-    현재 데이터 소스 및 LightRAG 상태를 확인합니다.
-    """
-    from core.config import settings
-
-    sigungu_list = list(SigunguServiceSingleton.all_sigungu())
-
+def _build_stats_body() -> bytes:
+    sigungu_list = SigunguServiceSingleton.sigungu_list
     return DataStatsResponse(
         lightrag_workspace=settings.LIGHTRAG_WORKSPACE,
         working_directory=settings.LIGHTRAG_WORKING_DIR,
         sigungu_count=len(sigungu_list),
         available_districts=[info.sigungu_name for info in sigungu_list[:20]],  # 샘플
-    )
+    ).model_dump_json().encode()
+
+
+def _build_districts_body() -> bytes:
+    districts = [
+        {
+            "sigungu_name": info.sigungu_name,
+            "sigungu_code": info.sigungu_code,
+            "sido_name": info.sido_name,
+            "sido_fullname": info.sido_fullname,
+        }
+        for info in SigunguServiceSingleton.sigungu_list
+    ]
+    return orjson.dumps({"total_count": len(districts), "districts": districts})
+
+
+# 설정과 시군구 목록은 프로세스 수명 동안 고정이므로 import 시 한 번만 직렬화
+_STATS_BODY = _build_stats_body()
+_DISTRICTS_BODY = _build_districts_body()
+
+
+@router.get("/stats", response_class=Response)
+async def get_data_stats() -> Response:
+    """
+    현재 데이터 소스 및 LightRAG 상태를 확인합니다.
+    """
+    return Response(_STATS_BODY, media_type="application/json")
 
 
-@router.get("/districts")
-async def get_available_districts() -> dict[str, Any]:
+@router.get("/districts", response_class=Response)
+async def get_available_districts() -> Response:
     """
     수집 가능한 모든 자치구 목록을 반환합니다.
     """
-    districts = []
-    for info in SigunguServiceSingleton.all_sigungu():
-        districts.append(
-            {
-                "sigungu_name": info.sigungu_name,
-                "sigungu_code": info.sigungu_code,
-                "sido_name": info.sido_name,
-                "sido_fullname": info.sido_fullname,
-            }
-        )
+    return Response(_DISTRICTS_BODY, media_type="application/json")
 
-    return {
-        "total_count": len(districts),
-        "districts": districts,
-    }
+
+def _schedule_dir_cleanup(path: Path) -> None:
+    """삭제 대상 디렉토리를 worker에서 지우도록 요청 (브로커 연결 실패 시 스레드에서 삭제)."""
+    try:
+        cleanup_deleted_dir.delay(str(path))
+    except OperationalError as exc:
+        logger.warning("Broker unavailable, removing %s in-process: %s", path, exc)
+        task = asyncio.create_task(asyncio.to_thread(remove_deleted_dir, path))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+
+
+_CLEAR_LOCK_KEY = "admin:clear-data:lock"
+_CLEAR_LOCK_TTL = 300  # 종료/재초기화 제한 시간보다 넉넉하게
 
 
-@router.delete("/clear-data")
+@router.delete("/clear-data", response_model=None)
 async def clear_lightrag_data(
     lightrag_service: LightRAGService = Depends(get_lightrag_service),
+    rag_service: RAGService = Depends(get_rag_service),
     confirm: bool = Query(False, description="삭제 확인"),
 ) -> dict[str, Any]:
     """
@@ -177,22 +284,32 @@ async def clear_lightrag_data(
             detail="데이터 삭제를 확인하려면 ?confirm=true 파라미터를 추가하세요.",
         )
 
+    # 동시에 두 요청이 종료/이동/재초기화를 겹쳐 실행하지 않도록 잠금
+    redis = await get_redis_client()
+    if not await redis.set(_CLEAR_LOCK_KEY, _WORKER_ID, nx=True, ex=_CLEAR_LOCK_TTL):
+        raise HTTPException(
+            status_code=409,
+            detail="데이터 삭제가 이미 진행 중입니다.",
+        )
+
     try:
         # LightRAG 종료
-        await lightrag_service.finalize()
+        await asyncio.wait_for(lightrag_service.finalize(), timeout=_LIGHTRAG_RESET_TIMEOUT)
 
         # 작업 디렉토리 삭제 (주의!)
-        import shutil
-        from pathlib import Path
-
-        from core.config import settings
-
+        # 이름 변경은 즉시 끝나므로 먼저 옮겨두고, 실제 삭제는 Celery worker에 맡김
         working_dir = Path(settings.LIGHTRAG_WORKING_DIR) / settings.LIGHTRAG_WORKSPACE
-        if working_dir.exists():
-            shutil.rmtree(working_dir)
+        trash_dir = working_dir.with_name(f"{working_dir.name}{DELETED_DIR_MARKER}{uuid4().hex}")
+        try:
+            await asyncio.to_thread(os.rename, working_dir, trash_dir)
+        except FileNotFoundError:
+            pass
+        else:
+            _schedule_dir_cleanup(trash_dir)
 
         # 재초기화
-        await lightrag_service.initialize()
+        await asyncio.wait_for(lightrag_service.initialize(), timeout=_LIGHTRAG_RESET_TIMEOUT)
+        await _invalidate_knowledge_caches(rag_service)
 
         return {
             "status": "success",
@@ -203,6 +320,8 @@ async def clear_lightrag_data(
             status_code=500,
             detail=f"데이터 삭제 중 오류 발생: {e}",
         ) from e
+    finally:
+        await redis.delete(_CLEAR_LOCK_KEY)
 
 
 # ============================================================================
@@ -235,7 +354,7 @@ class JobStatusResponse(BaseModel):
     error: str | None = None
 
 
-@router.post("/jobs/load-data", response_model=dict[str, Any])
+@router.post("/jobs/load-data", response_model=None)
 async def start_data_loading_job(request: JobStartRequest) -> dict[str, Any]:
     """
     백그라운드 데이터 로딩 작업 시작 (Celery).
@@ -265,31 +384,31 @@ async def start_data_loading_job(request: JobStartRequest) -> dict[str, Any]:
     }
 
 
-@router.get("/jobs/{job_id}", response_model=JobStatusResponse)
-async def get_job_status(job_id: str) -> JobStatusResponse:
-    """
-    백그라운드 작업 상태 조회.
+def _failure_message(info: Any) -> str | None:
+    """실패 정보 문자열 (AsyncResult는 예외 객체, JSON 결과 메타는 exc_message 목록)."""
+    if not info:
+        return None
+    if isinstance(info, dict) and "exc_message" in info:
+        message = info["exc_message"]
+        if isinstance(message, list):
+            return " ".join(str(part) for part in message)
+        return str(message)
+    return str(info)
 
-    작업 상태:
-    - PENDING: 대기 중
-    - PROGRESS: 진행 중 (진행률 포함)
-    - SUCCESS: 완료
-    - FAILURE: 실패
-    """
-    task = AsyncResult(job_id, app=celery_app)
 
-    if task.state == "PENDING":
+def _job_status_response(job_id: str, state: str, info: Any) -> JobStatusResponse:
+    if state == "PENDING":
         return JobStatusResponse(
             job_id=job_id,
-            state=task.state,
+            state=state,
             status="작업 대기 중...",
         )
 
-    elif task.state == "PROGRESS":
-        info = task.info or {}
+    elif state == "PROGRESS":
+        info = info or {}
         return JobStatusResponse(
             job_id=job_id,
-            state=task.state,
+            state=state,
             status="진행 중",
             current=info.get("current"),
             total=info.get("total"),
@@ -298,24 +417,76 @@ async def get_job_status(job_id: str) -> JobStatusResponse:
             elapsed_seconds=info.get("elapsed_seconds"),
         )
 
-    elif task.state == "SUCCESS":
+    elif state == "SUCCESS":
         return JobStatusResponse(
             job_id=job_id,
-            state=task.state,
+            state=state,
             status="완료",
-            result=task.result,
+            result=info,
         )
 
     else:  # FAILURE or other states
         return JobStatusResponse(
             job_id=job_id,
-            state=task.state,
+            state=state,
             status="실패",
-            error=str(task.info) if task.info else None,
+            error=_failure_message(info),
         )
 
 
-@router.delete("/jobs/{job_id}")
+@router.get("/jobs/{job_id}", response_model=JobStatusResponse)
+async def get_job_status(job_id: str, http_request: Request) -> JobStatusResponse:
+    """
+    백그라운드 작업 상태 조회.
+
+    작업 상태:
+    - PENDING: 대기 중
+    - PROGRESS: 진행 중 (진행률 포함)
+    - SUCCESS: 완료
+    - FAILURE: 실패
+
+    keyspace 알림으로 갱신되는 상태 캐시를 먼저 확인하고, 없을 때만 결과 메타 키를 읽습니다.
+    AsyncResult(Celery 동기 백엔드 연결) 대신 공유 redis.asyncio 커넥션 풀을 사용합니다.
+    """
+    watcher = getattr(http_request.app.state, "job_status_watcher", None)
+    meta = watcher.get(job_id) if watcher is not None else None
+    if meta is None:
+        redis = await get_redis_client()
+        (meta,) = await _task_metas(redis, [job_id])
+    if meta is None:
+        return _job_status_response(job_id, "PENDING", None)
+    return _job_status_response(job_id, meta.get("status", "PENDING"), meta.get("result"))
+
+
+class JobStatusBatchRequest(BaseModel):
+    """여러 작업 상태 일괄 조회 요청."""
+
+    job_ids: list[str] = Field(..., min_length=1, max_length=100, description="조회할 작업 ID 목록")
+
+
+@router.post("/jobs/status:batch", response_model=list[JobStatusResponse])
+async def get_job_statuses(request: JobStatusBatchRequest) -> list[JobStatusResponse]:
+    """
+    여러 백그라운드 작업 상태를 한 번에 조회합니다.
+
+    AsyncResult를 작업마다 만들지 않고 결과 메타 키를 MGET 한 번으로 읽습니다.
+    결과 메타가 없는 작업은 PENDING으로 표시됩니다.
+    """
+    redis = await get_redis_client()
+    metas = await _task_metas(redis, request.job_ids)
+
+    statuses = []
+    for job_id, meta in zip(request.job_ids, metas, strict=True):
+        if meta is None:
+            statuses.append(_job_status_response(job_id, "PENDING", None))
+            continue
+        statuses.append(
+            _job_status_response(job_id, meta.get("status", "PENDING"), meta.get("result"))
+        )
+    return statuses
+
+
+@router.delete("/jobs/{job_id}", response_model=None)
 async def cancel_job(job_id: str) -> dict[str, Any]:
     """
     실행 중인 작업 취소.
@@ -339,29 +510,72 @@ async def cancel_job(job_id: str) -> dict[str, Any]:
         }
 
 
-@router.get("/jobs")
+# Celery inspect 결과 캐시 (브로드캐스트 후 워커 응답을 기다리므로 짧게 재사용)
+_JOBS_INSPECT_TIMEOUT = 0.5  # 워커 응답 대기 상한 (초, 기본값 1초)
+_JOBS_SNAPSHOT_KEY = "celery:jobs:snapshot"
+_JOBS_SNAPSHOT_LOCK_KEY = "celery:jobs:snapshot:lock"
+_JOBS_SNAPSHOT_TTL = 3
+_JOBS_SNAPSHOT_WAIT = 0.1  # 다른 요청이 갱신 중일 때 재확인 간격 (초)
+
+
+async def _collect_jobs_snapshot() -> dict[str, Any]:
+    """active/scheduled/reserved 동시 조회 (블로킹 kombu 호출이므로 각각 스레드에서 실행)."""
+    inspect = celery_app.control.inspect(timeout=_JOBS_INSPECT_TIMEOUT)
+    active, scheduled, reserved = await asyncio.gather(
+        asyncio.to_thread(inspect.active),
+        asyncio.to_thread(inspect.scheduled),
+        asyncio.to_thread(inspect.reserved),
+    )
+    return {
+        "active": active or {},
+        "scheduled": scheduled or {},
+        "reserved": reserved or {},
+    }
+
+
+async def _cached_jobs_snapshot() -> dict[str, Any]:
+    """
+    inspect 결과를 Redis에 짧게 캐시.
+
+    미스 시 SET NX로 잠금을 잡은 요청 하나만 브로드캐스트하고,
+    나머지 요청은 갱신된 스냅샷을 기다렸다가 재사용합니다.
+    """
+    redis = await get_redis_client()
+    deadline = time.monotonic() + _JOBS_SNAPSHOT_TTL
+
+    while True:
+        cached = await redis.get(_JOBS_SNAPSHOT_KEY)
+        if cached is not None:
+            return orjson.loads(cached)
+
+        if await redis.set(_JOBS_SNAPSHOT_LOCK_KEY, _WORKER_ID, nx=True, ex=_JOBS_SNAPSHOT_TTL):
+            break
+        if time.monotonic() >= deadline:
+            # 잠금을 가진 요청이 끝내지 못한 경우 직접 조회
+            return await _collect_jobs_snapshot()
+        await asyncio.sleep(_JOBS_SNAPSHOT_WAIT)
+
+    try:
+        snapshot = await _collect_jobs_snapshot()
+        await redis.setex(_JOBS_SNAPSHOT_KEY, _JOBS_SNAPSHOT_TTL, orjson.dumps(snapshot).decode())
+    finally:
+        await redis.delete(_JOBS_SNAPSHOT_LOCK_KEY)
+    return snapshot
+
+
+@router.get("/jobs", response_model=None)
 async def list_jobs() -> dict[str, Any]:
     """
     현재 실행 중인 모든 작업 목록 조회.
 
     Note: Celery는 기본적으로 완료된 작업을 자동으로 추적하지 않습니다.
     실행 중인 작업만 확인할 수 있습니다.
+    결과는 몇 초간 캐시되므로 대시보드 폴링이 몰려도 워커 브로드캐스트는 한 번만 발생합니다.
     """
-    # Celery inspect API 사용
-    inspect = celery_app.control.inspect()
-
-    active_tasks = inspect.active() or {}
-    scheduled_tasks = inspect.scheduled() or {}
-    reserved_tasks = inspect.reserved() or {}
-
-    return {
-        "active": active_tasks,
-        "scheduled": scheduled_tasks,
-        "reserved": reserved_tasks,
-    }
+    return await _cached_jobs_snapshot()
 
 
-@router.post("/jobs/test")
+@router.post("/jobs/test", response_model=None)
 async def start_test_job(duration: int = 10) -> dict[str, Any]:
     """
     테스트용 작업 시작 (진행 상황 업데이트 데모).
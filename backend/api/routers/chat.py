@@ -4,10 +4,15 @@ Chat router powered by the simplified RAG pipeline.
 
 from __future__ import annotations
 
+import logging
+import math
 import uuid
+from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING, Any
 
-from fastapi import APIRouter, Depends, Query
+import orjson
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
 from api.dependencies import get_rag_service, get_user_service
@@ -16,6 +21,8 @@ if TYPE_CHECKING:
     from services.rag_service import RAGService
     from services.user_service import UserService
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 
@@ -26,6 +33,11 @@ class ChatRequest(BaseModel):
     user_id: str
     conversation_id: str | None = None
     session_context: dict[str, Any] | None = None
+    # SSE delta 묶음 크기: 첫 이벤트는 min_batch_size 토큰, 이후 growth 배씩 max까지 늘림
+    # (growth 1.0이면 min_batch_size로 고정)
+    min_batch_size: int = Field(1, ge=1, le=100)
+    max_batch_size: int = Field(50, ge=1, le=500)
+    batch_size_growth_factor: float = Field(3.0, ge=1.0, le=10.0)
 
 
 class ChatResponse(BaseModel):
@@ -45,7 +57,8 @@ class ConversationHistoryResponse(BaseModel):
 
     conversation_id: str
     messages: list[dict[str, Any]] = Field(default_factory=list)
-    total_count: int
+    total_count: int | None = None  # include_total=true일 때만 채움
+    next_cursor: str | None = None
 
 
 class UserContextResponse(BaseModel):
@@ -56,13 +69,29 @@ class UserContextResponse(BaseModel):
     recent_conversations: list[dict[str, Any]] = Field(default_factory=list)
 
 
-@router.post("/send", response_model=ChatResponse)
+@router.post(
+    "/send",
+    response_model=None,
+    responses={
+        200: {
+            "model": ChatResponse,
+            "content": {"text/event-stream": {}},
+            "description": "Accept: text/event-stream이면 /stream과 같은 SSE 이벤트로 응답",
+        }
+    },
+)
 async def send_message(
     payload: ChatRequest,
+    request: Request,
     rag_service: RAGService = Depends(get_rag_service),
-) -> ChatResponse:
+) -> ORJSONResponse | StreamingResponse:
     """Process a chat message through the RAG pipeline."""
-    conversation_id = payload.conversation_id or str(uuid.uuid4())
+    conversation_id = payload.conversation_id or uuid.uuid4().hex
+
+    # SSE를 요청한 클라이언트는 전체 생성을 기다리지 않고 첫 토큰부터 받음
+    if "text/event-stream" in request.headers.get("accept", ""):
+        return _stream_response(payload, rag_service, conversation_id)
+
     rag_result = await rag_service.process_query(
         user_query=payload.message,
         user_id=payload.user_id,
@@ -73,44 +102,125 @@ async def send_message(
     ai_response = rag_result["ai_response"]["text"]
     knowledge = rag_result.get("knowledge") or {}
 
-    return ChatResponse(
-        user_id=payload.user_id,
-        conversation_id=conversation_id,
-        response=ai_response,
-        knowledge_mode=knowledge.get("mode"),
-        processing_time_ms=rag_result.get("processing_time_ms", 0.0),
-        vector_results=rag_result.get("vector_results", []),
-        rag_context=rag_result.get("context", {}),
+    # RAG 결과는 프로세스 내부에서 만든 dict이므로 ChatResponse 검증 없이 바로 직렬화
+    return ORJSONResponse(
+        {
+            "user_id": payload.user_id,
+            "conversation_id": conversation_id,
+            "response": ai_response,
+            "knowledge_mode": knowledge.get("mode"),
+            "processing_time_ms": rag_result.get("processing_time_ms", 0.0),
+            "vector_results": rag_result.get("vector_results", []),
+            "rag_context": rag_result.get("context", {}),
+        }
+    )
+
+
+@router.post("/stream", summary="채팅 메시지 스트리밍 (SSE)")
+async def stream_message(
+    payload: ChatRequest,
+    rag_service: RAGService = Depends(get_rag_service),
+) -> StreamingResponse:
+    """
+    Process a chat message and stream the answer as Server-Sent Events.
+
+    이벤트: start(conversation_id) → delta(text)* → done(메타데이터) 또는 error
+    """
+    conversation_id = payload.conversation_id or uuid.uuid4().hex
+    return _stream_response(payload, rag_service, conversation_id)
+
+
+def _stream_response(
+    payload: ChatRequest,
+    rag_service: RAGService,
+    conversation_id: str,
+) -> StreamingResponse:
+    start_event = {"type": "start", "user_id": payload.user_id, "conversation_id": conversation_id}
+
+    max_batch = max(payload.min_batch_size, payload.max_batch_size)
+    growth = payload.batch_size_growth_factor
+
+    async def event_stream() -> AsyncIterator[bytes]:
+        yield _sse(start_event)
+        # 토큰마다 이벤트를 보내면 SSE 프레이밍/ASGI send 비용이 토큰 수만큼 들므로,
+        # 첫 토큰은 바로 보내고(TTFT 유지) 이후 묶음 크기를 점점 키움
+        buf: list[str] = []
+        target = payload.min_batch_size
+        try:
+            async for event in rag_service.process_query_stream(
+                user_query=payload.message,
+                user_id=payload.user_id,
+                conversation_id=conversation_id,
+                session_context=payload.session_context,
+            ):
+                if event["type"] == "delta":
+                    buf.append(event["text"])
+                    if len(buf) < target:
+                        continue
+                    yield _sse({"type": "delta", "text": "".join(buf)})
+                    buf.clear()
+                    # 배수 1이면 크기 고정, 1보다 크면 2 미만이어도 최소 1씩은 늘어나도록 올림
+                    if growth > 1.0:
+                        target = min(max(target + 1, math.ceil(target * growth)), max_batch)
+                    continue
+                if buf:
+                    yield _sse({"type": "delta", "text": "".join(buf)})
+                    buf.clear()
+                yield _sse(event)
+        except Exception:
+            logger.exception("Chat stream failed: conv=%s", conversation_id)
+            if buf:
+                yield _sse({"type": "delta", "text": "".join(buf)})
+            yield _sse({"type": "error", "detail": "응답 생성 중 오류가 발생했습니다."})
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
 
+def _sse(event: dict[str, Any]) -> bytes:
+    return b"data: " + orjson.dumps(event) + b"\n\n"
+
+
 @router.get(
     "/history/{conversation_id}",
-    response_model=ConversationHistoryResponse,
+    response_model=None,
+    responses={200: {"model": ConversationHistoryResponse}},
     summary="대화 이력 조회",
 )
 async def get_conversation_history(
     conversation_id: str,
+    *,
     user_service: UserService = Depends(get_user_service),
     user_id: str = Query(..., description="사용자 ID"),
     limit: int = Query(20, ge=1, le=200, description="가져올 메시지 수"),
-) -> ConversationHistoryResponse:
+    before: str | None = Query(None, description="이전 페이지 커서 (응답의 next_cursor)"),
+    include_total: bool = Query(False, description="대화 전체 메시지 수 포함 여부"),
+) -> ORJSONResponse:
     """Return the stored conversation history."""
-    records = await user_service.get_conversation_history(user_id, conversation_id, limit=limit)
-
-    messages: list[dict[str, Any]] = []
-    for item in records:
-        if hasattr(item, "dict"):
-            messages.append(item.dict())
-        elif hasattr(item, "__dict__"):
-            messages.append({k: v for k, v in item.__dict__.items() if not k.startswith("_")})
-        else:
-            messages.append(item)
-
-    return ConversationHistoryResponse(
-        conversation_id=conversation_id,
-        messages=messages,
-        total_count=len(messages),
+    # 한 개 더 읽어 이전 페이지가 있는지 판단 (별도 개수 조회 없이)
+    messages = await user_service.get_conversation_history(
+        user_id, conversation_id, limit=limit + 1, before=before
+    )
+    next_cursor = None
+    if len(messages) > limit:
+        messages = messages[1:]
+        next_cursor = messages[0].get("message_id")
+
+    total_count = None
+    if include_total:
+        total_count = await user_service.count_conversation_messages(user_id, conversation_id)
+
+    # 저장된 메시지는 이미 JSON 호환 dict이므로 응답 모델 검증 없이 바로 직렬화
+    return ORJSONResponse(
+        {
+            "conversation_id": conversation_id,
+            "messages": messages,
+            "total_count": total_count,
+            "next_cursor": next_cursor,
+        }
     )
 
 
@@ -127,12 +237,14 @@ async def get_user_context(
     profile = await user_service.get_primary_profile(user_id)
     profile_dict = None
     if profile:
-        if hasattr(profile, "model_dump"):
+        if isinstance(profile, dict):
+            # UserService는 프로필을 dict로 저장하므로 그대로 사용
+            profile_dict = profile
+        elif hasattr(profile, "model_dump"):
             profile_dict = profile.model_dump()
-        elif hasattr(profile, "dict"):
-            profile_dict = profile.dict()
         else:
-            profile_dict = {k: getattr(profile, k) for k in dir(profile) if not k.startswith("_")}
+            # dir()은 메서드/디스크립터까지 MRO 전체를 훑으므로 인스턴스 속성만 사용
+            profile_dict = {k: v for k, v in vars(profile).items() if not k.startswith("_")}
 
     return UserContextResponse(
         user_id=user_id,
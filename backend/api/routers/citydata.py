@@ -4,11 +4,15 @@ Simplified Seoul city data endpoints.
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import httpx
 from fastapi import APIRouter, Depends, HTTPException, Query
 
 from api.dependencies import get_citydata_service
-from services.seoul_city_data_service import SeoulCityDataService
+
+if TYPE_CHECKING:
+    from services.seoul_city_data_service import SeoulCityDataService
 
 router = APIRouter()
 
@@ -87,7 +87,7 @@ async def list_policies(
     )
 
 
-@router.get("/{policy_id}")
+@router.get("/{policy_id}", response_model=None)
 async def get_policy_detail(
     policy_id: str,
     data_service: DataService = Depends(get_data_service),
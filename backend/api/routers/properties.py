@@ -87,7 +87,7 @@ async def list_properties(
     )
 
 
-@router.get("/{property_id}")
+@router.get("/{property_id}", response_model=None)
 async def get_property_detail(
     property_id: str,
     data_service: DataService = Depends(get_data_service),
@@ -99,7 +99,7 @@ async def get_property_detail(
     return {"property": property_record}
 
 
-@router.get("/regions/list")
+@router.get("/regions/list", response_model=None)
 async def get_regions(
     data_service: DataService = Depends(get_data_service),
 ) -> dict[str, Any]:
@@ -115,7 +115,7 @@ async def get_regions(
     return {"regions": regions, "total_regions": len(regions)}
 
 
-@router.get("/types/list")
+@router.get("/types/list", response_model=None)
 async def get_property_types(
     data_service: DataService = Depends(get_data_service),
 ) -> dict[str, Any]:
@@ -5,6 +5,7 @@ User router backed by the lightweight JSON-based UserService.
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query
@@ -55,6 +56,17 @@ async def get_user_profile(
     return UserProfileResponse(user_id=user_id, profile=profile_dict)
 
 
+def _pick_converter(sample: Any) -> Callable[[Any], dict[str, Any]]:
+    """대화 레코드 타입에 맞는 dict 변환 함수 선택."""
+    if isinstance(sample, dict):
+        return lambda item: item
+    if hasattr(sample, "dict"):
+        return lambda item: item.dict()
+    if hasattr(sample, "__dict__"):
+        return lambda item: {k: v for k, v in vars(item).items() if not k.startswith("_")}
+    return lambda item: {"value": item}
+
+
 @router.get("/{user_id}/conversations/{conversation_id}", response_model=ConversationListResponse)
 async def get_user_conversation(
     user_id: str,
@@ -69,16 +81,8 @@ async def get_user_conversation(
         logger.exception("Conversation history lookup failed")
         raise HTTPException(status_code=500, detail="대화 이력을 불러오지 못했습니다.") from exc
 
-    messages: list[dict[str, Any]] = []
-    for item in records:
-        if isinstance(item, dict):
-            messages.append(item)
-        elif hasattr(item, "dict"):
-            messages.append(item.dict())
-        elif hasattr(item, "__dict__"):
-            messages.append({k: v for k, v in item.__dict__.items() if not k.startswith("_")})
-        else:
-            messages.append({"value": item})
+    # 한 대화의 레코드는 모두 같은 타입이므로 변환 함수를 한 번만 고름
+    messages = list(map(_pick_converter(records[0]), records)) if records else []
 
     return ConversationListResponse(
         user_id=user_id,
@@ -9,45 +9,102 @@ from __future__ import annotations
 import fnmatch
 import json
 import logging
-from datetime import datetime
+import time
 from typing import Any
 
 import redis.asyncio as aioredis
 from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import RedisError
 
+from core.clock import utc_now_iso
 from core.config import settings
 
 logger = logging.getLogger(__name__)
 
 
 class AsyncMemoryCache:
-    """In-memory substitute for Redis used when a real instance is unavailable."""
+    """
+    In-memory substitute for Redis used when a real instance is unavailable.
+
+    TTL은 조회 시점에 만료 여부를 확인하는 방식(lazy expiration)으로 처리합니다.
+    """
 
     def __init__(self) -> None:
         self._store: dict[str, Any] = {}
+        self._expires_at: dict[str, float] = {}
+
+    def _alive(self, key: str) -> bool:
+        expires_at = self._expires_at.get(key)
+        if expires_at is not None and expires_at <= time.monotonic():
+            self._store.pop(key, None)
+            del self._expires_at[key]
+            return False
+        return key in self._store
 
     async def ping(self) -> bool:
         return True
 
     async def get(self, key: str) -> str | None:
-        value = self._store.get(key)
-        return None if value is None else str(value)
+        if not self._alive(key):
+            return None
+        return str(self._store[key])
 
-    async def setex(self, key: str, _ttl: int, value: str) -> None:
+    async def setex(self, key: str, ttl: int, value: str) -> None:
         self._store[key] = value
+        self._expires_at[key] = time.monotonic() + ttl
+
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        return [str(self._store[key]) if self._alive(key) else None for key in keys]
+
+    async def set(self, key: str, value: str, *, nx: bool = False, ex: int | None = None) -> bool | None:
+        if nx and self._alive(key):
+            return None
+        self._store[key] = value
+        if ex is None:
+            self._expires_at.pop(key, None)
+        else:
+            self._expires_at[key] = time.monotonic() + ex
+        return True
+
+    async def hset(self, key: str, *, mapping: dict[str, Any]) -> int:
+        current = self._store[key] if self._alive(key) else {}
+        added = sum(1 for field in mapping if field not in current)
+        self._store[key] = {**current, **{field: str(value) for field, value in mapping.items()}}
+        return added
+
+    async def hgetall(self, key: str) -> dict[str, str]:
+        return dict(self._store[key]) if self._alive(key) else {}
 
     async def delete(self, key: str) -> int:
+        self._expires_at.pop(key, None)
         return 1 if self._store.pop(key, None) is not None else 0
 
     async def keys(self, pattern: str) -> list[str]:
-        return [key for key in self._store if fnmatch.fnmatch(key, pattern)]
+        return [key for key in list(self._store) if self._alive(key) and fnmatch.fnmatch(key, pattern)]
 
     async def incrby(self, key: str, amount: int = 1) -> int:
-        new_value = int(self._store.get(key, 0)) + amount
+        current = self._store[key] if self._alive(key) else 0
+        new_value = int(current) + amount
         self._store[key] = new_value
         return new_value
 
-    async def expire(self, _key: str, _ttl: int) -> bool:
+    async def expire(self, key: str, ttl: int) -> bool:
+        if not self._alive(key):
+            return False
+        self._expires_at[key] = time.monotonic() + ttl
+        return True
+
+    async def replace_if_equal(self, key: str, expected: str, value: str, *, ex: int) -> bool:
+        # 이벤트 루프 하나에서 await 없이 비교/교체하므로 그대로 원자적
+        if not self._alive(key) or str(self._store[key]) != expected:
+            return False
+        await self.set(key, value, ex=ex)
+        return True
+
+    async def delete_if_equal(self, key: str, expected: str) -> bool:
+        if not self._alive(key) or str(self._store[key]) != expected:
+            return False
+        await self.delete(key)
         return True
 
     async def close(self) -> None:  # pragma: no cover - nothing to close
@@ -70,6 +127,7 @@ class RedisManager:
                 encoding="utf-8",
                 decode_responses=True,
                 password=settings.REDIS_PASSWORD,
+                max_connections=settings.REDIS_MAX_CONNECTIONS,
             )
             await self._redis.ping()
             logger.info("Connected to Redis at %s", settings.REDIS_URL)
@@ -128,6 +186,60 @@ async def get_cache_manager():
     return cache_manager
 
 
+# 지식 베이스 세대 번호 (데이터 적재/초기화 시 증가, 응답/검색 캐시 무효화 기준)
+KNOWLEDGE_GENERATION_KEY = "kb:generation"
+
+
+async def get_knowledge_generation() -> int:
+    """현재 지식 베이스 세대 번호 (Redis 오류 시 0)."""
+    try:
+        client = await redis_manager.get_redis()
+        return int(await client.get(KNOWLEDGE_GENERATION_KEY) or 0)
+    except RedisError as exc:
+        logger.warning("Knowledge generation lookup failed: %s", exc)
+        return 0
+
+
+async def bump_knowledge_generation() -> int:
+    """지식 베이스 세대 번호 증가 (모든 워커의 지식 기반 캐시를 무효화)."""
+    try:
+        client = await redis_manager.get_redis()
+        return int(await client.incrby(KNOWLEDGE_GENERATION_KEY, 1))
+    except RedisError as exc:
+        logger.warning("Knowledge generation bump failed: %s", exc)
+        return 0
+
+
+# 잠금 소유자 확인과 교체/해제를 한 번에 실행하는 Lua 스크립트 (GET 후 SET/DEL 사이의 경합 방지)
+_REPLACE_IF_EQUAL_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+    return 1
+end
+return 0
+"""
+_DELETE_IF_EQUAL_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+async def replace_if_equal(client, key: str, expected: str, value: str, *, ex: int) -> bool:
+    """key 값이 expected일 때만 value로 원자적으로 교체 (compare-and-set)."""
+    if isinstance(client, AsyncMemoryCache):
+        return await client.replace_if_equal(key, expected, value, ex=ex)
+    return bool(await client.eval(_REPLACE_IF_EQUAL_SCRIPT, 1, key, expected, value, ex))
+
+
+async def delete_if_equal(client, key: str, expected: str) -> bool:
+    """key 값이 expected일 때만 원자적으로 삭제 (다른 소유자의 잠금은 건드리지 않음)."""
+    if isinstance(client, AsyncMemoryCache):
+        return await client.delete_if_equal(key, expected)
+    return bool(await client.eval(_DELETE_IF_EQUAL_SCRIPT, 1, key, expected))
+
+
 async def initialize_cache():
     """Initialize Redis/cache connection."""
     await redis_manager.initialize()
@@ -144,7 +256,7 @@ async def cache_health_check() -> dict[str, Any]:
     alive = bool(await client.ping())
     return {
         "redis": {"status": alive, "url": settings.REDIS_URL},
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": utc_now_iso(),
     }
 
 
@@ -0,0 +1,45 @@
+"""
+타임스탬프 헬퍼.
+
+헬스 체크처럼 자주 호출되지만 초 단위 정밀도면 충분한 응답용 타임스탬프를
+초당 한 번만 포맷하고 재사용합니다.
+마이크로초 정밀도가 필요한 저장용 타임스탬프는 datetime 객체 없이 time_ns로 포맷합니다.
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import UTC, datetime
+
+
+class _SecondCache:
+    """마지막으로 포맷한 초와 그 ISO 문자열."""
+
+    __slots__ = ("iso", "second")
+
+    def __init__(self) -> None:
+        self.second = -1
+        self.iso = ""
+
+
+_second_cache = _SecondCache()
+
+
+def utc_now_iso() -> str:
+    """현재 UTC 시각 ISO 8601 문자열 (초 단위, 같은 초 안에서는 캐시된 문자열 반환)."""
+    cache = _second_cache
+    now = int(time.time())
+    if now != cache.second:
+        cache.iso = datetime.fromtimestamp(now, tz=UTC).isoformat()
+        cache.second = now
+    return cache.iso
+
+
+def utc_now_iso_precise() -> str:
+    """
+    현재 UTC 시각 ISO 8601 문자열 (마이크로초, tz 표기 없음).
+
+    datetime.utcnow().isoformat()과 같은 형식이지만 datetime 객체를 만들지 않습니다.
+    """
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    return f"{time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds))}.{nanos // 1000:06d}"
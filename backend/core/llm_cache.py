@@ -0,0 +1,229 @@
+"""
+LLM/임베딩 호출 결과 캐시.
+
+- LRUCache: 정확히 같은 입력에 대한 in-process LRU 캐시
+- SemanticCache: 임베딩 코사인 유사도 기반 in-process 캐시
+- CentroidCache: 유사 질의를 클러스터로 묶는 centroid 기반 시맨틱 캐시
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import Hashable, Sequence
+from typing import Any
+
+import numpy as np
+
+# 단위 벡터 int8 양자화 스케일
+_INT8_SCALE = 127.0
+
+
+def prompt_key(*parts: str | None) -> str:
+    """프롬프트 문자열 조합의 캐시 키 (긴 시스템 프롬프트도 고정 길이로)."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update((part or "").encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+class LRUCache:
+    """
+    OrderedDict 기반 LRU 캐시.
+
+    이벤트 루프 단일 스레드에서만 접근하므로 별도 락은 두지 않습니다.
+    """
+
+    def __init__(self, maxsize: int = 2048) -> None:
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Any | None:
+        try:
+            value = self._data[key]
+        except KeyError:
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+class SemanticCache:
+    """
+    임베딩 코사인 유사도 기반 in-process 시맨틱 캐시.
+
+    정규화된 임베딩을 int8로 양자화(x127)한 (N, dim) 행렬에 저장하고(float32 대비 1/4 메모리),
+    내적 한 번으로 top-1 유사도를 계산해 임계값 이상이면 캐시된 값을 반환합니다.
+    단위 벡터는 성분이 [-1, 1]이므로 스케일 하나로 코사인 오차가 0.01 미만입니다.
+    가득 차면 가장 오래된 항목부터 덮어쓰며, TTL이 지난 항목은 조회에서 제외됩니다.
+    """
+
+    def __init__(
+        self,
+        dim: int,
+        *,
+        threshold: float = 0.86,
+        max_entries: int = 2048,
+        ttl: int = 3600,
+    ) -> None:
+        self.dim = dim
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl = ttl
+
+        self._vectors = np.zeros((max_entries, dim), dtype=np.int8)
+        self._stored_at = np.zeros(max_entries, dtype=np.float64)
+        self._values: list[Any] = [None] * max_entries
+        self._cursor = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _normalize(self, vector: Sequence[float] | np.ndarray) -> np.ndarray | None:
+        """차원이 다르거나 영벡터면 None (다른 차원의 임베딩은 캐시하지 않음)."""
+        arr = np.asarray(vector, dtype=np.float32)
+        if arr.shape != (self.dim,):
+            return None
+        norm = float(np.linalg.norm(arr))
+        if norm == 0.0:
+            return None
+        return arr / norm
+
+    def lookup(self, vector: Sequence[float] | np.ndarray) -> Any | None:
+        """유사도가 임계값 이상인 캐시 항목 반환 (없으면 None)."""
+        if self._size == 0:
+            return None
+
+        query = self._normalize(vector)
+        if query is None:
+            return None
+
+        scores = (self._vectors[: self._size].astype(np.float32) @ query) / _INT8_SCALE
+        expired = self._stored_at[: self._size] < time.monotonic() - self.ttl
+        scores[expired] = -1.0
+
+        best = int(np.argmax(scores))
+        if scores[best] < self.threshold:
+            return None
+        return self._values[best]
+
+    def store(self, vector: Sequence[float] | np.ndarray, value: Any) -> None:
+        """캐시에 항목 추가 (가득 차면 가장 오래된 슬롯을 덮어씀)."""
+        normalized = self._normalize(vector)
+        if normalized is None:
+            return
+
+        slot = self._cursor
+        self._vectors[slot] = np.round(normalized * _INT8_SCALE).astype(np.int8)
+        self._stored_at[slot] = time.monotonic()
+        self._values[slot] = value
+
+        self._cursor = (slot + 1) % self.max_entries
+        self._size = min(self._size + 1, self.max_entries)
+
+    def clear(self) -> None:
+        self._values = [None] * self.max_entries
+        self._cursor = 0
+        self._size = 0
+
+
+class CentroidCache:
+    """
+    Centroid 기반 시맨틱 캐시.
+
+    유사한 질의들을 하나의 클러스터(centroid, 응답, 적중 수)로 묶습니다.
+    적중 시 질의 임베딩을 클러스터에 합쳐 centroid를 멤버 평균으로 갱신하고,
+    미스 시 새 클러스터를 만듭니다. 가득 차면 적중 수가 가장 적은 클러스터를 교체합니다.
+    """
+
+    def __init__(
+        self,
+        dim: int,
+        *,
+        threshold: float = 0.95,
+        max_clusters: int = 1024,
+        ttl: int = 3600,
+    ) -> None:
+        self.dim = dim
+        self.threshold = threshold
+        self.max_clusters = max_clusters
+        self.ttl = ttl
+
+        self._sums = np.zeros((max_clusters, dim), dtype=np.float32)
+        self._centroids = np.zeros((max_clusters, dim), dtype=np.float32)
+        self._hits = np.zeros(max_clusters, dtype=np.int64)
+        self._stored_at = np.zeros(max_clusters, dtype=np.float64)
+        self._values: list[Any] = [None] * max_clusters
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _normalize(self, vector: Sequence[float] | np.ndarray) -> np.ndarray | None:
+        arr = np.asarray(vector, dtype=np.float32)
+        if arr.shape != (self.dim,):
+            return None
+        norm = float(np.linalg.norm(arr))
+        if norm == 0.0:
+            return None
+        return arr / norm
+
+    def lookup(self, vector: Sequence[float] | np.ndarray) -> Any | None:
+        """가장 가까운 centroid가 임계값 이상이면 해당 클러스터의 응답 반환."""
+        if self._size == 0:
+            return None
+
+        query = self._normalize(vector)
+        if query is None:
+            return None
+
+        scores = self._centroids[: self._size] @ query
+        expired = self._stored_at[: self._size] < time.monotonic() - self.ttl
+        scores[expired] = -1.0
+
+        best = int(np.argmax(scores))
+        if scores[best] < self.threshold:
+            return None
+
+        # centroid = 멤버 임베딩 평균 (정규화)
+        self._hits[best] += 1
+        self._sums[best] += query
+        self._centroids[best] = self._sums[best] / np.linalg.norm(self._sums[best])
+        return self._values[best]
+
+    def store(self, vector: Sequence[float] | np.ndarray, value: Any) -> None:
+        """새 클러스터 생성 (가득 차면 만료되었거나 적중 수가 가장 적은 클러스터 교체)."""
+        normalized = self._normalize(vector)
+        if normalized is None:
+            return
+
+        if self._size < self.max_clusters:
+            slot = self._size
+            self._size += 1
+        else:
+            expired = self._stored_at < time.monotonic() - self.ttl
+            slot = int(np.argmax(expired)) if expired.any() else int(np.argmin(self._hits))
+
+        self._sums[slot] = normalized
+        self._centroids[slot] = normalized
+        self._hits[slot] = 0
+        self._stored_at[slot] = time.monotonic()
+        self._values[slot] = value
+
+    def clear(self) -> None:
+        self._values = [None] * self.max_clusters
+        self._size = 0
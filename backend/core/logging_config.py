@@ -0,0 +1,95 @@
+"""
+로깅 설정.
+
+핸들러 I/O와 포맷팅(특히 traceback 문자열 생성)을 이벤트 루프 스레드에서 하지 않도록
+QueueHandler로 레코드만 큐에 넣고, QueueListener 스레드에서 포맷/출력합니다.
+uvicorn 로거도 루트 로거로 전달해 애플리케이션 로그와 같은 포맷터 하나만 사용합니다.
+"""
+
+from __future__ import annotations
+
+import atexit
+import copy
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+import orjson
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+_UVICORN_LOGGERS = ("uvicorn", "uvicorn.error", "uvicorn.access")
+
+
+class _LoggingState:
+    """setup_logging이 시작한 QueueListener (한 번만 설정하기 위한 보관용)."""
+
+    __slots__ = ("listener",)
+
+    def __init__(self) -> None:
+        self.listener: QueueListener | None = None
+
+
+_state = _LoggingState()
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """
+    traceback 포맷만 리스너 스레드로 미루는 QueueHandler.
+
+    기본 QueueHandler.prepare()는 호출 스레드에서 메시지와 traceback을 모두 포맷하므로 재정의합니다.
+    `msg % args`는 호출 시점에 합쳐 두어, 로그 이후 변경되는 가변 인자나 스레드 간에 안전하지 않은
+    객체의 __str__이 리스너 스레드에서 평가되지 않도록 합니다.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄 JSON 로그 포맷터 (orjson 직렬화)."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return orjson.dumps(payload).decode()
+
+
+def setup_logging(level: str = "INFO", *, json: bool = False) -> None:
+    """루트 로거를 큐 기반 비동기 로깅으로 설정 (여러 번 호출해도 한 번만 적용)."""
+    if _state.listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(JsonFormatter() if json else logging.Formatter(LOG_FORMAT))
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    root = logging.getLogger()
+    root.handlers = [_DeferredQueueHandler(log_queue)]
+    root.setLevel(getattr(logging, level.upper(), logging.INFO))
+
+    # uvicorn이 설정한 자체 핸들러/포맷터 대신 루트 큐 핸들러를 거치도록 전달
+    for name in _UVICORN_LOGGERS:
+        uvicorn_logger = logging.getLogger(name)
+        uvicorn_logger.handlers = []
+        uvicorn_logger.propagate = True
+
+    _state.listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _state.listener.start()
+    atexit.register(stop_logging)
+
+
+def stop_logging() -> None:
+    """큐에 남은 레코드를 모두 출력하고 리스너 스레드 종료."""
+    if _state.listener is not None:
+        _state.listener.stop()
+        _state.listener = None
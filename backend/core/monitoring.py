@@ -35,14 +35,14 @@ class CloudWatchMetrics:
 
             self._cloudwatch_client = boto3.client("cloudwatch", region_name=region)
             self._enabled = True
-            logger.info(f"CloudWatch metrics enabled (namespace: {namespace})")
+            logger.info("CloudWatch metrics enabled (namespace: %s)", namespace)
         except ImportError:
             logger.warning(
                 "boto3 not installed. CloudWatch metrics disabled. "
                 "Install with: pip install boto3"
             )
         except Exception as e:
-            logger.warning(f"Failed to initialize CloudWatch client: {e}")
+            logger.warning("Failed to initialize CloudWatch client: %s", e)
 
     def put_metric(
         self,
@@ -87,7 +87,7 @@ class CloudWatchMetrics:
             return True
 
         except Exception as e:
-            logger.error(f"Failed to send metric to CloudWatch: {e}")
+            logger.error("Failed to send metric to CloudWatch: %s", e)
             return False
 
     def track_documents_processed(self, count: int, job_id: str | None = None) -> bool:
@@ -266,12 +266,12 @@ class MetricsAggregator:
                 MetricData=self._metrics_buffer,
             )
 
-            logger.info(f"Flushed {len(self._metrics_buffer)} metrics to CloudWatch")
+            logger.info("Flushed %s metrics to CloudWatch", len(self._metrics_buffer))
             self._metrics_buffer.clear()
             self._last_flush = datetime.utcnow()
 
             return True
 
         except Exception as e:
-            logger.error(f"Failed to flush metrics to CloudWatch: {e}")
+            logger.error("Failed to flush metrics to CloudWatch: %s", e)
             return False
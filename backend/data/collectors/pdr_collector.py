@@ -209,7 +209,7 @@ class PublicDataReaderCollector:
         trade_type: str,
     ) -> pd.DataFrame | None:
         """비동기 래퍼 - ThreadPoolExecutor에서 동기 함수 실행."""
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(
             self._executor,
             self._fetch_data_sync,
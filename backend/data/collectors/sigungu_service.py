@@ -10,6 +10,7 @@ from __future__ import annotations
 import json
 from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
 
 
@@ -75,6 +76,11 @@ class SigunguService:
         """Return an iterable of all known sigungu entries."""
         return self._sigungu_by_code.values()
 
+    @cached_property
+    def sigungu_list(self) -> tuple[SigunguInfo, ...]:
+        """All sigungu entries materialized once (for len()/slicing without re-listing)."""
+        return tuple(self._sigungu_by_code.values())
+
     def get_by_code(self, code: str) -> SigunguInfo | None:
         """Look up sigungu metadata using the 5-digit administrative code."""
         return self._sigungu_by_code.get(str(code).zfill(5))
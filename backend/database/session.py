@@ -11,16 +11,39 @@ from typing import TYPE_CHECKING
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from core.config import settings
+from core.config import get_environment_config, settings
 
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncEngine
 
 logger = logging.getLogger(__name__)
 
+
+class _DatabaseState:
+    """프로세스 공유 엔진과 세션 메이커 (처음 사용할 때 생성)."""
+
+    __slots__ = ("engine", "session_maker")
+
+    def __init__(self) -> None:
+        self.engine: AsyncEngine | None = None
+        self.session_maker: async_sessionmaker[AsyncSession] | None = None
+
+
 # Global engine instance
-_engine: AsyncEngine | None = None
-_session_maker: async_sessionmaker[AsyncSession] | None = None
+_db = _DatabaseState()
+
+
+def _pool_size() -> int:
+    """
+    워커당 커넥션 풀 크기.
+
+    uvicorn 워커마다 엔진(풀)이 따로 생기므로, 명시하지 않으면
+    전체 연결 상한을 워커 수로 나눠 Postgres max_connections를 넘지 않도록 합니다.
+    """
+    if settings.DATABASE_POOL_SIZE > 0:
+        return settings.DATABASE_POOL_SIZE
+    workers = max(1, get_environment_config()["workers"])
+    return max(5, settings.DATABASE_MAX_CONNECTIONS // workers)
 
 
 def get_engine() -> AsyncEngine:
@@ -30,21 +53,21 @@ def get_engine() -> AsyncEngine:
     Returns:
         AsyncEngine instance
     """
-    global _engine
-    if _engine is None:
+    if _db.engine is None:
         if not settings.DATABASE_URL:
             raise ValueError("DATABASE_URL not configured")
 
-        _engine = create_async_engine(
+        _db.engine = create_async_engine(
             settings.DATABASE_URL,
             echo=settings.DATABASE_ECHO,
-            pool_size=settings.DATABASE_POOL_SIZE,
+            pool_size=_pool_size(),
             max_overflow=settings.DATABASE_MAX_OVERFLOW,
             pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+            pool_recycle=settings.DATABASE_POOL_RECYCLE,
             pool_pre_ping=True,  # Verify connections before using
         )
-        logger.info("PostgreSQL engine created")
-    return _engine
+        logger.info("PostgreSQL engine created (pool_size=%d)", _db.engine.pool.size())
+    return _db.engine
 
 
 def get_session_maker() -> async_sessionmaker[AsyncSession]:
@@ -54,10 +77,9 @@ def get_session_maker() -> async_sessionmaker[AsyncSession]:
     Returns:
         async_sessionmaker instance
     """
-    global _session_maker
-    if _session_maker is None:
+    if _db.session_maker is None:
         engine = get_engine()
-        _session_maker = async_sessionmaker(
+        _db.session_maker = async_sessionmaker(
             engine,
             class_=AsyncSession,
             expire_on_commit=False,
@@ -65,7 +87,7 @@ def get_session_maker() -> async_sessionmaker[AsyncSession]:
             autocommit=False,
         )
         logger.info("Session maker created")
-    return _session_maker
+    return _db.session_maker
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -107,10 +129,8 @@ async def init_db() -> None:
 
 async def close_db() -> None:
     """데이터베이스 연결 종료."""
-    global _engine, _session_maker
-
-    if _engine is not None:
-        await _engine.dispose()
-        _engine = None
-        _session_maker = None
+    if _db.engine is not None:
+        await _db.engine.dispose()
+        _db.engine = None
+        _db.session_maker = None
         logger.info("Database connections closed")
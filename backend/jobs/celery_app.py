@@ -42,6 +42,10 @@ celery_app.conf.update(
         "visibility_timeout": 3600,
     },
 
+    # 작업 완료 후 ack: worker가 죽으면 브로커가 작업을 다른 worker로 재전달
+    task_acks_late=True,
+    task_reject_on_worker_lost=True,
+
     # Worker 설정
     worker_prefetch_multiplier=1,
     worker_max_tasks_per_child=1000,
@@ -51,6 +55,7 @@ celery_app.conf.update(
     task_routes={
         "jobs.tasks.load_data_task": {"queue": "data_loading"},
         "jobs.tasks.cleanup_old_jobs": {"queue": "maintenance"},
+        "jobs.tasks.cleanup_deleted_dir": {"queue": "maintenance"},
     },
 
     # Beat 스케줄 (정기 작업)
@@ -0,0 +1,132 @@
+"""
+Celery 작업 상태 캐시.
+
+Redis keyspace 알림(`__keyspace@<db>__:celery-task-meta-*`)을 구독해 결과 메타가 바뀔 때마다
+한 번만 읽어 프로세스 메모리에 짧게 보관합니다. 상태 조회 API는 폴링 때마다
+Redis를 읽는 대신 이 캐시를 먼저 확인합니다.
+
+Redis 서버에 `notify-keyspace-events`가 K와 $(또는 A)를 포함하도록 설정되어 있어야 합니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from typing import Any
+
+import orjson
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+TASK_META_PREFIX = "celery-task-meta-"
+
+# 구독이 끊겼을 때 재연결 대기 시간 (초, 실패할 때마다 두 배)
+_RECONNECT_BACKOFF_INITIAL = 1.0
+_RECONNECT_BACKOFF_MAX = 30.0
+
+
+class JobStatusWatcher:
+    """keyspace 알림 기반 Celery 결과 메타 TTL 캐시."""
+
+    def __init__(self, redis_url: str, *, password: str | None = None, ttl: float = 30.0) -> None:
+        self._redis_url = redis_url
+        self._password = password
+        self._ttl = ttl
+        self._cache: dict[str, tuple[float, dict[str, Any]]] = {}
+        self._client: aioredis.Redis | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    def get(self, job_id: str) -> dict[str, Any] | None:
+        """캐시된 결과 메타 (status/result/...) 반환, 없거나 만료되면 None."""
+        entry = self._cache.get(job_id)
+        if entry is None:
+            return None
+        expires_at, meta = entry
+        if expires_at <= time.monotonic():
+            del self._cache[job_id]
+            return None
+        return meta
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._client = aioredis.from_url(
+            self._redis_url,
+            decode_responses=True,
+            password=self._password,
+        )
+        pubsub = await self._subscribe()
+        self._task = asyncio.create_task(self._listen(pubsub))
+
+    async def _subscribe(self) -> aioredis.client.PubSub:
+        pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+        db = self._client.connection_pool.connection_kwargs.get("db", 0)
+        try:
+            await pubsub.psubscribe(f"__keyspace@{db}__:{TASK_META_PREFIX}*")
+        except RedisError:
+            with contextlib.suppress(RedisError):
+                await pubsub.aclose()
+            raise
+        logger.info("Job status watcher subscribed to keyspace notifications (db=%s)", db)
+        return pubsub
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+        self._cache.clear()
+
+    async def _listen(self, pubsub: aioredis.client.PubSub) -> None:
+        """알림을 처리하고, Redis 오류로 끊기면 백오프하며 다시 구독."""
+        backoff = _RECONNECT_BACKOFF_INITIAL
+        while True:
+            try:
+                async for message in pubsub.listen():
+                    # SET/SETEX 모두 "set" 이벤트를 발생시킴 (만료/삭제 이벤트는 무시)
+                    if message["type"] != "pmessage" or message["data"] != "set":
+                        continue
+                    key = message["channel"].split(":", 1)[1]
+                    await self._refresh(key)
+            except RedisError as exc:
+                logger.warning("Job status watcher disconnected: %s", exc)
+            finally:
+                with contextlib.suppress(RedisError):
+                    await pubsub.aclose()
+
+            # 끊긴 동안의 알림은 놓치므로 캐시를 비워 조회가 백엔드로 가도록 함
+            self._cache.clear()
+            while True:
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, _RECONNECT_BACKOFF_MAX)
+                try:
+                    pubsub = await self._subscribe()
+                except RedisError as exc:
+                    logger.warning("Job status watcher reconnect failed: %s", exc)
+                    continue
+                backoff = _RECONNECT_BACKOFF_INITIAL
+                break
+
+    async def _refresh(self, key: str) -> None:
+        raw = await self._client.get(key)
+        if raw is None:
+            return
+        self._prune()
+        self._cache[key.removeprefix(TASK_META_PREFIX)] = (
+            time.monotonic() + self._ttl,
+            orjson.loads(raw),
+        )
+
+    def _prune(self) -> None:
+        now = time.monotonic()
+        expired = [job_id for job_id, (expires_at, _) in self._cache.items() if expires_at <= now]
+        for job_id in expired:
+            del self._cache[job_id]
@@ -12,13 +12,24 @@ Celery tasks for background job processing.
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
+import shutil
 import time
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 
 from celery import Task
-
+from celery.signals import worker_process_init, worker_process_shutdown
+from redis.exceptions import RedisError
+
+from core.cache import (
+    bump_knowledge_generation,
+    delete_if_equal,
+    get_knowledge_generation,
+    get_redis_client,
+)
 from core.config import settings
 from data.collectors.real_estate_collector import RealEstateCollector
 from data.collectors.sigungu_service import SigunguServiceSingleton
@@ -90,6 +101,12 @@ class RedisCheckpointService:
         return 0
 
 
+@functools.cache
+def get_checkpoint_service() -> RedisCheckpointService:
+    """프로세스 공유 체크포인트 서비스 (태스크/콜백마다 Redis 커넥션 풀을 새로 만들지 않도록)."""
+    return RedisCheckpointService()
+
+
 class CallbackTask(Task):
     """
     Base task with callback support and error handling.
@@ -105,7 +122,7 @@ class CallbackTask(Task):
         """Task 성공 시 호출"""
         logger.info(f"Task {task_id} completed successfully")
         # 체크포인트 삭제
-        checkpoint_service = RedisCheckpointService()
+        checkpoint_service = get_checkpoint_service()
         checkpoint_service.clear_checkpoint(task_id)
 
 
@@ -204,6 +221,94 @@ def get_event_loop() -> asyncio.AbstractEventLoop:
         return loop
 
 
+# 워커 프로세스 단위로 재사용하는 서비스. 첫 태스크에서 생성합니다.
+class _WorkerState:
+    """워커 프로세스가 공유하는 AIService/LightRAGService와 생성 시점의 지식 베이스 세대."""
+
+    __slots__ = ("generation", "services")
+
+    def __init__(self) -> None:
+        self.services: tuple[AIService, LightRAGService] | None = None
+        self.generation = 0
+
+
+_worker_state = _WorkerState()
+
+
+async def _get_worker_services() -> tuple[AIService, LightRAGService]:
+    """
+    프로세스 공유 AIService/LightRAGService 반환 (없으면 초기화).
+
+    /admin/clear-data가 작업 디렉터리를 교체하면 kb:generation이 바뀌므로,
+    그 뒤의 첫 태스크에서 LightRAG 인스턴스를 새로 만듭니다.
+    """
+    generation = await get_knowledge_generation()
+    ai_service: AIService | None = None
+    if _worker_state.services is not None:
+        if generation == _worker_state.generation:
+            return _worker_state.services
+        # 이전 인스턴스는 finalize하지 않고 버림: insert마다 이미 저장소에 반영됐고,
+        # finalize하면 메모리에 남은 옛 그래프/KV를 새 작업 디렉터리에 다시 씀
+        ai_service, _ = _worker_state.services
+        _worker_state.services = None
+        logger.info(
+            "Knowledge base generation changed (%d -> %d), rebuilding LightRAG",
+            _worker_state.generation,
+            generation,
+        )
+
+    if ai_service is None:
+        ai_service = AIService()
+        await ai_service.initialize()
+
+    lightrag_service = LightRAGService(ai_service=ai_service)
+    await lightrag_service.initialize()
+
+    _worker_state.services = (ai_service, lightrag_service)
+    _worker_state.generation = generation
+    return _worker_state.services
+
+
+async def _close_worker_services() -> None:
+    if _worker_state.services is None:
+        return
+    ai_service, lightrag_service = _worker_state.services
+    _worker_state.services = None
+    # 마지막 태스크 이후 데이터가 초기화됐으면 옛 데이터를 쓰지 않도록 finalize 생략
+    if await get_knowledge_generation() == _worker_state.generation:
+        await lightrag_service.finalize()
+    await ai_service.close()
+
+
+@worker_process_init.connect
+def _init_worker_process(**_: Any) -> None:
+    """
+    워커 프로세스 시작 시 시군구 목록만 미리 로드.
+
+    Celery는 이 핸들러가 worker_proc_alive_timeout(기본 4초) 안에 끝나지 않으면
+    자식 프로세스를 종료하므로, 네트워크를 타는 AI/LightRAG 초기화는 첫 태스크로 미룹니다.
+    """
+    SigunguServiceSingleton.sigungu_list  # noqa: B018 - cached_property 워밍
+
+
+@worker_process_shutdown.connect
+def _shutdown_worker_process(**_: Any) -> None:
+    if _worker_state.services is not None:
+        get_event_loop().run_until_complete(_close_worker_services())
+
+
+# /admin/load-data가 작업 ID로 잡는 중복 실행 방지 잠금 (작업이 끝나면 worker가 해제)
+LOAD_LOCK_KEY = "admin:loadlock"
+
+
+async def _release_load_lock(task_id: str) -> None:
+    """이 작업이 쥔 /admin/load-data 잠금 해제 (다른 작업이 잡은 잠금이면 그대로 둠)."""
+    try:
+        await delete_if_equal(await get_redis_client(), LOAD_LOCK_KEY, task_id)
+    except RedisError as e:
+        logger.warning("Failed to release load lock for %s: %s", task_id, e)
+
+
 @celery_app.task(
     bind=True,
     base=CallbackTask,
@@ -216,6 +321,7 @@ def get_event_loop() -> asyncio.AbstractEventLoop:
 )
 def load_data_task(
     self,
+    *,
     mode: str = "sample",
     districts: list[str] | None = None,
     year_month: str | None = None,
@@ -244,7 +350,7 @@ def load_data_task(
     async def _run_data_loading():
         nonlocal districts, property_types, max_records
         task_id = self.request.id
-        checkpoint_service = RedisCheckpointService()
+        checkpoint_service = get_checkpoint_service()
 
         # 체크포인트 로드 (이전 실행이 있으면 재개)
         checkpoint = checkpoint_service.load_checkpoint(task_id)
@@ -258,13 +364,8 @@ def load_data_task(
             districts_complete = checkpoint.get("districts_complete", False)
             logger.info(f"Resuming from checkpoint: {start_count} documents already processed")
 
-        # 서비스 초기화
-        logger.info("Initializing services...")
-        ai_service = AIService()
-        await ai_service.initialize()
-
-        lightrag_service = LightRAGService(ai_service=ai_service)
-        await lightrag_service.initialize()
+        # 워커 프로세스 공유 서비스 사용 (없으면 이때 초기화)
+        _, lightrag_service = await _get_worker_services()
 
         start_time = time.time()
         total_loaded = start_count
@@ -276,7 +377,7 @@ def load_data_task(
                 logger.info("Loading district data...")
                 district_count = 0
 
-                for sigungu_info in SigunguServiceSingleton.all_sigungu():
+                for sigungu_info in SigunguServiceSingleton.sigungu_list:
                     doc_id = f"district_{sigungu_info.sigungu_code}"
 
                     if doc_id in processed_ids:
@@ -403,7 +504,11 @@ def load_data_task(
             finally:
                 await collector.close()
 
-            # 완료
+            # 완료 (API 워커들의 응답/검색 캐시가 새 데이터를 기준으로 다시 채워지도록)
+            # 이 워커의 LightRAG는 방금 쓴 데이터를 갖고 있으므로 새 세대로 기록해 재생성하지 않음
+            generation = await bump_knowledge_generation()
+            if generation:
+                _worker_state.generation = generation
             elapsed = time.time() - start_time
             logger.info(f"Data loading completed: {total_loaded} documents in {elapsed:.1f}s")
 
@@ -432,13 +537,12 @@ def load_data_task(
 
             raise
 
-        finally:
-            await lightrag_service.finalize()
-            await ai_service.close()
-
     # asyncio 이벤트 루프에서 실행
     loop = get_event_loop()
-    return loop.run_until_complete(_run_data_loading())
+    try:
+        return loop.run_until_complete(_run_data_loading())
+    finally:
+        loop.run_until_complete(_release_load_lock(self.request.id))
 
 
 @celery_app.task(name="jobs.tasks.cleanup_old_jobs")
@@ -451,7 +555,7 @@ def cleanup_old_jobs() -> dict[str, Any]:
     """
     logger.info("Cleaning up old job checkpoints...")
 
-    checkpoint_service = RedisCheckpointService()
+    checkpoint_service = get_checkpoint_service()
     deleted_count = checkpoint_service.cleanup_old_checkpoints(max_age_hours=168)  # 7 days
 
     return {
@@ -461,6 +565,42 @@ def cleanup_old_jobs() -> dict[str, Any]:
     }
 
 
+# /admin/clear-data가 작업 디렉토리를 옮길 때 이름에 붙이는 표식
+DELETED_DIR_MARKER = ".deleting-"
+
+
+def remove_deleted_dir(path: str | Path) -> bool:
+    """
+    /admin/clear-data가 옮겨 둔 디렉토리만 삭제.
+
+    심볼릭 링크를 풀어 LIGHTRAG_WORKING_DIR의 직속 하위이고 이름에 DELETED_DIR_MARKER가
+    들어 있는 디렉토리가 아니면 지우지 않습니다.
+    """
+    target = Path(path).resolve()
+    root = Path(settings.LIGHTRAG_WORKING_DIR).resolve()
+    if target.parent != root or DELETED_DIR_MARKER not in target.name:
+        logger.error("Refusing to remove unexpected path: %s", path)
+        return False
+    logger.info("Removing deleted directory: %s", target)
+    shutil.rmtree(target, ignore_errors=True)
+    return True
+
+
+@celery_app.task(name="jobs.tasks.cleanup_deleted_dir")
+def cleanup_deleted_dir(path: str) -> dict[str, Any]:
+    """
+    이름이 바뀐 삭제 대상 디렉토리를 지웁니다 (/admin/clear-data 후처리).
+
+    Args:
+        path: 삭제할 디렉토리 경로 (API와 worker가 같은 볼륨을 공유)
+
+    Returns:
+        정리 결과
+    """
+    status = "success" if remove_deleted_dir(path) else "rejected"
+    return {"status": status, "path": path}
+
+
 @celery_app.task(bind=True, name="jobs.tasks.test_task")
 def test_task(self, duration: int = 10) -> dict[str, Any]:
     """
@@ -11,7 +11,6 @@ Usage:
 from __future__ import annotations
 
 import asyncio
-import sys
 
 import typer
 from rich.console import Console
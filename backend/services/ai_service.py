@@ -6,18 +6,163 @@ Supports both Anthropic Direct API and AWS Bedrock.
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import hashlib
-import json
 import logging
-from typing import Any, Literal
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Literal
 
 import numpy as np
-from anthropic import Anthropic
-
+import orjson
+from redis.exceptions import RedisError
+from tenacity import (
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+from core.cache import cache_manager
 from core.config import settings
+from core.llm_cache import CentroidCache, LRUCache, prompt_key
+
+# anthropic SDK는 사용할 provider가 정해진 뒤 클라이언트 생성 시점에 임포트
+if TYPE_CHECKING:
+    import httpx
+    from anthropic import AsyncAnthropic, AsyncAnthropicBedrock
 
 logger = logging.getLogger(__name__)
 
+_SYSTEM_PROMPT = (
+    "당신은 한국 부동산 상담을 돕는 AI 어시스턴트입니다. "
+    "매물 정보, 정부 정책, 시장 데이터를 조합하여 간결하고 명확하게 답변하세요."
+)
+
+# 프롬프트에 포함할 최근 대화 메시지 수
+_MAX_HISTORY_MESSAGES = 6
+
+# 프롬프트에 포함할 LightRAG 검색 컨텍스트 최대 길이
+_KNOWLEDGE_CONTEXT_MAX_CHARS = 12000
+
+
+@lru_cache(maxsize=1)
+def _get_bedrock_runtime_client() -> Any:
+    """
+    프로세스당 한 번만 생성하는 bedrock-runtime 클라이언트.
+
+    boto3 클라이언트 생성(서비스 모델 로드, 엔드포인트/자격 증명 해석)은 수백 ms가 걸리므로
+    AIService 인스턴스(워커 작업, 테스트 스크립트 등)마다 새로 만들지 않고 재사용합니다.
+    정적 키를 세션에 직접 넘겨 자격 증명 체인 탐색을 생략합니다.
+    """
+    import boto3
+    from botocore.config import Config
+
+    session = boto3.session.Session(
+        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+        region_name=settings.AWS_REGION,
+    )
+
+    # 타임아웃 무제한 설정 (복잡한 RAG 쿼리용)
+    # keep-alive + 커넥션 풀로 요청마다 TLS 핸드셰이크를 다시 하지 않도록 함
+    bedrock_config = Config(
+        read_timeout=900,  # 15분
+        connect_timeout=60,
+        tcp_keepalive=True,
+        max_pool_connections=settings.BEDROCK_MAX_POOL_CONNECTIONS,
+        retries={"max_attempts": 3, "mode": "adaptive"},
+    )
+
+    return session.client("bedrock-runtime", config=bedrock_config)
+
+
+# 스로틀링/과부하 응답 (429 Too Many Requests, 503 Service Unavailable, 529 Overloaded)
+_THROTTLE_STATUS_CODES = frozenset({429, 503, 529})
+
+
+def _is_throttled(exc: BaseException) -> bool:
+    return getattr(exc, "status_code", None) in _THROTTLE_STATUS_CODES
+
+
+@retry(
+    retry=retry_if_exception(_is_throttled),
+    wait=wait_random_exponential(multiplier=0.1, max=5),
+    stop=stop_after_attempt(4),
+    reraise=True,
+)
+async def _create_message(client: AsyncAnthropic | AsyncAnthropicBedrock, **kwargs: Any) -> Any:
+    """Claude Messages API 호출 (스로틀링 시 지터 포함 지수 백오프로 재시도)."""
+    return await client.messages.create(**kwargs)
+
+
+def _estimate_tokens(text: str) -> int:
+    """토큰 수 근사치 (한국어 기준 약 2자당 1토큰)."""
+    return len(text) // 2 + 1
+
+
+class EmbeddingBatcher:
+    """
+    동시에 들어온 단건 임베딩 요청을 모아 한 번에 처리하는 배처.
+
+    max_batch_size개가 모이거나 max_wait_ms가 지나면 배치를 처리하고,
+    결과를 각 요청의 future로 돌려줍니다. 같은 텍스트는 배치 내에서 한 번만 처리합니다.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[list[str]], Awaitable[list[list[float] | None]]],
+        *,
+        max_batch_size: int = 25,
+        max_wait_ms: int = 20,
+    ) -> None:
+        self._process_batch = process_batch
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait_ms / 1000
+        self._pending: list[tuple[str, asyncio.Future[list[float] | None]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def submit(self, text: str) -> list[float] | None:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[list[float] | None] = loop.create_future()
+        self._pending.append((text, future))
+
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._max_wait, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        task = asyncio.create_task(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: list[tuple[str, asyncio.Future[list[float] | None]]]) -> None:
+        unique_texts = list(dict.fromkeys(text for text, _ in batch))
+        try:
+            results = dict(zip(unique_texts, await self._process_batch(unique_texts), strict=True))
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for text, future in batch:
+            if not future.done():
+                future.set_result(results.get(text))
+
 
 class AIService:
     """
@@ -29,40 +174,98 @@ class AIService:
     - Priority: Anthropic Direct API > AWS Bedrock
     """
 
-    def __init__(self) -> None:
+    def __init__(self, http_client: httpx.AsyncClient | None = None) -> None:
         self._initialized = False
-        self._anthropic_client: Anthropic | None = None
-        self._bedrock_client: Any = None  # boto3 client
+        self._init_lock = asyncio.Lock()
+        # 앱 공용 httpx 클라이언트 (있으면 SDK가 자체 커넥션 풀을 따로 만들지 않음, 종료는 소유자가 담당)
+        self._http_client = http_client
+        self._anthropic_client: AsyncAnthropic | None = None
+        self._bedrock_client: Any = None  # boto3 client (Titan 임베딩)
+        self._bedrock_claude_client: AsyncAnthropicBedrock | None = None
         self._provider: Literal["anthropic", "bedrock", "none"] = "none"
         self._anthropic_model_id = settings.ANTHROPIC_MODEL_ID
         self._bedrock_model_id = settings.BEDROCK_MODEL_ID
         self._embedding_dim = settings.LIGHTRAG_EMBEDDING_DIM
+        self._embedding_model_id = settings.BEDROCK_EMBEDDING_MODEL_ID
+        self._use_real_embeddings = settings.LIGHTRAG_USE_REAL_EMBEDDINGS
+        self._hash_embedding_warned = False
+        # 요청마다 BaseSettings 속성 조회를 하지 않도록 호출 경로의 설정값을 인스턴스에 보관
+        self._max_tokens = settings.RESPONSE_MAX_TOKENS
+        self._history_token_budget = settings.CONVERSATION_TOKEN_BUDGET
+        # Titan v2 embedding request body with configurable dimensions (256, 512, or 1024)
+        self._titan_body_suffix = b"," + orjson.dumps(
+            {"dimensions": self._embedding_dim, "normalize": True}
+        )[1:]
+        # 동일 입력 재호출 방지 (임베딩은 텍스트 단위, 텍스트 생성은 프롬프트 단위)
+        self._embedding_cache = LRUCache(settings.LLM_CACHE_MAXSIZE)
+        self._text_cache = LRUCache(settings.LLM_CACHE_MAXSIZE)
+        self._answer_cache: CentroidCache | None = None
+        if settings.ANSWER_CACHE_ENABLED:
+            self._answer_cache = CentroidCache(
+                self._embedding_dim,
+                threshold=settings.ANSWER_CACHE_THRESHOLD,
+                max_clusters=settings.ANSWER_CACHE_MAX_CLUSTERS,
+                ttl=settings.SEMANTIC_CACHE_TTL,
+            )
+        self._shared_answer_ttl = settings.ANSWER_SHARED_CACHE_TTL
+        # 지식 베이스 세대 번호 (공유 응답 캐시 키에 포함해 데이터 교체 시 이전 응답을 버림)
+        self.cache_generation = 0
+        self._warmer_task: asyncio.Task[None] | None = None
+        self._embedding_batcher = EmbeddingBatcher(
+            self._embed_titan_batch,
+            max_batch_size=settings.EMBEDDING_BATCH_SIZE,
+            max_wait_ms=settings.EMBEDDING_BATCH_WAIT_MS,
+        )
 
     async def initialize(self) -> None:
         if self._initialized:
             return
 
-        # Detect which provider is configured
-        self._provider = self._detect_provider()
-
-        if self._provider == "anthropic":
-            logger.info("✓ Using Anthropic Direct API")
-        elif self._provider == "bedrock":
-            logger.info("✓ Using AWS Bedrock")
-            await self._initialize_bedrock()
-        else:
-            logger.warning(
-                "No AI provider configured (neither ANTHROPIC_API_KEY nor AWS credentials)"
-            )
+        # 헬스 체크와 기동 초기화가 동시에 들어와도 Bedrock 클라이언트를 한 번만 만들도록 잠금
+        async with self._init_lock:
+            if self._initialized:
+                return
+
+            # Detect which provider is configured
+            self._provider = self._detect_provider()
+
+            if self._provider == "anthropic":
+                logger.info("✓ Using Anthropic Direct API")
+            elif self._provider == "bedrock":
+                logger.info("✓ Using AWS Bedrock")
+                await self._initialize_bedrock()
+            else:
+                logger.warning(
+                    "No AI provider configured (neither ANTHROPIC_API_KEY nor AWS credentials)"
+                )
 
-        self._initialized = True
-        logger.info("AIService initialized")
+            self._initialized = True
+            logger.info("AIService initialized")
 
     async def close(self) -> None:
+        if self._warmer_task is not None:
+            self._warmer_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._warmer_task
+            self._warmer_task = None
         self._initialized = False
-        self._anthropic_client = None
+        # 공용 httpx 클라이언트를 쓰는 경우 SDK close()가 공용 풀을 닫지 않도록 건너뜀
+        if self._anthropic_client is not None:
+            if self._http_client is None:
+                await self._anthropic_client.close()
+            self._anthropic_client = None
+        if self._bedrock_claude_client is not None:
+            if self._http_client is None:
+                await self._bedrock_claude_client.close()
+            self._bedrock_claude_client = None
         self._bedrock_client = None
 
+    def clear_caches(self) -> None:
+        """지식 베이스가 바뀌면 응답/텍스트 캐시 비우기 (임베딩은 텍스트에만 의존하므로 유지)."""
+        self._text_cache.clear()
+        if self._answer_cache is not None:
+            self._answer_cache.clear()
+
     def is_ready(self) -> bool:
         return self._initialized and self._provider != "none"
 
@@ -94,31 +297,44 @@ class AIService:
     async def _initialize_bedrock(self) -> None:
         """Initialize AWS Bedrock client."""
         try:
-            import boto3
-            from botocore.config import Config
-
-            # 타임아웃 무제한 설정 (복잡한 RAG 쿼리용)
-            bedrock_config = Config(
-                read_timeout=900,  # 15분
-                connect_timeout=60,
-                retries={"max_attempts": 3},
+            # 최초 생성은 블로킹(수백 ms)이므로 스레드에서 수행
+            self._bedrock_client = await asyncio.to_thread(_get_bedrock_runtime_client)
+            # Claude 호출은 스레드를 점유하지 않도록 비동기 클라이언트 사용
+            from anthropic import AsyncAnthropicBedrock  # noqa: PLC0415
+
+            self._bedrock_claude_client = AsyncAnthropicBedrock(
+                aws_access_key=settings.AWS_ACCESS_KEY_ID,
+                aws_secret_key=settings.AWS_SECRET_ACCESS_KEY,
+                aws_region=settings.AWS_REGION,
+                timeout=900.0,  # 15분 (복잡한 RAG 쿼리용)
+                max_retries=0,  # 재시도는 _create_message에서 처리
+                http_client=self._http_client,
             )
-
-            self._bedrock_client = boto3.client(
-                service_name="bedrock-runtime",
-                region_name=settings.AWS_REGION,
-                aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-                aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-                config=bedrock_config,
-            )
-            logger.info(f"AWS Bedrock client initialized (region: {settings.AWS_REGION})")
+            logger.info("AWS Bedrock client initialized (region: %s)", settings.AWS_REGION)
+            # 공용 httpx 클라이언트가 있을 때만 (Claude 호출이 쓰는 바로 그 풀을 데움)
+            if settings.BEDROCK_KEEPALIVE_INTERVAL > 0 and self._http_client is not None:
+                self._warmer_task = asyncio.create_task(self._keep_connection_warm())
         except ImportError:
             logger.error("boto3 not installed. Install with: pip install boto3")
             raise
         except Exception as e:
-            logger.error(f"Failed to initialize AWS Bedrock: {e}")
+            logger.error("Failed to initialize AWS Bedrock: %s", e)
             raise
 
+    async def _keep_connection_warm(self) -> None:
+        """
+        주기적으로 Bedrock 엔드포인트에 HEAD 요청을 보내 Claude 호출용 커넥션을 유지.
+
+        모델을 호출하지 않으므로 과금되지 않으며, 응답 상태(인증 없는 4xx)는 무시합니다.
+        """
+        url = str(self._bedrock_claude_client.base_url)
+        while True:
+            await asyncio.sleep(settings.BEDROCK_KEEPALIVE_INTERVAL)
+            try:
+                await self._http_client.head(url, timeout=5.0)
+            except Exception as exc:
+                logger.warning("Bedrock keep-alive request failed: %s", exc)
+
     async def generate_embeddings(self, texts: list[str], **_: Any) -> list[list[float]]:
         """
         Generate embeddings using AWS Bedrock Titan v2 or fallback to deterministic hash.
@@ -130,19 +346,32 @@ class AIService:
             return []
 
         # Use real Titan embeddings if Bedrock is available and enabled
-        if (
-            self._provider == "bedrock"
-            and self._bedrock_client
-            and settings.LIGHTRAG_USE_REAL_EMBEDDINGS
-        ):
+        if self.uses_real_embeddings:
             return await self._generate_titan_embeddings(texts)
 
-        # Fallback to hash-based embeddings for development
-        logger.warning(
-            "Using hash-based embeddings (not semantic). Set LIGHTRAG_USE_REAL_EMBEDDINGS=true for production."
-        )
+        # Fallback to hash-based embeddings for development (경고는 프로세스당 한 번만)
+        if not self._hash_embedding_warned:
+            self._hash_embedding_warned = True
+            logger.warning(
+                "Using hash-based embeddings (not semantic). "
+                "Set LIGHTRAG_USE_REAL_EMBEDDINGS=true for production."
+            )
         return [self._text_to_embedding(text) for text in texts]
 
+    @property
+    def uses_real_embeddings(self) -> bool:
+        """Titan 임베딩 사용 여부 (False면 해시 임베딩이라 유사도 기반 캐시에 쓸 수 없음)."""
+        return (
+            self._provider == "bedrock"
+            and self._bedrock_client is not None
+            and self._use_real_embeddings
+        )
+
+    async def embed_query(self, text: str) -> list[float]:
+        """단일 질의 텍스트 임베딩 (시맨틱 캐시 조회용)."""
+        embeddings = await self.generate_embeddings([text])
+        return embeddings[0]
+
     async def _generate_titan_embeddings(self, texts: list[str]) -> list[list[float]]:
         """
         Generate real embeddings using AWS Bedrock Titan Embeddings v2.
@@ -150,39 +379,57 @@ class AIService:
         Model: amazon.titan-embed-text-v2:0
         Dimensions: 1024 (configurable: 256, 512, 1024)
         Max input: 8192 tokens
+
+        텍스트 단위로 캐시를 조회하고 캐시에 없는 텍스트만 임베딩한 뒤 입력 순서대로 재조립합니다.
+        """
+        cached = [self._embedding_cache.get(text) for text in texts]
+        misses = list(
+            dict.fromkeys(text for text, hit in zip(texts, cached, strict=True) if hit is None)
+        )
+
+        fetched: dict[str, list[float]] = {}
+        results = await asyncio.gather(*(self._embedding_batcher.submit(text) for text in misses))
+        for text, embedding in zip(misses, results, strict=True):
+            if embedding:
+                self._embedding_cache.set(text, embedding)
+                fetched[text] = embedding
+
+        return [
+            hit or fetched.get(text) or self._text_to_embedding(text)
+            for text, hit in zip(texts, cached, strict=True)
+        ]
+
+    async def _embed_titan_batch(self, texts: list[str]) -> list[list[float] | None]:
         """
-        embeddings = []
+        배처가 모은 텍스트 임베딩.
 
-        for text in texts:
-            try:
-                # Titan v2 embedding request body with configurable dimensions
-                request_body = {
-                    "inputText": text[:8000],  # Truncate to avoid token limit
-                    "dimensions": self._embedding_dim,  # Titan v2: 256, 512, or 1024
-                    "normalize": True,  # Return normalized embeddings
-                }
-
-                response = await asyncio.to_thread(
-                    self._bedrock_client.invoke_model,
-                    modelId=settings.BEDROCK_EMBEDDING_MODEL_ID,
-                    body=json.dumps(request_body),
-                )
+        Titan v2 invoke_model은 요청당 텍스트 1개만 받으므로 배치 내 요청을 동시에 보냅니다.
+        """
+        return await asyncio.gather(*(self._invoke_titan_embedding(text) for text in texts))
 
-                response_body = json.loads(response["body"].read())
-                embedding = response_body.get("embedding", [])
+    async def _invoke_titan_embedding(self, text: str) -> list[float] | None:
+        """단일 텍스트 Titan 임베딩 (실패 시 None, 해시 임베딩 대체는 호출자가 처리)."""
+        try:
+            # 고정 필드는 미리 직렬화해 두고 inputText만 직렬화해서 이어 붙임
+            # Truncate to avoid token limit
+            request_body = b'{"inputText":' + orjson.dumps(text[:8000]) + self._titan_body_suffix
 
-                if embedding:
-                    embeddings.append(embedding)
-                else:
-                    logger.warning(f"Empty embedding returned for text: {text[:50]}...")
-                    embeddings.append(self._text_to_embedding(text))
+            response = await asyncio.to_thread(
+                self._bedrock_client.invoke_model,
+                modelId=self._embedding_model_id,
+                body=request_body,
+            )
 
-            except Exception as e:
-                logger.error(f"Titan embedding failed: {e}")
-                # Fallback to hash-based embedding
-                embeddings.append(self._text_to_embedding(text))
+            response_body = orjson.loads(response["body"].read())
+            embedding = response_body.get("embedding", [])
+        except Exception as e:
+            logger.error("Titan embedding failed: %s", e)
+            return None
 
-        return embeddings
+        if not embedding:
+            logger.warning("Empty embedding returned for text: %s...", text[:50])
+            return None
+        return embedding
 
     async def generate_text(
         self,
@@ -201,6 +448,22 @@ class AIService:
         Returns:
             Response dict with "text" and "model_used" keys
         """
+        cache_key = (prompt_key(prompt, system_prompt), max_tokens)
+        cached = self._text_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+
+        response = await self._generate_text_uncached(prompt, system_prompt, max_tokens)
+        if response.get("text"):
+            self._text_cache.set(cache_key, response)
+        return dict(response)
+
+    async def _generate_text_uncached(
+        self,
+        prompt: str,
+        system_prompt: str | None,
+        max_tokens: int,
+    ) -> dict[str, Any]:
         if self._provider == "anthropic":
             text = await self._invoke_anthropic(
                 messages=[{"role": "user", "content": prompt}],
@@ -229,27 +492,35 @@ class AIService:
             raise RuntimeError("No AI provider configured")
 
     async def generate_rag_response(self, context: dict[str, Any]) -> dict[str, Any]:
-        system_prompt = self._system_prompt()
-
-        # 네이티브 멀티턴: messages 배열에 대화 이력 포함
-        messages: list[dict[str, str]] = []
-
-        # 이전 대화 이력 추가
-        conversation_history = context.get("conversation_history") or []
-        for msg in conversation_history[-6:]:  # 최근 6개 메시지
-            role = msg.get("role", "user")
-            content = msg.get("content", "")
-            if role in ("user", "assistant") and content:
-                messages.append({"role": role, "content": content[:2000]})
-
-        # 현재 질문 추가
-        messages.append({"role": "user", "content": self._user_prompt(context)})
+        shared_key = self._shared_answer_key(context)
+        if shared_key is not None:
+            cached = await self._shared_answer_get(shared_key)
+            if cached is not None:
+                return {**cached, "cached": True}
+
+        answer_key = await self._answer_cache_key(context)
+        if answer_key is not None:
+            cached = self._answer_cache.lookup(answer_key)
+            if cached is not None:
+                return {**cached, "cached": True}
+
+        response = await self._generate_rag_response_uncached(context)
+        if response.get("text"):
+            if answer_key is not None:
+                self._answer_cache.store(answer_key, response)
+            if shared_key is not None:
+                await self._shared_answer_set(shared_key, response)
+        return response
+
+    async def _generate_rag_response_uncached(self, context: dict[str, Any]) -> dict[str, Any]:
+        system_prompt = _SYSTEM_PROMPT
+        messages = self._build_rag_messages(context)
 
         if self._provider == "anthropic":
             text = await self._invoke_anthropic(
                 messages=messages,
                 system_prompt=system_prompt,
-                max_tokens=settings.RESPONSE_MAX_TOKENS,
+                max_tokens=self._max_tokens,
             )
             return {
                 "text": text,
@@ -261,7 +532,7 @@ class AIService:
             text = await self._invoke_bedrock(
                 messages=messages,
                 system_prompt=system_prompt,
-                max_tokens=settings.RESPONSE_MAX_TOKENS,
+                max_tokens=self._max_tokens,
             )
             return {
                 "text": text,
@@ -272,11 +543,139 @@ class AIService:
         else:
             raise RuntimeError("No AI provider configured")
 
-    def _system_prompt(self) -> str:
-        return (
-            "당신은 한국 부동산 상담을 돕는 AI 어시스턴트입니다. "
-            "매물 정보, 정부 정책, 시장 데이터를 조합하여 간결하고 명확하게 답변하세요."
-        )
+    async def generate_rag_response_stream(self, context: dict[str, Any]) -> AsyncIterator[str]:
+        """
+        RAG 응답을 토큰 단위로 스트리밍.
+
+        전체 생성이 끝날 때까지 기다리지 않고 텍스트 델타가 도착하는 대로 yield 합니다.
+        """
+        shared_key = self._shared_answer_key(context)
+        if shared_key is not None:
+            cached = await self._shared_answer_get(shared_key)
+            if cached is not None:
+                yield cached["text"]
+                return
+
+        answer_key = await self._answer_cache_key(context)
+        if answer_key is not None:
+            cached = self._answer_cache.lookup(answer_key)
+            if cached is not None:
+                yield cached["text"]
+                return
+
+        client, model_id = self._claude_client()
+
+        request_kwargs: dict[str, Any] = {
+            "model": model_id,
+            "max_tokens": self._max_tokens,
+            "messages": self._build_rag_messages(context),
+            "system": _SYSTEM_PROMPT,
+        }
+
+        chunks: list[str] = []
+        try:
+            async with client.messages.stream(**request_kwargs) as stream:
+                async for text in stream.text_stream:
+                    chunks.append(text)
+                    yield text
+        except Exception as exc:
+            logger.error("%s streaming call failed: %s", self._provider, exc)
+            raise
+
+        if chunks:
+            response = {"text": "".join(chunks), "model_used": model_id, "provider": self._provider}
+            if answer_key is not None:
+                self._answer_cache.store(answer_key, response)
+            if shared_key is not None:
+                await self._shared_answer_set(shared_key, response)
+
+    def _shared_answer_key(self, context: dict[str, Any]) -> str | None:
+        """
+        첫 턴 응답의 Redis 정확 일치 캐시 키.
+
+        centroid 캐시와 같은 프롬프트(질문 + 사용자 정보 + 세션 컨텍스트)를 공백/대소문자 정규화해
+        해시하므로, 임베딩 호출 없이 다른 워커가 만든 같은 질문의 응답을 재사용합니다.
+        키에 지식 베이스 세대 번호가 들어가므로 데이터 적재/초기화 후에는
+        이전 응답이 조회되지 않습니다 (남은 키는 TTL로 만료).
+        """
+        if not self._shared_answer_ttl or context.get("conversation_history"):
+            return None
+        prompt = self._user_prompt({**context, "knowledge_answer": None})
+        normalized = f"{self.model_id}|{' '.join(prompt.casefold().split())}"
+        digest = hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
+        return f"chatresp:{self.cache_generation}:{digest}"
+
+    async def _shared_answer_get(self, key: str) -> dict[str, Any] | None:
+        try:
+            cached = await cache_manager.get_json(key)
+        except RedisError as exc:
+            logger.warning("Answer cache lookup failed: %s", exc)
+            return None
+        logger.debug("Answer cache %s: %s", "hit" if cached is not None else "miss", key)
+        return cached
+
+    async def _shared_answer_set(self, key: str, response: dict[str, Any]) -> None:
+        try:
+            await cache_manager.set_json(key, response, self._shared_answer_ttl)
+        except RedisError as exc:
+            logger.warning("Answer cache store failed: %s", exc)
+
+    async def _answer_cache_key(self, context: dict[str, Any]) -> list[float] | None:
+        """
+        응답 캐시 키 임베딩.
+
+        대화 이력이 없는 첫 턴만 캐시합니다 (이력이 있으면 같은 질문도 답이 달라짐).
+        LightRAG 검색 결과는 질의에서 파생되므로 키에서 제외하고,
+        질문 + 사용자 정보 + 세션 컨텍스트 요약 프롬프트를 임베딩합니다.
+        """
+        # 해시 임베딩은 의미 유사도를 반영하지 않으므로 centroid 캐시를 쓰지 않음
+        if (
+            self._answer_cache is None
+            or not self.uses_real_embeddings
+            or context.get("conversation_history")
+        ):
+            return None
+        return await self.embed_query(self._user_prompt({**context, "knowledge_answer": None}))
+
+    @property
+    def model_id(self) -> str | None:
+        """현재 provider의 Claude 모델 ID."""
+        if self._provider == "anthropic":
+            return self._anthropic_model_id
+        if self._provider == "bedrock":
+            return self._bedrock_model_id
+        return None
+
+    def _claude_client(self) -> tuple[AsyncAnthropic | AsyncAnthropicBedrock, str]:
+        if self._provider == "anthropic":
+            return self._ensure_anthropic_client(), self._anthropic_model_id
+        if self._provider == "bedrock":
+            if not self._bedrock_claude_client:
+                raise RuntimeError("AWS Bedrock client not initialized")
+            return self._bedrock_claude_client, self._bedrock_model_id
+        raise RuntimeError("No AI provider configured")
+
+    def _build_rag_messages(self, context: dict[str, Any]) -> list[dict[str, str]]:
+        # 네이티브 멀티턴: messages 배열에 대화 이력 포함
+        # 최근 메시지부터 토큰 예산(CONVERSATION_TOKEN_BUDGET) 안에서만 포함
+        history: deque[dict[str, str]] = deque(maxlen=_MAX_HISTORY_MESSAGES)
+        for msg in context.get("conversation_history") or []:
+            role = msg.get("role", "user")
+            content = msg.get("content", "")
+            if role in ("user", "assistant") and content:
+                history.append({"role": role, "content": content[:2000]})
+
+        budget = self._history_token_budget
+        used = sum(_estimate_tokens(msg["content"]) for msg in history)
+        while history and used > budget:
+            used -= _estimate_tokens(history.popleft()["content"])
+
+        # Claude API는 user 메시지로 시작해야 함
+        while history and history[0]["role"] != "user":
+            history.popleft()
+
+        # 현재 질문 추가 (공유 리스트를 변경하지 않도록 새 리스트 생성)
+        return [*history, {"role": "user", "content": self._user_prompt(context)}]
 
     def _user_prompt(self, context: dict[str, Any]) -> str:
         # 대화 이력은 messages 배열로 네이티브 전달됨 (generate_rag_response에서 처리)
@@ -316,6 +715,10 @@ class AIService:
                 lines.append(f"- {name} ({org})" if org else f"- {name}")
             parts.extend(lines)
 
+        knowledge = context.get("knowledge_answer")
+        if knowledge:
+            parts.append(f"참고 자료 (지식 그래프 검색 결과):\n{knowledge[:_KNOWLEDGE_CONTEXT_MAX_CHARS]}")
+
         market = context.get("market_context") or {}
         if market:
             info = []
@@ -328,12 +731,18 @@ class AIService:
 
         return "\n".join(part for part in parts if part)
 
-    def _ensure_anthropic_client(self) -> Anthropic:
+    def _ensure_anthropic_client(self) -> AsyncAnthropic:
         """Ensure Anthropic client is initialized."""
         if not settings.ANTHROPIC_API_KEY or not settings.ANTHROPIC_API_KEY.strip():
             raise RuntimeError("ANTHROPIC_API_KEY is not configured")
         if self._anthropic_client is None:
-            self._anthropic_client = Anthropic(api_key=settings.ANTHROPIC_API_KEY)
+            from anthropic import AsyncAnthropic  # noqa: PLC0415
+
+            self._anthropic_client = AsyncAnthropic(
+                api_key=settings.ANTHROPIC_API_KEY,
+                max_retries=0,  # 재시도는 _create_message에서 처리
+                http_client=self._http_client,
+            )
         return self._anthropic_client
 
     async def _invoke_anthropic(
@@ -354,12 +763,9 @@ class AIService:
             request_kwargs["system"] = system_prompt
 
         try:
-            response = await asyncio.to_thread(
-                client.messages.create,
-                **request_kwargs,
-            )
+            response = await _create_message(client, **request_kwargs)
         except Exception as exc:
-            logger.error(f"Anthropic API call failed: {exc}")
+            logger.error("Anthropic API call failed: %s", exc)
             raise
 
         text_parts: list[str] = []
@@ -375,40 +781,31 @@ class AIService:
         max_tokens: int,
     ) -> str:
         """Invoke AWS Bedrock Claude model."""
-        if not self._bedrock_client:
+        if not self._bedrock_claude_client:
             raise RuntimeError("AWS Bedrock client not initialized")
 
         # Bedrock uses the same message format as Anthropic
-        request_body = {
-            "anthropic_version": "bedrock-2023-05-31",
+        request_kwargs: dict[str, Any] = {
+            "model": self._bedrock_model_id,
             "max_tokens": max_tokens,
             "messages": messages,
         }
-
         if system_prompt:
-            request_body["system"] = system_prompt
+            request_kwargs["system"] = system_prompt
 
         try:
-            response = await asyncio.to_thread(
-                self._bedrock_client.invoke_model,
-                modelId=self._bedrock_model_id,
-                body=json.dumps(request_body),
-            )
-
-            response_body = json.loads(response["body"].read())
-
-            # Extract text from response
-            text_parts: list[str] = []
-            for content_block in response_body.get("content", []):
-                if content_block.get("type") == "text":
-                    text_parts.append(content_block.get("text", ""))
-
-            return "".join(text_parts)
-
+            response = await _create_message(self._bedrock_claude_client, **request_kwargs)
         except Exception as exc:
-            logger.error(f"AWS Bedrock invocation failed: {exc}")
+            logger.error("AWS Bedrock invocation failed: %s", exc)
             raise
 
+        # Extract text from response
+        text_parts: list[str] = []
+        for block in response.content:
+            if getattr(block, "type", None) == "text":
+                text_parts.append(block.text)
+        return "".join(text_parts)
+
     def _text_to_embedding(self, text: str) -> list[float]:
         """Generate a deterministic pseudo-embedding for development use."""
         if not text:
@@ -11,6 +11,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from core.clock import utc_now_iso_precise
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,7 +30,7 @@ class CheckpointService:
         """
         self.checkpoint_dir = Path(checkpoint_dir)
         self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
-        logger.info(f"Checkpoint directory: {self.checkpoint_dir.absolute()}")
+        logger.info("Checkpoint directory: %s", self.checkpoint_dir.absolute())
 
     def save_checkpoint(self, job_id: str, data: dict[str, Any]) -> bool:
         """
@@ -47,17 +49,17 @@ class CheckpointService:
             # 타임스탬프 추가
             checkpoint_data = {
                 **data,
-                "checkpoint_timestamp": datetime.utcnow().isoformat(),
+                "checkpoint_timestamp": utc_now_iso_precise(),
             }
 
             with open(checkpoint_file, "w") as f:
                 json.dump(checkpoint_data, f, indent=2)
 
-            logger.info(f"Checkpoint saved for job {job_id}: {checkpoint_file}")
+            logger.info("Checkpoint saved for job %s: %s", job_id, checkpoint_file)
             return True
 
         except Exception as e:
-            logger.error(f"Failed to save checkpoint for job {job_id}: {e}")
+            logger.error("Failed to save checkpoint for job %s: %s", job_id, e)
             return False
 
     def load_checkpoint(self, job_id: str) -> dict[str, Any] | None:
@@ -74,17 +76,17 @@ class CheckpointService:
             checkpoint_file = self.checkpoint_dir / f"{job_id}.json"
 
             if not checkpoint_file.exists():
-                logger.info(f"No checkpoint found for job {job_id}")
+                logger.info("No checkpoint found for job %s", job_id)
                 return None
 
             with open(checkpoint_file) as f:
                 data = json.load(f)
 
-            logger.info(f"Checkpoint loaded for job {job_id}")
+            logger.info("Checkpoint loaded for job %s", job_id)
             return data
 
         except Exception as e:
-            logger.error(f"Failed to load checkpoint for job {job_id}: {e}")
+            logger.error("Failed to load checkpoint for job %s: %s", job_id, e)
             return None
 
     def clear_checkpoint(self, job_id: str) -> bool:
@@ -102,13 +104,13 @@ class CheckpointService:
 
             if checkpoint_file.exists():
                 checkpoint_file.unlink()
-                logger.info(f"Checkpoint cleared for job {job_id}")
+                logger.info("Checkpoint cleared for job %s", job_id)
                 return True
 
             return False
 
         except Exception as e:
-            logger.error(f"Failed to clear checkpoint for job {job_id}: {e}")
+            logger.error("Failed to clear checkpoint for job %s: %s", job_id, e)
             return False
 
     def list_checkpoints(self) -> list[dict[str, Any]]:
@@ -133,7 +135,7 @@ class CheckpointService:
                     }
                 )
             except Exception as e:
-                logger.error(f"Failed to read checkpoint {checkpoint_file}: {e}")
+                logger.error("Failed to read checkpoint %s: %s", checkpoint_file, e)
 
         return checkpoints
 
@@ -166,10 +168,10 @@ class CheckpointService:
                 if timestamp < cutoff_time:
                     checkpoint_file.unlink()
                     deleted_count += 1
-                    logger.info(f"Deleted old checkpoint: {checkpoint_file}")
+                    logger.info("Deleted old checkpoint: %s", checkpoint_file)
 
             except Exception as e:
-                logger.error(f"Failed to process checkpoint {checkpoint_file}: {e}")
+                logger.error("Failed to process checkpoint %s: %s", checkpoint_file, e)
 
-        logger.info(f"Cleaned up {deleted_count} old checkpoints")
+        logger.info("Cleaned up %s old checkpoints", deleted_count)
         return deleted_count
@@ -21,13 +21,14 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import numpy as np
-from lightrag import LightRAG, QueryParam
-from lightrag.kg.shared_storage import initialize_pipeline_status
-from lightrag.utils import EmbeddingFunc
 
 from core.config import settings
 
+# lightrag는 임포트 비용이 커서(수백 ms~수 초) 실제 초기화/쿼리 시점에 임포트
 if TYPE_CHECKING:
+    from lightrag import LightRAG
+    from lightrag.utils import EmbeddingFunc
+
     from services.ai_service import AIService
 
 logger = logging.getLogger(__name__)
@@ -53,7 +54,7 @@ def _build_llm_model_func(ai_service: AIService | None) -> Callable[..., Awaitab
                 max_tokens=kwargs.get("max_tokens", 10000),
             )
         except Exception as exc:
-            logger.error(f"LLM function failed: {exc}")
+            logger.error("LLM function failed: %s", exc)
             raise
 
         return response.get("text", "")
@@ -78,9 +79,11 @@ def _build_embedding_func(
             embeddings = await ai_service.generate_embeddings(texts)
             return np.array(embeddings)
         except Exception as exc:
-            logger.error(f"Embedding function failed: {exc}")
+            logger.error("Embedding function failed: %s", exc)
             raise
 
+    from lightrag.utils import EmbeddingFunc  # noqa: PLC0415
+
     embedding_dim = settings.LIGHTRAG_EMBEDDING_DIM
 
     return EmbeddingFunc(
@@ -109,7 +112,7 @@ def _setup_postgres_env() -> None:
     # SSL mode 설정 (AWS RDS 연결에 필수)
     if settings.POSTGRES_SSL_MODE:
         os.environ["POSTGRES_SSL_MODE"] = settings.POSTGRES_SSL_MODE
-        logger.info(f"PostgreSQL SSL mode set to: {settings.POSTGRES_SSL_MODE}")
+        logger.info("PostgreSQL SSL mode set to: %s", settings.POSTGRES_SSL_MODE)
 
     # DATABASE_URL에서 PostgreSQL 정보 추출 (fallback)
     if settings.DATABASE_URL and not settings.POSTGRES_HOST:
@@ -140,9 +143,9 @@ def _parse_database_url_to_env(database_url: str) -> None:
         if parsed.path and parsed.path.startswith("/"):
             os.environ["POSTGRES_DB"] = parsed.path[1:]  # Remove leading slash
 
-        logger.info(f"Parsed DATABASE_URL for LightRAG: host={parsed.hostname}")
+        logger.info("Parsed DATABASE_URL for LightRAG: host=%s", parsed.hostname)
     except Exception as e:
-        logger.warning(f"Failed to parse DATABASE_URL: {e}")
+        logger.warning("Failed to parse DATABASE_URL: %s", e)
 
 
 class LightRAGService:
@@ -174,12 +177,12 @@ class LightRAGService:
 
         # Storage backend 설정
         self.storage_backend_type = storage_backend or settings.STORAGE_BACKEND
-        logger.info(f"Using storage backend: {self.storage_backend_type}")
+        logger.info("Using storage backend: %s", self.storage_backend_type)
 
         # Working directory 설정
         self.working_dir = Path(settings.LIGHTRAG_WORKING_DIR) / settings.LIGHTRAG_WORKSPACE
         self.working_dir.mkdir(parents=True, exist_ok=True)
-        logger.info(f"LightRAG working directory: {self.working_dir}")
+        logger.info("LightRAG working directory: %s", self.working_dir)
 
     async def initialize(self) -> None:
         """
@@ -199,6 +202,9 @@ class LightRAGService:
             return
 
         try:
+            from lightrag import LightRAG  # noqa: PLC0415
+            from lightrag.kg.shared_storage import initialize_pipeline_status  # noqa: PLC0415
+
             llm_model_func = _build_llm_model_func(self.ai_service)
             embedding_func = _build_embedding_func(self.ai_service)
 
@@ -246,7 +252,7 @@ class LightRAGService:
                 await initialize_pipeline_status()
                 logger.info("Pipeline status initialized")
             except Exception as e:
-                logger.warning(f"Could not initialize pipeline status: {e}")
+                logger.warning("Could not initialize pipeline status: %s", e)
                 # Continue anyway - some versions may not require this
 
             self._initialized = True
@@ -255,7 +261,7 @@ class LightRAGService:
             )
 
         except Exception as e:
-            logger.error(f"Failed to initialize LightRAG: {e}")
+            logger.error("Failed to initialize LightRAG: %s", e)
             raise
 
     def is_empty(self) -> bool:
@@ -288,7 +294,7 @@ class LightRAGService:
                 self._initialized = False
                 logger.info("LightRAG finalized")
             except Exception as e:
-                logger.error(f"Error finalizing LightRAG: {e}")
+                logger.error("Error finalizing LightRAG: %s", e)
 
     async def insert(self, text: str, metadata: dict[str, Any] | None = None) -> bool:
         """
@@ -311,11 +317,11 @@ class LightRAGService:
 
             # LightRAG에 문서 추가 (자동 chunking, entity extraction, graph building)
             await self._rag.ainsert(text)
-            logger.info(f"Inserted document into LightRAG (length: {len(text)} chars)")
+            logger.info("Inserted document into LightRAG (length: %s chars)", len(text))
             return True
 
         except Exception as e:
-            logger.error(f"Failed to insert document: {e}")
+            logger.error("Failed to insert document: %s", e)
             return False
 
     async def insert_batch(self, texts: list[str]) -> int:
@@ -336,7 +342,7 @@ class LightRAGService:
             if await self.insert(text):
                 success_count += 1
 
-        logger.info(f"Batch insert completed: {success_count}/{len(texts)} documents")
+        logger.info("Batch insert completed: %s/%s documents", success_count, len(texts))
         return success_count
 
     async def query(
@@ -365,6 +371,8 @@ class LightRAGService:
         if not self._initialized:
             await self.initialize()
 
+        from lightrag import QueryParam  # noqa: PLC0415
+
         try:
             # QueryParam 설정
             param = QueryParam(
@@ -383,7 +391,7 @@ class LightRAGService:
             }
 
         except Exception as e:
-            logger.error(f"LightRAG query failed: {e}")
+            logger.error("LightRAG query failed: %s", e)
             return None
 
     async def search_vectors(
@@ -438,9 +446,9 @@ class LightRAGService:
                         }
                     )
 
-            logger.info(f"Vector search found {len(results)} results")
+            logger.info("Vector search found %s results", len(results))
             return results
 
         except Exception as e:
-            logger.error(f"Vector search failed: {e}")
+            logger.error("Vector search failed: %s", e)
             return []
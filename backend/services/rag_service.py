@@ -4,11 +4,15 @@ Straightforward Retrieval-Augmented Generation service using LightRAG.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
+from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING, Any
 
+from core.cache import get_knowledge_generation
 from core.config import settings
+from core.llm_cache import SemanticCache
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +36,44 @@ class RAGService:
         self.user_service = user_service
         self.lightrag_service = lightrag_service
         self.max_results = settings.MAX_SEARCH_RESULTS
+        # create_task 결과는 약한 참조만 유지되므로 저장이 끝날 때까지 참조를 보관
+        self._pending_writes: set[asyncio.Task[bool]] = set()
+
+        # 유사 표현 질의("아파트 매매 알려줘" / "아파트 매매 알려주세요")의 LightRAG 결과 재사용
+        self._knowledge_cache: SemanticCache | None = None
+        if settings.SEMANTIC_CACHE_ENABLED:
+            self._knowledge_cache = SemanticCache(
+                ai_service.embedding_dim,
+                threshold=settings.SEMANTIC_CACHE_THRESHOLD,
+                max_entries=settings.SEMANTIC_CACHE_MAX_ENTRIES,
+                ttl=settings.SEMANTIC_CACHE_TTL,
+            )
+        self._cache_generation = 0
+        self._generation_checked_at = float("-inf")
+        self._generation_check_interval = settings.KNOWLEDGE_GENERATION_CHECK_INTERVAL
+
+    def clear_caches(self) -> None:
+        """지식 베이스 기반 캐시 비우기 (데이터 적재/초기화 후 호출)."""
+        if self._knowledge_cache is not None:
+            self._knowledge_cache.clear()
+        self.ai_service.clear_caches()
+
+    async def _sync_cache_generation(self) -> None:
+        """
+        다른 워커/작업이 지식 베이스를 바꿨으면 이 프로세스의 캐시도 비움.
+
+        질의마다 Redis를 읽지 않도록 KNOWLEDGE_GENERATION_CHECK_INTERVAL마다 한 번만 확인합니다.
+        같은 워커의 /admin 호출은 즉시 비우므로, 지연은 다른 워커에서만 최대 한 간격입니다.
+        """
+        now = time.monotonic()
+        if now - self._generation_checked_at < self._generation_check_interval:
+            return
+        self._generation_checked_at = now
+        generation = await get_knowledge_generation()
+        if generation != self._cache_generation:
+            self.clear_caches()
+            self._cache_generation = generation
+            self.ai_service.cache_generation = generation
 
     async def process_query(
         self,
@@ -40,21 +82,15 @@ class RAGService:
         conversation_id: str,
         session_context: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        context = await self._build_context(
-            user_query, user_id, conversation_id, session_context or {}
-        )
-
         start_time = time.time()
-        knowledge = await self._query_lightrag(user_query)
-        vector_results = await self._search_vectors(user_query)
-
-        context["knowledge_answer"] = knowledge.get("answer") if knowledge else None
-        context["knowledge_mode"] = knowledge.get("mode") if knowledge else None
-        context["vector_results"] = vector_results
+        await self._sync_cache_generation()
+        context, knowledge, vector_results = await self._retrieve(
+            user_query, user_id, conversation_id, session_context
+        )
 
         ai_response = await self.ai_service.generate_rag_response(context)
 
-        await self._persist_conversation(
+        self._persist_conversation(
             user_id=user_id,
             conversation_id=conversation_id,
             user_query=user_query,
@@ -73,6 +109,73 @@ class RAGService:
             "processing_time_ms": processing_time_ms,
         }
 
+    async def process_query_stream(
+        self,
+        user_query: str,
+        user_id: str,
+        conversation_id: str,
+        session_context: dict[str, Any] | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        process_query의 스트리밍 버전.
+
+        {"type": "delta", "text": ...} 이벤트를 생성되는 대로 내보내고,
+        완료 후 대화를 저장한 뒤 {"type": "done", ...} 이벤트로 마무리합니다.
+        """
+        start_time = time.time()
+        await self._sync_cache_generation()
+        context, knowledge, vector_results = await self._retrieve(
+            user_query, user_id, conversation_id, session_context
+        )
+
+        chunks: list[str] = []
+        async for text in self.ai_service.generate_rag_response_stream(context):
+            chunks.append(text)
+            yield {"type": "delta", "text": text}
+
+        ai_response = {
+            "text": "".join(chunks),
+            "model_used": self.ai_service.model_id,
+            "provider": self.ai_service.provider,
+        }
+        self._persist_conversation(
+            user_id=user_id,
+            conversation_id=conversation_id,
+            user_query=user_query,
+            ai_payload=ai_response,
+            context=context,
+        )
+
+        yield {
+            "type": "done",
+            "knowledge_mode": knowledge.get("mode") if knowledge else None,
+            "vector_results": vector_results,
+            "processing_time_ms": (time.time() - start_time) * 1000,
+        }
+
+    async def _retrieve(
+        self,
+        user_query: str,
+        user_id: str,
+        conversation_id: str,
+        session_context: dict[str, Any] | None,
+    ) -> tuple[dict[str, Any], dict[str, Any] | None, list[dict[str, Any]]]:
+        """컨텍스트 구성 + LightRAG 지식/벡터 검색."""
+        context = await self._build_context(
+            user_query, user_id, conversation_id, session_context or {}
+        )
+
+        # 지식 그래프 질의와 벡터 검색은 서로 독립적이므로 동시 실행
+        knowledge, vector_results = await asyncio.gather(
+            self._query_lightrag(user_query),
+            self._search_vectors(user_query),
+        )
+
+        context["knowledge_answer"] = knowledge.get("answer") if knowledge else None
+        context["knowledge_mode"] = knowledge.get("mode") if knowledge else None
+        context["vector_results"] = vector_results
+        return context, knowledge, vector_results
+
     async def _build_context(
         self,
         user_query: str,
@@ -80,32 +183,16 @@ class RAGService:
         conversation_id: str,
         session_context: dict[str, Any],
     ) -> dict[str, Any]:
-        profile = await self.user_service.get_primary_profile(user_id)
-        profile_dict = self._profile_to_dict(profile)
-
-        # 이전 대화 이력 가져오기 (멀티턴 지원)
+        # 프로필 조회와 대화 이력 조회를 동시 실행 (멀티턴 지원)
         conversation_history = session_context.get("conversation_history", [])
         if not conversation_history and conversation_id:
-            try:
-                history_records = await self.user_service.get_conversation_history(
-                    user_id, conversation_id, limit=10
-                )
-                # 딕셔너리 리스트에서 대화 이력 추출 (키 접근)
-                conversation_history = [
-                    {"role": r.get("role"), "content": r.get("content")}
-                    for r in history_records
-                    if r.get("role") and r.get("content")
-                ]
-                logger.debug(
-                    "대화 이력 로드 성공: user=%s, conv=%s, count=%d",
-                    user_id, conversation_id, len(conversation_history)
-                )
-            except Exception as e:
-                logger.warning(
-                    "대화 이력 로드 실패: user=%s, conv=%s, error=%s",
-                    user_id, conversation_id, str(e)
-                )
-                conversation_history = []
+            profile, conversation_history = await asyncio.gather(
+                self.user_service.get_primary_profile(user_id),
+                self._load_conversation_history(user_id, conversation_id),
+            )
+        else:
+            profile = await self.user_service.get_primary_profile(user_id)
+        profile_dict = self._profile_to_dict(profile)
 
         return {
             "user_query": user_query,
@@ -119,16 +206,60 @@ class RAGService:
             "conversation_history": conversation_history,
         }
 
+    async def _load_conversation_history(
+        self, user_id: str, conversation_id: str
+    ) -> list[dict[str, Any]]:
+        try:
+            history_records = await self.user_service.get_conversation_history(
+                user_id, conversation_id, limit=10
+            )
+        except Exception as e:
+            logger.warning(
+                "대화 이력 로드 실패: user=%s, conv=%s, error=%s",
+                user_id, conversation_id, str(e)
+            )
+            return []
+
+        # 딕셔너리 리스트에서 대화 이력 추출 (키 접근)
+        conversation_history = [
+            {"role": r.get("role"), "content": r.get("content")}
+            for r in history_records
+            if r.get("role") and r.get("content")
+        ]
+        logger.debug(
+            "대화 이력 로드 성공: user=%s, conv=%s, count=%d",
+            user_id, conversation_id, len(conversation_history)
+        )
+        return conversation_history
+
     async def _query_lightrag(self, query: str) -> dict[str, Any] | None:
-        """Query LightRAG knowledge graph."""
-        return await self.lightrag_service.query(query, mode="local")
+        """
+        Query LightRAG knowledge graph (semantic cache first).
+
+        LightRAG 자체 답변 생성 없이 검색 컨텍스트만 받아 최종 응답 프롬프트에 넣습니다.
+        (LightRAG 답변 + 최종 응답으로 Claude를 두 번 호출하지 않도록)
+        """
+        # 해시 임베딩은 의미 유사도를 반영하지 않으므로 시맨틱 캐시를 쓰지 않음
+        if self._knowledge_cache is None or not self.ai_service.uses_real_embeddings:
+            return await self.lightrag_service.query(query, mode="local", only_need_context=True)
+
+        embedding = await self.ai_service.embed_query(query)
+        cached = self._knowledge_cache.lookup(embedding)
+        if cached is not None:
+            logger.debug("LightRAG semantic cache hit: %s", query[:50])
+            return {**cached, "cached": True}
+
+        knowledge = await self.lightrag_service.query(query, mode="local", only_need_context=True)
+        if knowledge and knowledge.get("answer"):
+            self._knowledge_cache.store(embedding, knowledge)
+        return knowledge
 
     async def _search_vectors(self, query: str) -> list[dict[str, Any]]:
         """Vector search using LightRAG (NanoVectorDB)."""
         results = await self.lightrag_service.search_vectors(query, limit=self.max_results)
         return results
 
-    async def _persist_conversation(
+    def _persist_conversation(
         self,
         *,
         user_id: str,
@@ -137,24 +268,39 @@ class RAGService:
         ai_payload: dict[str, Any],
         context: dict[str, Any],
     ) -> None:
-        await self.user_service.save_conversation_message(
-            user_id=user_id,
-            conversation_id=conversation_id,
-            role="user",
-            content=user_query,
-            entities=context.get("entities"),
-        )
-        await self.user_service.save_conversation_message(
-            user_id=user_id,
-            conversation_id=conversation_id,
-            role="assistant",
-            content=ai_payload.get("text", ""),
-            entities=context.get("entities"),
-            search_results=[
-                result["id"] for result in context.get("vector_results", []) if result.get("id")
-            ],
-            model_used=ai_payload.get("model_used"),
+        """
+        대화 한 턴 저장을 백그라운드로 예약.
+
+        질문/응답을 한 번의 저장소 쓰기로 묶고, 응답 반환을 쓰기 완료까지 기다리지 않습니다.
+        UserService 락은 먼저 기다린 쪽이 먼저 얻으므로 다음 턴의 이력 조회보다 먼저 기록됩니다.
+        """
+        task = asyncio.create_task(
+            self.user_service.save_conversation_turn(
+                user_id,
+                conversation_id,
+                user_content=user_query,
+                assistant_content=ai_payload.get("text", ""),
+                entities=context.get("entities"),
+                search_results=[
+                    result["id"]
+                    for result in context.get("vector_results", [])
+                    if result.get("id")
+                ],
+                model_used=ai_payload.get("model_used"),
+            )
         )
+        self._pending_writes.add(task)
+        task.add_done_callback(self._on_write_done)
+
+    def _on_write_done(self, task: asyncio.Task[bool]) -> None:
+        self._pending_writes.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("Conversation save failed: %s", task.exception())
+
+    async def drain_writes(self) -> None:
+        """예약된 대화 저장이 모두 끝날 때까지 대기 (종료 시 호출)."""
+        if self._pending_writes:
+            await asyncio.gather(*self._pending_writes, return_exceptions=True)
 
     def _profile_to_dict(self, profile: Any | None) -> dict[str, Any]:
         if profile is None:
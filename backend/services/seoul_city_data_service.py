@@ -7,6 +7,8 @@ https://data.seoul.go.kr/dataList/OA-21285/A/1/datasetView.do.
 
 from __future__ import annotations
 
+import asyncio
+import time
 from dataclasses import dataclass
 from typing import Any
 from urllib.parse import quote
@@ -29,22 +31,35 @@ class SeoulCityDataService:
     """Async client for the Seoul Open Data OA-21285 endpoint."""
 
     BASE_URL = "https://openapi.seoul.go.kr:8088"
-
-    def __init__(self) -> None:
+    SNAPSHOT_TTL = 45.0  # 실시간 도시데이터는 수 분 단위로 갱신되므로 짧게 재사용 (초)
+
+    def __init__(self, http_client: httpx.AsyncClient | None = None) -> None:
+        """
+        Args:
+            http_client: 애플리케이션 공용 HTTP 클라이언트 (커넥션 풀 공유).
+                없으면 initialize()에서 전용 클라이언트를 생성하고 close()에서 닫습니다.
+        """
         self._api_key = (settings.SEOUL_OPEN_API_KEY or "").strip()
-        self._client: httpx.AsyncClient | None = None
+        self._client: httpx.AsyncClient | None = http_client
+        self._owns_client = http_client is None
+        # 같은 요청 URL에 대한 동시 호출은 업스트림 요청 하나를 공유하고(single-flight),
+        # 결과는 잠시 재사용 (세 엔드포인트 모두 같은 citydata 응답을 사용)
+        self._inflight: dict[str, asyncio.Task[CitySnapshot]] = {}
+        self._recent: dict[str, tuple[float, CitySnapshot]] = {}
 
     async def initialize(self) -> None:
         if self._client:
             return
 
         timeout = httpx.Timeout(10.0, connect=5.0)
-        self._client = httpx.AsyncClient(base_url=self.BASE_URL, timeout=timeout)
+        self._client = httpx.AsyncClient(timeout=timeout)
+        self._owns_client = True
 
     async def close(self) -> None:
-        if self._client:
+        if self._client and self._owns_client:
             await self._client.aclose()
-            self._client = None
+        self._client = None
+        self._recent.clear()
 
     async def get_city_snapshot(
         self,
@@ -130,12 +145,52 @@ class SeoulCityDataService:
         if start_row < 1 or end_row < start_row:
             raise ValueError("Invalid row range requested.")
 
-        client = await self._ensure_client()
         api_key = self._api_key or "sample"
         identifier = quote(area_code or location_name or "")
-        path = f"/{api_key}/json/citydata/{start_row}/{end_row}/{identifier}"
+        url = f"{self.BASE_URL}/{api_key}/json/citydata/{start_row}/{end_row}/{identifier}"
+
+        recent = self._recent.get(url)
+        if recent is not None and recent[0] > time.monotonic():
+            return recent[1]
+
+        task = self._inflight.get(url)
+        if task is None:
+            task = asyncio.create_task(
+                self._request_snapshot(
+                    url,
+                    identifier,
+                    location_name=location_name,
+                    area_code=area_code,
+                    start_row=start_row,
+                    end_row=end_row,
+                )
+            )
+            self._inflight[url] = task
+            task.add_done_callback(lambda done: self._on_snapshot_done(url, done))
+        # 한 호출자가 취소되어도 같은 요청을 기다리는 다른 호출자에게 영향이 없도록 shield
+        return await asyncio.shield(task)
+
+    def _on_snapshot_done(self, url: str, task: asyncio.Task[CitySnapshot]) -> None:
+        self._inflight.pop(url, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        now = time.monotonic()
+        for key in [key for key, (expires_at, _) in self._recent.items() if expires_at <= now]:
+            del self._recent[key]
+        self._recent[url] = (now + self.SNAPSHOT_TTL, task.result())
 
-        response = await client.get(path)
+    async def _request_snapshot(
+        self,
+        url: str,
+        identifier: str,
+        *,
+        location_name: str | None,
+        area_code: str | None,
+        start_row: int,
+        end_row: int,
+    ) -> CitySnapshot:
+        client = await self._ensure_client()
+        response = await client.get(url)
         response.raise_for_status()
 
         payload = response.json()
@@ -5,17 +5,35 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import uuid
-from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import orjson
+from redis.exceptions import RedisError
+
+from core.cache import cache_manager
+from core.clock import utc_now_iso_precise
 from core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# 프로필은 거의 바뀌지 않으므로 Redis에 짧게 캐시 (변경 시 즉시 삭제)
+_PROFILE_CACHE_TTL = 300
+
+
+# 대화별 전체 메시지 수 (이력 조회에서 요청할 때만 사용, 메시지 저장 시 갱신)
+_CONV_COUNT_CACHE_TTL = 60
+
+
+def _profile_cache_key(user_id: str) -> str:
+    return f"user:profile:{user_id}"
+
+
+def _conv_count_cache_key(user_id: str, conversation_id: str) -> str:
+    return f"conv_count:{conversation_id}:{user_id}"
+
 
 class UserService:
     """Lightweight JSON-backed user service replacing the previous Neo4j implementation."""
@@ -35,9 +53,8 @@ class UserService:
             if not self._storage_path.exists():
                 return {"profiles": {}, "conversations": {}}
             try:
-                with self._storage_path.open("r", encoding="utf-8") as fp:
-                    return json.load(fp)
-            except json.JSONDecodeError:
+                return orjson.loads(self._storage_path.read_bytes())
+            except orjson.JSONDecodeError:
                 logger.warning("User storage corrupted, resetting %s", self._storage_path)
                 return {"profiles": {}, "conversations": {}}
 
@@ -45,21 +62,37 @@ class UserService:
 
     async def _write_store(self, store: dict[str, Any]) -> None:
         def _write() -> None:
-            with self._storage_path.open("w", encoding="utf-8") as fp:
-                json.dump(store, fp, ensure_ascii=False, indent=2)
+            # 압축 형식으로 저장 (들여쓰기는 파일 크기와 직렬화 시간만 늘림)
+            self._storage_path.write_bytes(orjson.dumps(store))
 
         await asyncio.to_thread(_write)
 
     def _now(self) -> str:
-        return datetime.utcnow().isoformat()
+        return utc_now_iso_precise()
 
     # ==================== 사용자 프로필 관리 ====================
 
     async def get_primary_profile(self, user_id: str) -> dict[str, Any] | None:
-        """사용자 기본 프로필 조회"""
+        """사용자 기본 프로필 조회 (Redis cache-aside)"""
+        cache_key = _profile_cache_key(user_id)
+        try:
+            cached = await cache_manager.get_json(cache_key)
+        except RedisError as exc:
+            logger.warning("Profile cache lookup failed: %s", exc)
+            cached = None
+        if cached is not None:
+            return cached
+
         async with self._lock:
             store = await self._load_store()
-            return store["profiles"].get(user_id)
+            profile = store["profiles"].get(user_id)
+
+        if profile is not None:
+            try:
+                await cache_manager.set_json(cache_key, profile, _PROFILE_CACHE_TTL)
+            except RedisError as exc:
+                logger.warning("Profile cache store failed: %s", exc)
+        return profile
 
     async def create_or_update_user_profile(
         self,
@@ -86,8 +119,13 @@ class UserService:
 
             store.setdefault("profiles", {})[user_id] = profile
             await self._write_store(store)
-            logger.info("사용자 프로필 저장 성공: %s", user_id)
-            return profile
+
+        try:
+            await cache_manager.delete(_profile_cache_key(user_id))
+        except RedisError as exc:
+            logger.warning("Profile cache invalidation failed: %s", exc)
+        logger.info("사용자 프로필 저장 성공: %s", user_id)
+        return profile
 
     # ==================== 대화 이력 관리 ====================
 
@@ -96,31 +134,66 @@ class UserService:
         user_id: str,
         conversation_id: str,
         limit: int = 10,
+        before: str | None = None,
     ) -> list[dict[str, Any]]:
-        """대화 이력 조회 (시간순 - 오래된 것 먼저)"""
+        """
+        대화 이력 조회 (시간순 - 오래된 것 먼저)
+
+        before(message_id)가 주어지면 그 메시지보다 앞선 메시지 중 최근 N개를 반환합니다.
+        위치(offset) 대신 메시지 ID가 기준이라 새 메시지가 추가되어도 페이지가 밀리지 않습니다.
+        """
         async with self._lock:
             store = await self._load_store()
             user_convs = store.get("conversations", {}).get(user_id, {})
             convo = user_convs.get(conversation_id, {"messages": []})
-            messages = list(convo.get("messages", []))
+            messages = convo.get("messages", [])
+
+            end = len(messages)
+            if before is not None:
+                # 이전 페이지는 대개 최근 쪽에 있으므로 뒤에서부터 찾음 (없으면 빈 페이지)
+                end = next(
+                    (i for i in range(end - 1, -1, -1) if messages[i].get("message_id") == before),
+                    0,
+                )
             # 최근 N개 메시지를 시간순으로 반환 (Claude API 요구사항)
-            return messages[-limit:]
+            # 슬라이스가 이미 새 리스트이므로 전체 이력을 먼저 복사하지 않음
+            return messages[max(0, end - limit) : end]
+
+    async def count_conversation_messages(self, user_id: str, conversation_id: str) -> int:
+        """대화의 전체 메시지 수 (Redis에 짧게 캐시)"""
+        cache_key = _conv_count_cache_key(user_id, conversation_id)
+        try:
+            cached = await cache_manager.get(cache_key)
+        except RedisError as exc:
+            logger.warning("Conversation count cache lookup failed: %s", exc)
+            cached = None
+        if cached is not None:
+            return int(cached)
 
-    async def save_conversation_message(
+        async with self._lock:
+            store = await self._load_store()
+            convo = store.get("conversations", {}).get(user_id, {}).get(conversation_id, {})
+            count = len(convo.get("messages", []))
+
+        try:
+            await cache_manager.set(cache_key, str(count), _CONV_COUNT_CACHE_TTL)
+        except RedisError as exc:
+            logger.warning("Conversation count cache store failed: %s", exc)
+        return count
+
+    def _new_message(
         self,
-        user_id: str,
-        conversation_id: str,
         role: str,
         content: str,
+        *,
         intent: str | None = None,
         entities: dict[str, Any] | None = None,
         search_results: list[str] | None = None,
         recommended_policies: list[str] | None = None,
         confidence_score: float | None = None,
         model_used: str | None = None,
-    ) -> bool:
-        """대화 메시지 저장"""
-        message = {
+    ) -> dict[str, Any]:
+        return {
             "message_id": str(uuid.uuid4()),
             "role": role,
             "content": content,
@@ -133,6 +206,13 @@ class UserService:
             "created_at": self._now(),
         }
 
+    async def _append_messages(
+        self,
+        user_id: str,
+        conversation_id: str,
+        messages: list[dict[str, Any]],
+    ) -> None:
+        """메시지들을 저장소 읽기/쓰기 한 번으로 추가하고 메시지 수 캐시를 갱신."""
         async with self._lock:
             store = await self._load_store()
             convs = store.setdefault("conversations", {}).setdefault(user_id, {})
@@ -140,12 +220,74 @@ class UserService:
                 conversation_id,
                 {"conversation_id": conversation_id, "created_at": self._now(), "messages": []},
             )
-            convo.setdefault("messages", []).append(message)
+            convo.setdefault("messages", []).extend(messages)
             await self._write_store(store)
+            message_count = len(convo["messages"])
 
+        try:
+            await cache_manager.set(
+                _conv_count_cache_key(user_id, conversation_id),
+                str(message_count),
+                _CONV_COUNT_CACHE_TTL,
+            )
+        except RedisError as exc:
+            logger.warning("Conversation count cache update failed: %s", exc)
+
+    async def save_conversation_message(
+        self,
+        user_id: str,
+        conversation_id: str,
+        role: str,
+        content: str,
+        *,
+        intent: str | None = None,
+        entities: dict[str, Any] | None = None,
+        search_results: list[str] | None = None,
+        recommended_policies: list[str] | None = None,
+        confidence_score: float | None = None,
+        model_used: str | None = None,
+    ) -> bool:
+        """대화 메시지 저장"""
+        message = self._new_message(
+            role,
+            content,
+            intent=intent,
+            entities=entities,
+            search_results=search_results,
+            recommended_policies=recommended_policies,
+            confidence_score=confidence_score,
+            model_used=model_used,
+        )
+        await self._append_messages(user_id, conversation_id, [message])
         logger.info("대화 메시지 저장 성공: %s", message["message_id"])
         return True
 
+    async def save_conversation_turn(
+        self,
+        user_id: str,
+        conversation_id: str,
+        *,
+        user_content: str,
+        assistant_content: str,
+        entities: dict[str, Any] | None = None,
+        search_results: list[str] | None = None,
+        model_used: str | None = None,
+    ) -> bool:
+        """사용자 질문과 AI 응답 한 턴을 한 번의 저장소 쓰기로 저장"""
+        messages = [
+            self._new_message("user", user_content, entities=entities),
+            self._new_message(
+                "assistant",
+                assistant_content,
+                entities=entities,
+                search_results=search_results,
+                model_used=model_used,
+            ),
+        ]
+        await self._append_messages(user_id, conversation_id, messages)
+        logger.info("대화 턴 저장 성공: %s", conversation_id)
+        return True
+
     # ==================== 사용자 분석 ====================
 
     async def get_user_statistics(self, user_id: str) -> dict[str, Any]:
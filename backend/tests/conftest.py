@@ -0,0 +1,44 @@
+"""
+공용 테스트 fixture.
+
+pytest-asyncio 없이도 돌 수 있도록 비동기 코드는 각 테스트에서 asyncio.run으로 실행합니다.
+"""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from core.cache import AsyncMemoryCache, redis_manager
+
+
+class FakeClock:
+    """모듈의 time.monotonic을 대신하는 수동 시계."""
+
+    def __init__(self, monkeypatch: pytest.MonkeyPatch, start: float = 1000.0) -> None:
+        self._monkeypatch = monkeypatch
+        self.now = start
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+    def attach(self, module: object) -> None:
+        """모듈이 참조하는 time만 바꿔 이벤트 루프 시계에는 영향을 주지 않음."""
+        self._monkeypatch.setattr(module, "time", SimpleNamespace(monotonic=self.monotonic))
+
+
+@pytest.fixture
+def memory_redis(monkeypatch: pytest.MonkeyPatch) -> AsyncMemoryCache:
+    """Redis 대신 in-memory fallback을 사용 (실제 Redis 연결 시도 없이)."""
+    cache = AsyncMemoryCache()
+    monkeypatch.setattr(redis_manager, "_redis", cache)
+    return cache
+
+
+@pytest.fixture
+def fake_clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    return FakeClock(monkeypatch)
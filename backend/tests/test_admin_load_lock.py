@@ -0,0 +1,121 @@
+"""/admin/load-data 잠금과 /admin/status 테스트 (중복 실행 방지, 잠금 인수/해제)."""
+
+from __future__ import annotations
+
+import asyncio
+
+import orjson
+import pytest
+from fastapi import HTTPException
+
+from api.routers import admin
+from jobs import tasks
+from jobs.status import TASK_META_PREFIX
+
+
+class _FakeRAGService:
+    def clear_caches(self) -> None:
+        pass
+
+
+@pytest.fixture
+def dispatched(monkeypatch, memory_redis) -> list[str]:
+    job_ids: list[str] = []
+    monkeypatch.setattr(
+        admin.load_data_task,
+        "apply_async",
+        lambda *, kwargs, task_id: job_ids.append(task_id),
+    )
+    return job_ids
+
+
+def _load() -> object:
+    return admin.load_data(admin.DataLoadRequest(), rag_service=_FakeRAGService())
+
+
+async def _seed_lock(redis, job_id: str, status: str | None) -> None:
+    await redis.set(admin.LOAD_LOCK_KEY, job_id, ex=admin._LOAD_LOCK_TTL)
+    if status is not None:
+        await redis.set(f"{TASK_META_PREFIX}{job_id}", orjson.dumps({"status": status}).decode())
+
+
+def test_load_data_rejects_while_previous_job_runs(memory_redis, dispatched):
+    async def scenario() -> None:
+        await _seed_lock(memory_redis, "running", None)
+        await _load()
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(scenario())
+    assert exc_info.value.status_code == 409
+    assert dispatched == []
+
+
+def test_load_data_takes_over_finished_lock_once(monkeypatch, memory_redis, dispatched):
+    task_metas = admin._task_metas
+
+    async def interleaved_task_metas(redis, job_ids):
+        # 두 요청이 모두 이전 작업의 완료를 확인한 뒤에 잠금을 넘겨받도록 양보
+        metas = await task_metas(redis, job_ids)
+        await asyncio.sleep(0)
+        return metas
+
+    monkeypatch.setattr(admin, "_task_metas", interleaved_task_metas)
+
+    async def scenario() -> list:
+        await _seed_lock(memory_redis, "finished", "SUCCESS")
+        return await asyncio.gather(_load(), _load(), return_exceptions=True)
+
+    results = asyncio.run(scenario())
+    started = [result for result in results if not isinstance(result, Exception)]
+    rejected = [result for result in results if isinstance(result, HTTPException)]
+
+    assert len(started) == len(rejected) == 1
+    assert dispatched == [started[0].job_id]
+    assert asyncio.run(memory_redis.get(admin.LOAD_LOCK_KEY)) == started[0].job_id
+
+
+def test_load_data_releases_lock_when_dispatch_fails(monkeypatch, memory_redis):
+    def fail_dispatch(**_) -> None:
+        raise ConnectionError("broker down")
+
+    monkeypatch.setattr(admin.load_data_task, "apply_async", fail_dispatch)
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(_load())
+
+    assert exc_info.value.status_code == 503
+    assert asyncio.run(memory_redis.get(admin.LOAD_LOCK_KEY)) is None
+    assert asyncio.run(memory_redis.hgetall(admin._LOAD_STATUS_KEY)) == {}
+
+
+def test_worker_releases_only_its_own_lock(memory_redis):
+    async def scenario() -> list[str | None]:
+        await _seed_lock(memory_redis, "job-a", None)
+        await tasks._release_load_lock("job-b")
+        before = await memory_redis.get(admin.LOAD_LOCK_KEY)
+        await tasks._release_load_lock("job-a")
+        return [before, await memory_redis.get(admin.LOAD_LOCK_KEY)]
+
+    assert asyncio.run(scenario()) == ["job-a", None]
+
+
+def test_status_follows_lock_and_result(memory_redis, dispatched):
+    async def scenario() -> list[tuple[bool, object]]:
+        response = await _load()
+        statuses = [await admin.get_load_status()]  # 대기 중: 결과 메타 없음, 잠금 보유
+        await memory_redis.set(
+            f"{TASK_META_PREFIX}{response.job_id}",
+            orjson.dumps({"status": "SUCCESS", "result": {"documents_loaded": 3}}).decode(),
+        )
+        await tasks._release_load_lock(response.job_id)
+        statuses.append(await admin.get_load_status())
+        # result_expires가 지나 결과 메타가 사라져도 진행 중으로 보지 않음
+        await memory_redis.delete(f"{TASK_META_PREFIX}{response.job_id}")
+        statuses.append(await admin.get_load_status())
+        return [(status["is_loading"], status["last_stats"]) for status in statuses]
+
+    assert asyncio.run(scenario()) == [
+        (True, None),
+        (False, {"documents_loaded": 3}),
+        (False, None),
+    ]
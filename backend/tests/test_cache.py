@@ -0,0 +1,94 @@
+"""core.cache in-memory fallback TTL과 지식 베이스 세대 번호 테스트."""
+
+from __future__ import annotations
+
+import asyncio
+
+from core import cache as cache_module
+from core.cache import (
+    AsyncMemoryCache,
+    bump_knowledge_generation,
+    get_knowledge_generation,
+    replace_if_equal,
+)
+
+
+def test_memory_cache_setex_expires(fake_clock):
+    fake_clock.attach(cache_module)
+    cache = AsyncMemoryCache()
+
+    async def scenario() -> tuple[str | None, str | None]:
+        await cache.setex("key", 10, "value")
+        fake_clock.advance(9)
+        before = await cache.get("key")
+        fake_clock.advance(1)
+        return before, await cache.get("key")
+
+    assert asyncio.run(scenario()) == ("value", None)
+
+
+def test_memory_cache_set_nx_respects_ttl(fake_clock):
+    fake_clock.attach(cache_module)
+    cache = AsyncMemoryCache()
+
+    async def scenario() -> list[bool | None]:
+        results = [await cache.set("lock", "a", nx=True, ex=5)]
+        results.append(await cache.set("lock", "b", nx=True, ex=5))
+        fake_clock.advance(5)
+        results.append(await cache.set("lock", "c", nx=True, ex=5))
+        return results
+
+    assert asyncio.run(scenario()) == [True, None, True]
+
+
+def test_memory_cache_set_without_ttl_clears_previous_expiry(fake_clock):
+    fake_clock.attach(cache_module)
+    cache = AsyncMemoryCache()
+
+    async def scenario() -> str | None:
+        await cache.setex("key", 1, "old")
+        await cache.set("key", "new")
+        fake_clock.advance(10)
+        return await cache.get("key")
+
+    assert asyncio.run(scenario()) == "new"
+
+
+def test_memory_cache_expire_and_keys(fake_clock):
+    fake_clock.attach(cache_module)
+    cache = AsyncMemoryCache()
+
+    async def scenario() -> tuple[list[str], list[str]]:
+        await cache.set("resp:a", "1")
+        await cache.set("resp:b", "2")
+        await cache.set("other", "3")
+        await cache.expire("resp:a", 1)
+        before = sorted(await cache.keys("resp:*"))
+        fake_clock.advance(1)
+        return before, await cache.keys("resp:*")
+
+    assert asyncio.run(scenario()) == (["resp:a", "resp:b"], ["resp:b"])
+
+
+def test_knowledge_generation_bump(memory_redis):
+    async def scenario() -> list[int]:
+        return [
+            await get_knowledge_generation(),
+            await bump_knowledge_generation(),
+            await bump_knowledge_generation(),
+            await get_knowledge_generation(),
+        ]
+
+    assert asyncio.run(scenario()) == [0, 1, 2, 2]
+
+
+def test_replace_if_equal_only_swaps_expected_value():
+    cache = AsyncMemoryCache()
+
+    async def scenario() -> tuple[bool, bool, str | None]:
+        await cache.set("lock", "old")
+        first = await replace_if_equal(cache, "lock", "old", "a", ex=60)
+        second = await replace_if_equal(cache, "lock", "old", "b", ex=60)
+        return first, second, await cache.get("lock")
+
+    assert asyncio.run(scenario()) == (True, False, "a")
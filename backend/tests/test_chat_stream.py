@@ -0,0 +1,49 @@
+"""/chat 스트리밍 SSE delta 묶음 크기 테스트."""
+
+from __future__ import annotations
+
+import asyncio
+
+import orjson
+import pytest
+
+from api.routers.chat import ChatRequest, _stream_response
+
+TOKENS = 12
+
+
+class _FakeRAGService:
+    async def process_query_stream(self, **_):
+        for index in range(TOKENS):
+            yield {"type": "delta", "text": str(index % 10)}
+        yield {"type": "done"}
+
+
+def _delta_sizes(**batching) -> list[int]:
+    payload = ChatRequest(message="q", user_id="u", **batching)
+    response = _stream_response(payload, _FakeRAGService(), "conv-1")
+
+    async def collect() -> list[bytes]:
+        return [chunk async for chunk in response.body_iterator]
+
+    events = [orjson.loads(chunk.removeprefix(b"data: ")) for chunk in asyncio.run(collect())]
+    return [len(event["text"]) for event in events if event["type"] == "delta"]
+
+
+@pytest.mark.parametrize(
+    ("growth", "expected"),
+    [
+        (1.0, [2] * 6),
+        (1.5, [2, 3, 5, 2]),
+        (3.0, [2, 6, 4]),
+    ],
+)
+def test_delta_batches_grow_by_factor(growth, expected):
+    sizes = _delta_sizes(min_batch_size=2, max_batch_size=50, batch_size_growth_factor=growth)
+    assert sizes == expected
+    assert sum(sizes) == TOKENS
+
+
+def test_delta_batches_capped_at_max():
+    sizes = _delta_sizes(min_batch_size=1, max_batch_size=4, batch_size_growth_factor=10.0)
+    assert sizes == [1, 4, 4, 3]
@@ -0,0 +1,50 @@
+"""/admin/clear-data 후처리 디렉토리 삭제 경로 검증 테스트."""
+
+from __future__ import annotations
+
+import pytest
+
+from core.config import settings
+from jobs.tasks import DELETED_DIR_MARKER, cleanup_deleted_dir, remove_deleted_dir
+
+
+@pytest.fixture
+def working_dir(tmp_path, monkeypatch):
+    root = tmp_path / "lightrag"
+    root.mkdir()
+    monkeypatch.setattr(settings, "LIGHTRAG_WORKING_DIR", str(root))
+    return root
+
+
+def test_removes_renamed_workspace(working_dir):
+    trash = working_dir / f"default{DELETED_DIR_MARKER}abc"
+    (trash / "graph").mkdir(parents=True)
+
+    assert cleanup_deleted_dir(str(trash)) == {"status": "success", "path": str(trash)}
+    assert not trash.exists()
+
+
+@pytest.mark.parametrize(
+    "relative",
+    [
+        "default",  # 표식 없는 현재 작업 디렉토리
+        f"nested/default{DELETED_DIR_MARKER}abc",  # 직속 하위가 아님
+        f"default{DELETED_DIR_MARKER}abc/../default",  # 정규화하면 표식이 사라짐
+    ],
+)
+def test_rejects_paths_outside_trash(working_dir, relative):
+    target = working_dir / relative
+    target.mkdir(parents=True, exist_ok=True)
+
+    assert remove_deleted_dir(target) is False
+    assert target.exists()
+
+
+def test_rejects_symlink_escaping_working_dir(working_dir, tmp_path):
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    link = working_dir / f"default{DELETED_DIR_MARKER}abc"
+    link.symlink_to(outside, target_is_directory=True)
+
+    assert cleanup_deleted_dir(str(link))["status"] == "rejected"
+    assert outside.exists()
@@ -0,0 +1,108 @@
+"""대화 이력 커서 페이징 테스트 (UserService와 /chat/history)."""
+
+from __future__ import annotations
+
+import asyncio
+
+import orjson
+import pytest
+
+from api.routers.chat import get_conversation_history
+from core.config import settings
+from services.user_service import UserService
+
+USER_ID = "user-1"
+CONVERSATION_ID = "conv-1"
+
+
+@pytest.fixture
+def user_service(tmp_path, monkeypatch, memory_redis) -> UserService:
+    monkeypatch.setattr(settings, "LIGHTRAG_WORKING_DIR", str(tmp_path))
+    service = UserService()
+
+    async def seed() -> None:
+        for index in range(5):
+            await service.save_conversation_message(
+                USER_ID, CONVERSATION_ID, "user", f"message {index}"
+            )
+
+    asyncio.run(seed())
+    return service
+
+
+def _contents(messages: list[dict]) -> list[str]:
+    return [message["content"] for message in messages]
+
+
+def test_history_returns_latest_messages_in_order(user_service):
+    messages = asyncio.run(user_service.get_conversation_history(USER_ID, CONVERSATION_ID, limit=2))
+    assert _contents(messages) == ["message 3", "message 4"]
+
+
+def test_history_before_cursor_returns_previous_page(user_service):
+    async def scenario() -> tuple[list[dict], list[dict]]:
+        latest = await user_service.get_conversation_history(USER_ID, CONVERSATION_ID, limit=2)
+        previous = await user_service.get_conversation_history(
+            USER_ID, CONVERSATION_ID, limit=2, before=latest[0]["message_id"]
+        )
+        first = await user_service.get_conversation_history(
+            USER_ID, CONVERSATION_ID, limit=2, before=previous[0]["message_id"]
+        )
+        return previous, first
+
+    previous, first = asyncio.run(scenario())
+    assert _contents(previous) == ["message 1", "message 2"]
+    assert _contents(first) == ["message 0"]
+
+
+def test_history_cursor_is_stable_when_new_messages_arrive(user_service):
+    async def scenario() -> list[dict]:
+        latest = await user_service.get_conversation_history(USER_ID, CONVERSATION_ID, limit=2)
+        await user_service.save_conversation_message(USER_ID, CONVERSATION_ID, "user", "new")
+        return await user_service.get_conversation_history(
+            USER_ID, CONVERSATION_ID, limit=2, before=latest[0]["message_id"]
+        )
+
+    assert _contents(asyncio.run(scenario())) == ["message 1", "message 2"]
+
+
+def test_history_unknown_cursor_returns_empty_page(user_service):
+    messages = asyncio.run(
+        user_service.get_conversation_history(USER_ID, CONVERSATION_ID, limit=2, before="missing")
+    )
+    assert messages == []
+
+
+def _call_history_endpoint(user_service: UserService, **params) -> dict:
+    response = asyncio.run(
+        get_conversation_history(
+            CONVERSATION_ID,
+            user_service=user_service,
+            user_id=USER_ID,
+            limit=params.get("limit", 20),
+            before=params.get("before"),
+            include_total=params.get("include_total", False),
+        )
+    )
+    return orjson.loads(response.body)
+
+
+def test_history_endpoint_pages_with_next_cursor(user_service):
+    page = _call_history_endpoint(user_service, limit=2, include_total=True)
+    assert _contents(page["messages"]) == ["message 3", "message 4"]
+    assert page["next_cursor"] == page["messages"][0]["message_id"]
+    assert page["total_count"] == 5
+
+    seen = _contents(page["messages"])
+    while page["next_cursor"] is not None:
+        page = _call_history_endpoint(user_service, limit=2, before=page["next_cursor"])
+        seen = _contents(page["messages"]) + seen
+
+    assert seen == [f"message {index}" for index in range(5)]
+    assert page["total_count"] is None
+
+
+def test_history_endpoint_last_page_has_no_cursor(user_service):
+    page = _call_history_endpoint(user_service, limit=5)
+    assert len(page["messages"]) == 5
+    assert page["next_cursor"] is None
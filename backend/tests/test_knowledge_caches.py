@@ -0,0 +1,78 @@
+"""지식 베이스 기반 캐시 테스트 (세대 확인 주기, 해시 임베딩 fallback)."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from core.cache import KNOWLEDGE_GENERATION_KEY
+from services import rag_service
+from services.ai_service import AIService
+from services.rag_service import RAGService
+
+
+class _FakeLightRAGService:
+    def __init__(self) -> None:
+        self.queries = 0
+
+    async def query(self, query: str, **kwargs) -> dict[str, str]:
+        self.queries += 1
+        return {"answer": f"context for {query}", "mode": "local"}
+
+
+def _make_rag_service() -> tuple[RAGService, _FakeLightRAGService]:
+    lightrag = _FakeLightRAGService()
+    service = RAGService(ai_service=AIService(), user_service=None, lightrag_service=lightrag)
+    return service, lightrag
+
+
+def test_generation_is_read_at_most_once_per_interval(memory_redis, fake_clock, monkeypatch):
+    fake_clock.attach(rag_service)
+    service, _ = _make_rag_service()
+    reads = 0
+    original_get = memory_redis.get
+
+    async def counting_get(key: str) -> str | None:
+        nonlocal reads
+        if key == KNOWLEDGE_GENERATION_KEY:
+            reads += 1
+        return await original_get(key)
+
+    monkeypatch.setattr(memory_redis, "get", counting_get)
+
+    async def scenario() -> None:
+        for _ in range(5):
+            await service._sync_cache_generation()
+        assert reads == 1
+
+        await memory_redis.set(KNOWLEDGE_GENERATION_KEY, "3")
+        fake_clock.advance(service._generation_check_interval - 0.1)
+        await service._sync_cache_generation()
+        assert service.ai_service.cache_generation == 0
+
+        fake_clock.advance(0.2)
+        await service._sync_cache_generation()
+        assert reads == 2
+        assert service.ai_service.cache_generation == 3
+
+    asyncio.run(scenario())
+
+
+def test_hash_embeddings_skip_semantic_cache_and_warn_once(caplog):
+    service, lightrag = _make_rag_service()
+    assert not service.ai_service.uses_real_embeddings
+
+    async def scenario() -> None:
+        for _ in range(3):
+            knowledge = await service._query_lightrag("강남 아파트 매매")
+            assert "cached" not in knowledge
+        assert lightrag.queries == 3
+
+        with caplog.at_level(logging.WARNING, logger="services.ai_service"):
+            await service.ai_service.generate_embeddings(["a"])
+            await service.ai_service.generate_embeddings(["b"])
+        assert await service.ai_service._answer_cache_key({"user_query": "강남"}) is None
+
+    asyncio.run(scenario())
+    warnings = [r for r in caplog.records if "hash-based embeddings" in r.getMessage()]
+    assert len(warnings) == 1
@@ -0,0 +1,141 @@
+"""core.llm_cache 캐시 적중/교체/TTL 테스트."""
+
+from __future__ import annotations
+
+import numpy as np
+
+from core import llm_cache
+from core.llm_cache import CentroidCache, LRUCache, SemanticCache
+
+DIM = 8
+
+
+def _unit(index: int) -> np.ndarray:
+    vector = np.zeros(DIM, dtype=np.float32)
+    vector[index] = 1.0
+    return vector
+
+
+# ==================== LRUCache ====================
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # a가 최근 사용으로 이동
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert len(cache) == 2
+
+
+def test_lru_clear():
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.clear()
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+# ==================== SemanticCache ====================
+
+
+def test_semantic_cache_hits_similar_vectors_only():
+    cache = SemanticCache(DIM, threshold=0.9, max_entries=4)
+    cache.store(_unit(0), "first")
+
+    near = _unit(0) + 0.1 * _unit(1)
+    assert cache.lookup(near) == "first"
+    assert cache.lookup(_unit(1)) is None
+
+
+def test_semantic_cache_ignores_wrong_dimension_and_zero_vectors():
+    cache = SemanticCache(DIM, max_entries=4)
+    cache.store(np.ones(DIM + 1), "wrong-dim")
+    cache.store(np.zeros(DIM), "zero")
+    assert len(cache) == 0
+
+
+def test_semantic_cache_overwrites_oldest_when_full():
+    cache = SemanticCache(DIM, threshold=0.99, max_entries=2)
+    cache.store(_unit(0), "a")
+    cache.store(_unit(1), "b")
+    cache.store(_unit(2), "c")
+
+    assert len(cache) == 2
+    assert cache.lookup(_unit(0)) is None
+    assert cache.lookup(_unit(1)) == "b"
+    assert cache.lookup(_unit(2)) == "c"
+
+
+def test_semantic_cache_skips_expired_entries(fake_clock):
+    fake_clock.attach(llm_cache)
+    cache = SemanticCache(DIM, max_entries=4, ttl=10)
+    cache.store(_unit(0), "a")
+
+    fake_clock.advance(9)
+    assert cache.lookup(_unit(0)) == "a"
+    fake_clock.advance(2)
+    assert cache.lookup(_unit(0)) is None
+
+
+def test_semantic_cache_clear():
+    cache = SemanticCache(DIM, max_entries=4)
+    cache.store(_unit(0), "a")
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.lookup(_unit(0)) is None
+
+
+# ==================== CentroidCache ====================
+
+
+def test_centroid_cache_hit_moves_centroid_towards_query():
+    cache = CentroidCache(DIM, threshold=0.9, max_clusters=4)
+    cache.store(_unit(0), "answer")
+
+    query = _unit(0) + 0.2 * _unit(1)
+    assert cache.lookup(query) == "answer"
+    # 멤버 평균으로 갱신되어 두 번째 축 성분이 생김
+    assert cache._centroids[0][1] > 0
+
+
+def test_centroid_cache_replaces_least_hit_cluster_when_full():
+    cache = CentroidCache(DIM, threshold=0.99, max_clusters=2)
+    cache.store(_unit(0), "popular")
+    cache.store(_unit(1), "rare")
+    assert cache.lookup(_unit(0)) == "popular"
+
+    cache.store(_unit(2), "new")
+
+    assert cache.lookup(_unit(1)) is None
+    assert cache.lookup(_unit(0)) == "popular"
+    assert cache.lookup(_unit(2)) == "new"
+
+
+def test_centroid_cache_replaces_expired_cluster_first(fake_clock):
+    fake_clock.attach(llm_cache)
+    cache = CentroidCache(DIM, threshold=0.99, max_clusters=2, ttl=10)
+    cache.store(_unit(0), "old")
+    assert cache.lookup(_unit(0)) == "old"  # 적중 수는 "old"가 더 많음
+    fake_clock.advance(5)
+    cache.store(_unit(1), "fresh")
+
+    fake_clock.advance(6)  # "old"만 만료
+    assert cache.lookup(_unit(0)) is None
+    cache.store(_unit(2), "new")
+
+    assert cache.lookup(_unit(1)) == "fresh"
+    assert cache.lookup(_unit(2)) == "new"
+
+
+def test_centroid_cache_clear():
+    cache = CentroidCache(DIM, max_clusters=2)
+    cache.store(_unit(0), "a")
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.lookup(_unit(0)) is None
@@ -0,0 +1,192 @@
+"""ASGI 미들웨어 테스트 (ETag/304 응답 캐시, CORS preflight)."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from api.middleware import caching
+from api.middleware.caching import CacheMiddleware, _etag_matches
+from api.middleware.cors import CORSMiddleware
+from core.cache import bump_knowledge_generation
+
+ETAG = '"abc123"'
+
+
+async def _json_app(scope, receive, send) -> None:
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"application/json")],
+        }
+    )
+    await send({"type": "http.response.body", "body": b'{"ok": true}'})
+
+
+def _request(app, path: str, *, method: str = "GET", headers=()) -> tuple[int, dict, bytes]:
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "query_string": b"",
+        "headers": [(k.encode("latin-1"), v.encode("latin-1")) for k, v in headers],
+    }
+    messages: list[dict] = []
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict) -> None:
+        messages.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    start = messages[0]
+    response_headers = {k.decode("latin-1"): v.decode("latin-1") for k, v in start["headers"]}
+    body = b"".join(m.get("body", b"") for m in messages[1:])
+    return start["status"], response_headers, body
+
+
+# ==================== ETag ====================
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        (None, False),
+        ("", False),
+        (ETAG, True),
+        (f"W/{ETAG}", True),
+        (f'"other", {ETAG}', True),
+        (f'"other",W/{ETAG}', True),
+        ("*", True),
+        ('"other"', False),
+    ],
+)
+def test_etag_matches(header, expected):
+    assert _etag_matches(header, ETAG) is expected
+
+
+def test_cache_middleware_serves_hit_without_calling_app(memory_redis):
+    calls: list[str] = []
+
+    async def app(scope, receive, send) -> None:
+        calls.append(scope["path"])
+        await _json_app(scope, receive, send)
+
+    cached = CacheMiddleware(app, ttl=60, cache_paths=("/api/v1/policies",))
+
+    first = _request(cached, "/api/v1/policies/")
+    second = _request(cached, "/api/v1/policies/")
+
+    assert first[0] == second[0] == 200
+    assert first[2] == second[2] == b'{"ok": true}'
+    assert calls == ["/api/v1/policies/"]
+
+
+def test_cache_middleware_misses_after_knowledge_generation_bump(memory_redis, fake_clock):
+    fake_clock.attach(caching)
+    calls: list[str] = []
+
+    async def app(scope, receive, send) -> None:
+        calls.append(scope["path"])
+        await _json_app(scope, receive, send)
+
+    cached = CacheMiddleware(
+        app, ttl=60, cache_paths=("/api/v1/policies",), generation_check_interval=5.0
+    )
+
+    _request(cached, "/api/v1/policies/")
+    asyncio.run(bump_knowledge_generation())
+    _request(cached, "/api/v1/policies/")  # 확인 주기 안에서는 기존 세대 키를 그대로 사용
+    assert calls == ["/api/v1/policies/"]
+
+    fake_clock.advance(5.0)
+    _, headers, _ = _request(cached, "/api/v1/policies/")
+    assert "x-cache" not in headers
+    assert calls == ["/api/v1/policies/", "/api/v1/policies/"]
+
+
+def test_cache_middleware_returns_304_and_hit(memory_redis):
+    app = CacheMiddleware(_json_app, ttl=60, cache_paths=("/api/v1/policies",))
+
+    status, headers, body = _request(app, "/api/v1/policies/")
+    assert status == 200
+    assert body == b'{"ok": true}'
+    etag = headers["etag"]
+
+    status, headers, body = _request(app, "/api/v1/policies/")
+    assert status == 200
+    assert headers["x-cache"] == "HIT"
+
+    status, _, body = _request(
+        app, "/api/v1/policies/", headers=[("if-none-match", f'"stale", W/{etag}')]
+    )
+    assert status == 304
+    assert body == b""
+
+
+def test_cache_middleware_skips_paths_outside_allowlist(memory_redis):
+    app = CacheMiddleware(_json_app, ttl=60, cache_paths=("/api/v1/policies",))
+
+    _request(app, "/api/v1/chat/history/1")
+    status, headers, _ = _request(app, "/api/v1/chat/history/1")
+
+    assert status == 200
+    assert "etag" not in headers
+    assert "x-cache" not in headers
+
+
+# ==================== CORS ====================
+
+
+def _cors_app() -> CORSMiddleware:
+    return CORSMiddleware(
+        _json_app,
+        allow_origins=["https://app.example.com"],
+        allow_methods=["GET", "POST"],
+        allow_headers=["Authorization"],
+        allow_credentials=True,
+    )
+
+
+def test_cors_preflight_allowed():
+    status, headers, body = _request(
+        _cors_app(),
+        "/api/v1/chat/send",
+        method="OPTIONS",
+        headers=[
+            ("origin", "https://app.example.com"),
+            ("access-control-request-method", "POST"),
+            ("access-control-request-headers", "authorization, content-type"),
+        ],
+    )
+    assert status == 200
+    assert body == b"OK"
+    assert headers["access-control-allow-origin"] == "https://app.example.com"
+    assert headers["access-control-allow-credentials"] == "true"
+    assert "POST" in headers["access-control-allow-methods"]
+
+
+def test_cors_preflight_rejects_unknown_origin_and_method():
+    status, _, body = _request(
+        _cors_app(),
+        "/api/v1/chat/send",
+        method="OPTIONS",
+        headers=[
+            ("origin", "https://evil.example.com"),
+            ("access-control-request-method", "DELETE"),
+        ],
+    )
+    assert status == 400
+    assert body == b"Disallowed CORS origin, method"
+
+
+def test_cors_simple_request_adds_origin_headers():
+    status, headers, _ = _request(
+        _cors_app(), "/api/v1/policies/", headers=[("origin", "https://app.example.com")]
+    )
+    assert status == 200
+    assert headers["access-control-allow-origin"] == "https://app.example.com"
+    assert headers["vary"] == "Origin"
@@ -0,0 +1,20 @@
+"""FastAPI 라우트 등록 테스트."""
+
+from __future__ import annotations
+
+from collections import Counter
+
+from fastapi.routing import APIRoute
+
+from api.main import app
+
+
+def test_route_paths_are_unique():
+    routes = Counter(
+        (route.path, method)
+        for route in app.routes
+        if isinstance(route, APIRoute)
+        for method in route.methods
+    )
+    duplicates = [key for key, count in routes.items() if count > 1]
+    assert duplicates == []
@@ -0,0 +1,134 @@
+"""동시 호출 single-flight/결과 재사용 테스트 (AIService 초기화, 서울 도시데이터 조회)."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from services import seoul_city_data_service
+from services.ai_service import AIService
+from services.seoul_city_data_service import SeoulCityDataService
+
+# ==================== AIService.initialize ====================
+
+
+def test_ai_service_initialize_runs_once_for_concurrent_callers(monkeypatch):
+    service = AIService()
+    calls = 0
+
+    async def fake_initialize_bedrock() -> None:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)  # 다른 호출자가 끼어들 틈을 줌
+
+    monkeypatch.setattr(service, "_detect_provider", lambda: "bedrock")
+    monkeypatch.setattr(service, "_initialize_bedrock", fake_initialize_bedrock)
+
+    async def scenario() -> None:
+        await asyncio.gather(*(service.initialize() for _ in range(10)))
+        await service.initialize()
+
+    asyncio.run(scenario())
+    assert calls == 1
+    assert service.is_ready()
+
+
+# ==================== SeoulCityDataService._fetch_snapshot ====================
+
+_PAYLOAD = {
+    "citydata": {
+        "RESULT": {"CODE": "INFO-000"},
+        "row": [{"AREA_NM": "강남역", "AREA_CD": "POI014"}],
+    }
+}
+
+
+class _CountingTransport(httpx.AsyncBaseTransport):
+    """요청 수를 세고, 응답 전에 잠시 대기해 동시 호출이 겹치도록 하는 transport."""
+
+    def __init__(self, *, fail: bool = False) -> None:
+        self.requests = 0
+        self.fail = fail
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        await asyncio.sleep(0.01)
+        if self.fail:
+            return httpx.Response(503, request=request)
+        return httpx.Response(200, json=_PAYLOAD, request=request)
+
+
+def _service(transport: _CountingTransport) -> SeoulCityDataService:
+    return SeoulCityDataService(http_client=httpx.AsyncClient(transport=transport))
+
+
+def test_city_snapshot_coalesces_concurrent_requests():
+    transport = _CountingTransport()
+    service = _service(transport)
+
+    async def scenario() -> list[dict]:
+        return await asyncio.gather(
+            service.get_city_snapshot(location_name="강남역"),
+            service.get_population_snapshot(location_name="강남역"),
+            service.get_commercial_snapshot(location_name="강남역"),
+        )
+
+    city, population, commercial = asyncio.run(scenario())
+    assert transport.requests == 1
+    assert city["area"] == population["area"] == commercial["area"] == "강남역"
+
+
+def test_city_snapshot_reused_until_ttl(fake_clock):
+    fake_clock.attach(seoul_city_data_service)
+    transport = _CountingTransport()
+    service = _service(transport)
+
+    async def fetch() -> dict:
+        return await service.get_city_snapshot(location_name="강남역")
+
+    async def scenario() -> list[int]:
+        counts = []
+        await fetch()
+        counts.append(transport.requests)
+        fake_clock.advance(SeoulCityDataService.SNAPSHOT_TTL - 1)
+        await fetch()
+        counts.append(transport.requests)
+        fake_clock.advance(1)
+        await fetch()
+        counts.append(transport.requests)
+        return counts
+
+    assert asyncio.run(scenario()) == [1, 1, 2]
+
+
+def test_city_snapshot_failure_is_not_cached():
+    transport = _CountingTransport(fail=True)
+    service = _service(transport)
+
+    async def scenario() -> None:
+        for _ in range(2):
+            with pytest.raises(httpx.HTTPStatusError):
+                await service.get_city_snapshot(location_name="강남역")
+
+    asyncio.run(scenario())
+    assert transport.requests == 2
+    assert service._inflight == {}
+    assert service._recent == {}
+
+
+def test_city_snapshot_survives_cancelled_caller():
+    transport = _CountingTransport()
+    service = _service(transport)
+
+    async def scenario() -> dict:
+        first = asyncio.create_task(service.get_city_snapshot(location_name="강남역"))
+        second = asyncio.create_task(service.get_city_snapshot(location_name="강남역"))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    result = asyncio.run(scenario())
+    assert result["area"] == "강남역"
+    assert transport.requests == 1
@@ -0,0 +1,72 @@
+"""Celery 워커 프로세스 공유 서비스 재사용/재생성 테스트."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from core.cache import bump_knowledge_generation
+from jobs import tasks
+
+
+class _FakeAIService:
+    async def initialize(self) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+
+class _FakeLightRAGService:
+    def __init__(self, ai_service: _FakeAIService) -> None:
+        self.ai_service = ai_service
+        self.finalized = False
+
+    async def initialize(self) -> None:
+        pass
+
+    async def finalize(self) -> None:
+        self.finalized = True
+
+
+@pytest.fixture
+def worker_state(monkeypatch, memory_redis) -> tasks._WorkerState:
+    state = tasks._WorkerState()
+    monkeypatch.setattr(tasks, "_worker_state", state)
+    monkeypatch.setattr(tasks, "AIService", _FakeAIService)
+    monkeypatch.setattr(tasks, "LightRAGService", _FakeLightRAGService)
+    return state
+
+
+def test_worker_services_reused_within_generation(worker_state):
+    async def scenario() -> tuple:
+        return await tasks._get_worker_services(), await tasks._get_worker_services()
+
+    first, second = asyncio.run(scenario())
+    assert first is second
+
+
+def test_worker_rebuilds_lightrag_when_generation_changes(worker_state):
+    async def scenario() -> tuple:
+        first = await tasks._get_worker_services()
+        await bump_knowledge_generation()  # /admin/clear-data
+        return first, await tasks._get_worker_services()
+
+    (ai_before, rag_before), (ai_after, rag_after) = asyncio.run(scenario())
+    assert ai_after is ai_before
+    assert rag_after is not rag_before
+    # 옛 인스턴스를 finalize하면 이전 데이터를 새 작업 디렉터리에 다시 씀
+    assert rag_before.finalized is False
+    assert worker_state.generation == 1
+
+
+def test_worker_shutdown_skips_finalize_after_data_reset(worker_state):
+    async def scenario() -> _FakeLightRAGService:
+        _, lightrag_service = await tasks._get_worker_services()
+        await bump_knowledge_generation()
+        await tasks._close_worker_services()
+        return lightrag_service
+
+    assert asyncio.run(scenario()).finalized is False
+    assert worker_state.services is None
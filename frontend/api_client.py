@@ -40,7 +40,8 @@ class ConversationHistoryResponse(BaseModel):
 
     conversation_id: str
     messages: list[dict[str, Any]]
-    total_count: int
+    total_count: int | None = None
+    next_cursor: str | None = None
 
 
 class UserContextResponse(BaseModel):